@@ -4,6 +4,7 @@ from django.conf import settings
 from datetime import datetime, timedelta
 from typing import Optional, List
 import json
+import uuid
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from authentication.models import UserRole
@@ -103,16 +104,16 @@ def verify_refresh_token(refresh_token: str) -> Optional[dict]:
         return None
 
 
-def create_device_access_token(
+def build_device_access_token_claims(
     device_id: str,
     organization_id: str,
     device_type: str,
     elastic_indices: List[dict],
     os_type: Optional[str]=None,
     os_version: Optional[str]=None,
-) -> str:
+) -> dict:
     """
-    Generate a non-expiring JWT access token for a device.
+    Build the payload of a device access token.
 
     The token payload contains:
     - sub: device ID
@@ -132,5 +133,30 @@ def create_device_access_token(
         payload["os_type"] = os_type
     if os_version:
         payload["os_version"] = os_version
+    return payload
+
 
+def create_device_access_token(
+    device_id: str,
+    organization_id: str,
+    device_type: str,
+    elastic_indices: List[dict],
+    os_type: Optional[str]=None,
+    os_version: Optional[str]=None,
+) -> str:
+    """
+    Generate a non-expiring JWT access token for a device.
+    See ``build_device_access_token_claims`` for the payload. Every token also carries
+    a random ``jti``, so a token issued again for the same claims is never one that
+    was revoked before.
+    """
+    payload = build_device_access_token_claims(
+        device_id=device_id,
+        organization_id=organization_id,
+        device_type=device_type,
+        elastic_indices=elastic_indices,
+        os_type=os_type,
+        os_version=os_version,
+    )
+    payload["jti"] = uuid.uuid4().hex
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
\ No newline at end of file
@@ -1,3 +1,5 @@
 from django.contrib import admin
+from github.models import GithubIssueStats
 
 # Register your models here.
+admin.site.register(GithubIssueStats)
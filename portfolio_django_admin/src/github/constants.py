@@ -0,0 +1,33 @@
+from enum import Enum
+
+
+class GithubQuery(str, Enum):
+    ISSUE_COUNTS = "issue_counts"
+
+
+class GithubWebhookEvent(str, Enum):
+    PING = "ping"
+    ISSUES = "issues"
+    REPOSITORY = "repository"
+
+
+class GithubIssueAction(str, Enum):
+    OPENED = "opened"
+    CLOSED = "closed"
+    REOPENED = "reopened"
+    DELETED = "deleted"
+    TRANSFERRED = "transferred"
+
+
+# Queries whose cached results are affected by each webhook event
+WEBHOOK_EVENT_QUERIES = {
+    GithubWebhookEvent.ISSUES.value: [GithubQuery.ISSUE_COUNTS.value],
+    GithubWebhookEvent.REPOSITORY.value: [GithubQuery.ISSUE_COUNTS.value],
+}
+
+WEBHOOK_SIGNATURE_HEADER = "HTTP_X_HUB_SIGNATURE_256"
+WEBHOOK_EVENT_HEADER = "HTTP_X_GITHUB_EVENT"
+WEBHOOK_DELIVERY_HEADER = "HTTP_X_GITHUB_DELIVERY"
+
+WEBHOOK_DELIVERY_CACHE_KEY_PREFIX = "github_webhook_delivery"
+WEBHOOK_DELIVERY_CACHE_TIMEOUT = 86400  # 24 hours, Github does not redeliver older events automatically
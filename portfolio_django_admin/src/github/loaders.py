@@ -0,0 +1,23 @@
+from typing import List, Optional
+from strawberry.dataloader import DataLoader
+from github.services.github_service import GithubRestApiService
+
+
+class GithubLoaders:
+    """
+    Per-request DataLoaders for Github lookups.
+    Keys requested by resolvers within the same request are de-duplicated and
+    resolved with a single call to the Github API.
+    """
+    def __init__(self):
+        self.users = DataLoader(load_fn=self.__load_users)
+
+
+    async def __load_users(self, keys:List[str])->List[Optional[dict]]:
+        """
+        Loads the users with the given logins.
+        @param keys: List[str] - The logins of the users.
+        """
+        async with GithubRestApiService() as service:
+            users = await service.get_users(keys)
+        return [users.get(key) for key in keys]
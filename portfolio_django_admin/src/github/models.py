@@ -7,4 +7,23 @@ class GithubRepository:
         self.title = title
         self.description = description
         self.icon = icon
-        self.url = url
\ No newline at end of file
+        self.url = url
+
+
+class GithubIssueStats(models.Model):
+    """
+    Issue counters of a repository, kept up to date by Github "issues" webhook events.
+    """
+    repository = models.CharField(max_length=255, unique=True)
+    all_count = models.IntegerField(default=0)
+    open_count = models.IntegerField(default=0)
+    closed_count = models.IntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'github_issue_stats'
+
+    def __str__(self):
+        return f"{self.repository} ({self.open_count} open / {self.closed_count} closed)"
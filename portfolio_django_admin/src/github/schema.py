@@ -1,6 +1,8 @@
 import github.services.github_service as github_service
 from github.services.caching_service import GQLCachingService
+from github.services.issue_stats_service import GithubIssueStatsService
 import github.types as github_types
+from github.constants import GithubQuery
 from github.models import GithubRepository
 from authentication.constants import RoleType
 from authentication.decorators import require_graphql_roles
@@ -17,32 +19,33 @@ class Query:
     @strawberry.field
     async def issue_counts(self, info:strawberry.Info)->typing.List[github_types.GithubIssueCount]:
         """
-        Retrieves the issues from the Github REST API.
+        Retrieves the issue counts of the repositories. The counters are kept up to date
+        by Github webhook events, so the Github API is only called to bootstrap them.
         """
         caching_service = GQLCachingService()
-        cache_prefix = "issue_counts"
-        if caching_service.cache_exists(prefix=cache_prefix, request=info.context.request):
-            result = json.loads(caching_service.retrieve(prefix=cache_prefix, request=info.context.request))
+        cache_prefix = GithubQuery.ISSUE_COUNTS.value
+        # Retrieved once, since a webhook may invalidate the entry between two lookups.
+        cached = caching_service.retrieve(prefix=cache_prefix, request=info.context.request)
+        if cached is not None:
+            result = json.loads(cached)
             if result:
                 return [github_types.GithubIssueCount.from_dict(data) for data in result]
 
-        async with github_service.GithubRestApiService() as service:
-            repositories:typing.List[GithubRepository] = service.get_all_repository_names()
-            issues = []
-            for repository in repositories:
-                result = await service.get_issue_count(repository)
-                if not result or type(result) is not dict:
-                    continue
-
-                issues.append(github_types.GithubIssueCount.from_dict(result))
-
-            if len(issues) > 0:
-                caching_service.store(
-                    prefix=cache_prefix,
-                    value=json.dumps([issue.to_dict() for issue in issues]),
-                    request=info.context.request
-                )
-            return issues
+        repositories:typing.List[GithubRepository] = github_service.GithubRestApiService().get_all_repository_names()
+        results = await GithubIssueStatsService().get_issue_counts(repositories)
+        issues = [github_types.GithubIssueCount.from_dict(result) for result in results]
+
+        if len(issues) > 0:
+            caching_service.store(
+                prefix=cache_prefix,
+                value=json.dumps([issue.to_dict() for issue in issues]),
+                request=info.context.request,
+                tags=[caching_service.build_tag(GQLCachingService.TAG_QUERY, cache_prefix)] + [
+                    caching_service.build_tag(GQLCachingService.TAG_REPOSITORY, repository.name)
+                    for repository in repositories
+                ]
+            )
+        return issues
         
 
 
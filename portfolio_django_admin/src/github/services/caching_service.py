@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from django.core.cache import cache, caches
 from django.http import HttpRequest
+import time
 
 class GQLCachingService:
     """
@@ -12,6 +13,10 @@ class GQLCachingService:
     VARY_CACHE_BY_IP = "ip"
     VARY_CACHE_BY_USER = "user"
 
+    GQL_CACHE_TAG_PREFIX = "gql_cache_tag__"
+    TAG_QUERY = "query"
+    TAG_REPOSITORY = "repository"
+
     def __init__(self):
         pass
 
@@ -59,6 +64,49 @@ class GQLCachingService:
         """
         return key + "_" + user
     
+    def __construct_tag_key_name(self, tag:str):
+        """
+        Construct the key name of the generation counter for a tag.
+        @param tag: str - The tag to construct the counter key name from.
+        """
+        return self.GQL_CACHE_TAG_PREFIX + tag
+    
+    # Tag generations
+    def __get_tag_generations(self, tags:List[str], initialize:bool=False)->Dict[str, int]:
+        """
+        Retrieve the current generation counter of each tag in a single round trip.
+        @param tags: List[str] - The tags to retrieve the generations for.
+        @param initialize: bool - Whether missing counters should be created.
+        """
+        if not tags:
+            return {}
+
+        key_names = {self.__construct_tag_key_name(tag): tag for tag in tags}
+        found = cache.get_many(list(key_names.keys()))
+        generations = {key_names[key]: value for key, value in found.items()}
+
+        if initialize:
+            for key, tag in key_names.items():
+                if tag in generations:
+                    continue
+                # Seed with a time based value so that a counter which was evicted
+                # never falls back to a generation an older entry was stored with.
+                cache.add(key, time.time_ns(), None)
+                generations[tag] = cache.get(key)
+        return generations
+    
+    def __is_fresh(self, entry:dict):
+        """
+        Check whether none of the tags of a cache entry has been invalidated since it was stored.
+        @param entry: dict - The cache entry to check.
+        """
+        tags = entry.get("tags") or {}
+        if not tags:
+            return True
+        
+        current = self.__get_tag_generations(list(tags.keys()))
+        return all(current.get(tag) == generation for tag, generation in tags.items())
+
     # Cache data extractor
     def __retrieve_user_agent(self, request:HttpRequest):
         """
@@ -87,11 +135,16 @@ class GQLCachingService:
     # Get
     def __get_cache(self, key: str):
         """
-        Get cache from Django cache.
+        Get cache from Django cache. Entries with an invalidated tag are treated as missing.
         @param key: str - The key to retrieve from cache.
         """
+        entry = cache.get(self.__construct_key_name(key))
+        if not isinstance(entry, dict):
+            return entry
         
-        return cache.get(self.__construct_key_name(key))
+        if not self.__is_fresh(entry):
+            return None
+        return entry.get("value")
     
     def __exists(self, key: str):
         """
@@ -102,14 +155,19 @@ class GQLCachingService:
     
 
     # Set
-    def __set_cache(self, key: str, value: str, expiration: int):
+    def __set_cache(self, key: str, value: str, expiration: int, tags: Optional[List[str]]=None):
         """
-        Set cache in Django cache.
+        Set cache in Django cache along with the current generation of each of its tags.
         @param key: str - The key to set in cache.
         @param value: str - The value to set in cache.
         @param expiration: int - The expiration time for the cache.
+        @param tags: List[str] - The tags to register the cache under.
         """
-        cache.set(self.__construct_key_name(key), value, expiration)
+        entry = {
+            "value": value,
+            "tags": self.__get_tag_generations(tags or [], initialize=True),
+        }
+        cache.set(self.__construct_key_name(key), entry, expiration)
 
 
     # Remove
@@ -174,7 +232,7 @@ class GQLCachingService:
         unique_key = self.get_unique_key(prefix, request, args, vary_on, prefix)
         return self.__get_cache(unique_key)
     
-    def store(self, prefix:str, value:str, request:HttpRequest, args:Optional[List[str]]=[], vary_on:List[str]=[], expiration:int=60*15):
+    def store(self, prefix:str, value:str, request:HttpRequest, args:Optional[List[str]]=[], vary_on:List[str]=[], expiration:int=60*15, tags:Optional[List[str]]=None):
         """
         A high level method to store cache.
         @param value: str - The value to store in cache.
@@ -183,12 +241,13 @@ class GQLCachingService:
         @param args: Optional[tuple] - The arguments to store the cache from.
         @param vary_on: List[str] - The list of values to vary the cache on.
         @param prefix: str - The prefix to add to the unique key.
+        @param tags: List[str] - The tags to register the cache under. See `build_tag`.
         """
         if not vary_on or not request:
-            return self.__set_cache(prefix, value, expiration)
+            return self.__set_cache(prefix, value, expiration, tags)
         
         unique_key = self.get_unique_key(prefix, request, args, vary_on, prefix)
-        return self.__set_cache(unique_key, value, expiration)
+        return self.__set_cache(unique_key, value, expiration, tags)
     
     def remove(self, prefix:str, request:HttpRequest, args:Optional[List[str]]=[], vary_on:List[str]=[]):
         """
@@ -204,7 +263,27 @@ class GQLCachingService:
         unique_key = self.get_unique_key(prefix, request, args, vary_on, prefix)
         return self.__remove_cache(unique_key)
     
+    # Tags
+    @classmethod
+    def build_tag(cls, kind:str, value:str)->str:
+        """
+        Build a tag name to register cache entries under.
+        @param kind: str - The kind of the tag, e.g. TAG_QUERY or TAG_REPOSITORY.
+        @param value: str - The value of the tag, e.g. the query or repository name.
+        """
+        return f"{kind}:{value}"
     
-
-
-        
\ No newline at end of file
+    def invalidate_tags(self, tags:List[str]):
+        """
+        A high level method to invalidate every cache entry registered under any of the tags.
+        Bumps the generation counter of each tag instead of scanning keys, so the
+        cost does not depend on the number of cached entries.
+        @param tags: List[str] - The tags to invalidate.
+        """
+        for tag in tags:
+            key = self.__construct_tag_key_name(tag)
+            try:
+                cache.incr(key)
+            except ValueError:
+                # The counter does not exist yet, so no entry was stored under the tag.
+                pass
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 import httpx
 import portfolio_django_admin.constants as constants
 import github.models as models
@@ -24,7 +24,7 @@ class GithubRestApiService:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.http_client:
-            self.http_client.aclose()
+            await self.http_client.aclose()
 
 
     def get_all_repository_names(self)->List[models.GithubRepository]:
@@ -89,10 +89,75 @@ class GithubRestApiService:
 
             
         return issue_info
-        
 
 
-    
+    async def get_issue_counts(self, repositories:List[models.GithubRepository])->Dict[str, dict]:
+        """
+        Retrieves the issue counts of several repositories in a single GraphQL request.
+        Returns the issue info keyed by repository name; repositories which could not be
+        resolved are omitted.
+        """
+        if not repositories:
+            return {}
 
+        variables = {"owner": self.github_owner}
+        fields = []
+        for index, repository in enumerate(repositories):
+            variables[f"name{index}"] = repository.name
+            fields.append(f"""  r{index}: repository(owner: $owner, name: $name{index}) {{
+    all:issues {{
+      totalCount
+    }}
+    closed:issues(states:CLOSED) {{
+      totalCount
+    }}
+    open:issues(states:OPEN) {{
+      totalCount
+    }}
+  }}""")
+        arguments = ", ".join(["$owner: String!"] + [f"$name{index}: String!" for index in range(len(repositories))])
+        query = f"query ({arguments}) {{\n" + "\n".join(fields) + "\n}"
+
+        response = await self.http_client.post(url=self.github_api_url, json={"query": query, "variables": variables})
+        data = response.json().get("data") or {}
+        issues = {}
+        for index, repository in enumerate(repositories):
+            result = data.get(f"r{index}")
+            if type(result) is not dict:
+                continue
+            issues[repository.name] = {
+                "all": result["all"]["totalCount"],
+                "closed": result["closed"]["totalCount"],
+                "open": result["open"]["totalCount"],
+                "repository": repository.name,
+                "title": repository.title,
+                "description": repository.description,
+                "icon": repository.icon,
+                "url": repository.url,
+            }
+        return issues
+
+
+    async def get_users(self, logins:List[str])->Dict[str, dict]:
+        """
+        Retrieves several users by login in a single GraphQL request.
+        Returns the user info keyed by login; logins which could not be resolved are omitted.
+        """
+        if not logins:
+            return {}
+
+        variables = {f"login{index}": login for index, login in enumerate(logins)}
+        fields = [
+            f"  u{index}: user(login: $login{index}) {{\n    id:databaseId\n    login\n    avatar_url:avatarUrl\n  }}"
+            for index in range(len(logins))
+        ]
+        arguments = ", ".join(f"$login{index}: String!" for index in range(len(logins)))
+        query = f"query ({arguments}) {{\n" + "\n".join(fields) + "\n}"
 
-    
\ No newline at end of file
+        response = await self.http_client.post(url=self.github_api_url, json={"query": query, "variables": variables})
+        data = response.json().get("data") or {}
+        return {
+            login: data[f"u{index}"]
+            for index, login in enumerate(logins)
+            if type(data.get(f"u{index}")) is dict
+        }
@@ -0,0 +1,115 @@
+from typing import Dict, List
+from django.db.models import F
+from django.utils import timezone
+import portfolio_django_admin.constants as constants
+import github.models as models
+from github.constants import GithubIssueAction
+from github.services.github_service import GithubRestApiService
+
+
+def get_issue_event_deltas(action:str, payload:dict)->Dict[str, int]:
+    """
+    Computes the change of each issue counter caused by an "issues" webhook event.
+    Actions that do not change the state of an issue (edited, labeled, ...) produce no change.
+    @param action: str - The action of the event.
+    @param payload: dict - The decoded event payload.
+    """
+    if action == GithubIssueAction.OPENED.value:
+        return {"all_count": 1, "open_count": 1}
+    if action == GithubIssueAction.CLOSED.value:
+        return {"open_count": -1, "closed_count": 1}
+    if action == GithubIssueAction.REOPENED.value:
+        return {"open_count": 1, "closed_count": -1}
+    if action in [GithubIssueAction.DELETED.value, GithubIssueAction.TRANSFERRED.value]:
+        # The issue leaves this repository in whatever state it was in.
+        issue = payload.get("issue") or {}
+        state_column = "closed_count" if issue.get("state") == "closed" else "open_count"
+        return {"all_count": -1, state_column: -1}
+    return {}
+
+
+class GithubIssueStatsService:
+    """
+    This service maintains the issue counters of the repositories from webhook events
+    and serves them without calling the Github API.
+    """
+
+    async def apply_issue_event(self, repository:str, action:str, payload:dict)->bool:
+        """
+        Applies an "issues" webhook event to the counters of a repository in a single UPDATE.
+        Repositories whose counters were not bootstrapped yet are skipped, they will be
+        loaded with accurate totals on the next read.
+        @param repository: str - The name of the repository.
+        @param action: str - The action of the event.
+        @param payload: dict - The decoded event payload.
+        """
+        deltas = get_issue_event_deltas(action, payload)
+        if not deltas:
+            return False
+
+        updated = await models.GithubIssueStats.objects.filter(repository=repository).aupdate(
+            updated_at=timezone.now(),
+            **{column: F(column) + delta for column, delta in deltas.items()}
+        )
+        return updated > 0
+
+
+    async def get_issue_counts(self, repositories:List[models.GithubRepository])->List[dict]:
+        """
+        Retrieves the issue counts of the repositories from the local counters.
+        Counters of a repository are fetched from the Github API only once, when they do not exist yet.
+        @param repositories: List[GithubRepository] - The repositories to retrieve the issue counts for.
+        """
+        stats = {
+            stat.repository: stat
+            async for stat in models.GithubIssueStats.objects.filter(
+                repository__in=[repository.name for repository in repositories]
+            )
+        }
+
+        missing = [repository for repository in repositories if repository.name not in stats]
+        if missing:
+            stats.update(await self.__bootstrap(missing))
+
+        issues = []
+        for repository in repositories:
+            stat = stats.get(repository.name)
+            if not stat:
+                continue
+            issues.append({
+                "repository": repository.name,
+                "all": stat.all_count,
+                "closed": stat.closed_count,
+                "open": stat.open_count,
+                "title": repository.title,
+                "description": repository.description,
+                "icon": repository.icon,
+                "url": repository.url,
+                "owner": constants.GITHUB_REPOSITORY_OWNER,
+            })
+        return issues
+
+
+    async def __bootstrap(self, repositories:List[models.GithubRepository])->Dict[str, models.GithubIssueStats]:
+        """
+        Loads the initial counters of the repositories from the Github API in a single request.
+        @param repositories: List[GithubRepository] - The repositories to load the counters for.
+        """
+        stats = {}
+        async with GithubRestApiService() as service:
+            results = await service.get_issue_counts(repositories)
+            for repository in repositories:
+                result = results.get(repository.name)
+                if not result:
+                    continue
+
+                stat, _ = await models.GithubIssueStats.objects.aupdate_or_create(
+                    repository=repository.name,
+                    defaults={
+                        "all_count": result.get("all", 0),
+                        "open_count": result.get("open", 0),
+                        "closed_count": result.get("closed", 0),
+                    }
+                )
+                stats[repository.name] = stat
+        return stats
@@ -0,0 +1,97 @@
+from typing import List, Optional
+from django.core.cache import cache
+import hashlib
+import hmac
+import portfolio_django_admin.constants as constants
+from github.constants import (
+    GithubWebhookEvent,
+    WEBHOOK_EVENT_QUERIES,
+    WEBHOOK_DELIVERY_CACHE_KEY_PREFIX,
+    WEBHOOK_DELIVERY_CACHE_TIMEOUT,
+)
+from github.services.caching_service import GQLCachingService
+from github.services.issue_stats_service import GithubIssueStatsService
+
+
+class GithubWebhookService:
+    """
+    This service verifies and processes events delivered by Github webhooks.
+    """
+    def __init__(self):
+        self.webhook_secret = constants.GITHUB_WEBHOOK_SECRET
+        self.caching_service = GQLCachingService()
+        self.issue_stats_service = GithubIssueStatsService()
+
+
+    def verify_signature(self, body:bytes, signature:Optional[str])->bool:
+        """
+        Verifies the X-Hub-Signature-256 header of a delivery against the shared secret.
+        @param body: bytes - The raw request body.
+        @param signature: str - The value of the signature header.
+        """
+        if not self.webhook_secret or not signature or not signature.startswith("sha256="):
+            return False
+
+        expected = hmac.new(self.webhook_secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest("sha256=" + expected, signature)
+
+
+    def get_invalidation_tags(self, event:str, payload:dict)->List[str]:
+        """
+        Retrieves the cache tags affected by a webhook event.
+        @param event: str - The name of the Github event.
+        @param payload: dict - The decoded event payload.
+        """
+        tags = [
+            self.caching_service.build_tag(GQLCachingService.TAG_QUERY, query)
+            for query in WEBHOOK_EVENT_QUERIES.get(event, [])
+        ]
+
+        repository = payload.get("repository") if isinstance(payload, dict) else None
+        if isinstance(repository, dict) and repository.get("name"):
+            tags.append(self.caching_service.build_tag(GQLCachingService.TAG_REPOSITORY, repository["name"]))
+        return tags
+
+
+    def claim_delivery(self, delivery_id:Optional[str])->bool:
+        """
+        Marks a delivery as processed. Returns False if it was already processed,
+        so that redelivered events are not counted twice.
+        @param delivery_id: str - The value of the X-GitHub-Delivery header.
+        """
+        if not delivery_id:
+            return True
+        return cache.add(f"{WEBHOOK_DELIVERY_CACHE_KEY_PREFIX}__{delivery_id}", 1, WEBHOOK_DELIVERY_CACHE_TIMEOUT)
+
+
+    def release_delivery(self, delivery_id:Optional[str])->None:
+        """
+        Forgets a claimed delivery whose processing failed, so that Github's redelivery is applied.
+        @param delivery_id: str - The value of the X-GitHub-Delivery header.
+        """
+        if delivery_id:
+            cache.delete(f"{WEBHOOK_DELIVERY_CACHE_KEY_PREFIX}__{delivery_id}")
+
+
+    async def handle_event(self, event:str, payload:dict, delivery_id:Optional[str]=None)->List[str]:
+        """
+        Updates the local issue counters from a webhook event and invalidates the cached data it affects.
+        Returns the invalidated tags.
+        @param event: str - The name of the Github event.
+        @param payload: dict - The decoded event payload.
+        @param delivery_id: str - The unique ID of the delivery.
+        """
+        if not self.claim_delivery(delivery_id):
+            return []
+
+        repository = payload.get("repository") if isinstance(payload, dict) else None
+        if event == GithubWebhookEvent.ISSUES.value and isinstance(repository, dict) and repository.get("name"):
+            try:
+                await self.issue_stats_service.apply_issue_event(repository["name"], payload.get("action", ""), payload)
+            except Exception:
+                self.release_delivery(delivery_id)
+                raise
+
+        tags = self.get_invalidation_tags(event, payload)
+        self.caching_service.invalidate_tags(tags)
+        return tags
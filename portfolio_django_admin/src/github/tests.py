@@ -1,3 +1,142 @@
-from django.test import TestCase
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from unittest.mock import AsyncMock, patch
 
-# Create your tests here.
+from github.schema import schema
+from github.services.caching_service import GQLCachingService
+from github.services.github_service import GithubRestApiService
+from github.services.issue_stats_service import GithubIssueStatsService, get_issue_event_deltas
+from github.services.webhook_service import GithubWebhookService
+from github.views import GithubGraphQLContext
+
+import hashlib
+import hmac
+import json
+
+# Trimmed "issues" webhook deliveries as recorded from Github
+ISSUE_OPENED_PAYLOAD = {
+    "action": "opened",
+    "issue": {"number": 42, "state": "open", "title": "Broken link on landing page"},
+    "repository": {"name": "ThePortfolioFrontend", "full_name": "zuhairmhtb/ThePortfolioFrontend"},
+}
+ISSUE_CLOSED_PAYLOAD = {
+    "action": "closed",
+    "issue": {"number": 42, "state": "closed", "title": "Broken link on landing page"},
+    "repository": {"name": "ThePortfolioFrontend", "full_name": "zuhairmhtb/ThePortfolioFrontend"},
+}
+ISSUE_DELETED_PAYLOAD = {
+    "action": "deleted",
+    "issue": {"number": 42, "state": "closed", "title": "Broken link on landing page"},
+    "repository": {"name": "ThePortfolioFrontend", "full_name": "zuhairmhtb/ThePortfolioFrontend"},
+}
+ISSUE_LABELED_PAYLOAD = {
+    "action": "labeled",
+    "issue": {"number": 42, "state": "open", "title": "Broken link on landing page"},
+    "label": {"name": "bug"},
+    "repository": {"name": "ThePortfolioFrontend", "full_name": "zuhairmhtb/ThePortfolioFrontend"},
+}
+
+
+class IssueEventDeltasTest(SimpleTestCase):
+
+    def test_recorded_payloads(self):
+        self.assertEqual(get_issue_event_deltas("opened", ISSUE_OPENED_PAYLOAD), {"all_count": 1, "open_count": 1})
+        self.assertEqual(get_issue_event_deltas("closed", ISSUE_CLOSED_PAYLOAD), {"open_count": -1, "closed_count": 1})
+        self.assertEqual(get_issue_event_deltas("deleted", ISSUE_DELETED_PAYLOAD), {"all_count": -1, "closed_count": -1})
+        self.assertEqual(get_issue_event_deltas("labeled", ISSUE_LABELED_PAYLOAD), {})
+
+    def test_open_then_close_keeps_totals_consistent(self):
+        counters = {"all_count": 0, "open_count": 0, "closed_count": 0}
+        for payload in [ISSUE_OPENED_PAYLOAD, ISSUE_CLOSED_PAYLOAD]:
+            for column, delta in get_issue_event_deltas(payload["action"], payload).items():
+                counters[column] += delta
+        self.assertEqual(counters, {"all_count": 1, "open_count": 0, "closed_count": 1})
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class WebhookSignatureTest(SimpleTestCase):
+
+    def setUp(self):
+        self.service = GithubWebhookService()
+        self.service.webhook_secret = "webhook-secret"
+        self.body = json.dumps(ISSUE_OPENED_PAYLOAD).encode("utf-8")
+
+    def test_valid_signature(self):
+        signature = "sha256=" + hmac.new(b"webhook-secret", self.body, hashlib.sha256).hexdigest()
+        self.assertTrue(self.service.verify_signature(self.body, signature))
+
+    def test_invalid_signature(self):
+        self.assertFalse(self.service.verify_signature(self.body, "sha256=" + "0" * 64))
+        self.assertFalse(self.service.verify_signature(self.body, None))
+
+    def test_redelivery_is_ignored(self):
+        self.assertTrue(self.service.claim_delivery("72d3162e-cc78-11e3-81ab-4c9367dc0958"))
+        self.assertFalse(self.service.claim_delivery("72d3162e-cc78-11e3-81ab-4c9367dc0958"))
+
+    def test_failed_delivery_is_applied_on_redelivery(self):
+        delivery_id = "9a8c1e2f-cc78-11e3-81ab-4c9367dc0958"
+        apply_issue_event = AsyncMock(side_effect=[RuntimeError("database is unavailable"), None])
+        with patch.object(self.service.issue_stats_service, "apply_issue_event", apply_issue_event):
+            with self.assertRaises(RuntimeError):
+                async_to_sync(self.service.handle_event)("issues", ISSUE_OPENED_PAYLOAD, delivery_id)
+            async_to_sync(self.service.handle_event)("issues", ISSUE_OPENED_PAYLOAD, delivery_id)
+        self.assertEqual(apply_issue_event.await_count, 2)
+        self.assertFalse(self.service.claim_delivery(delivery_id))
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class GQLCachingServiceTest(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.service = GQLCachingService()
+        self.query_tag = GQLCachingService.build_tag(GQLCachingService.TAG_QUERY, "issue_counts")
+        self.repository_tag = GQLCachingService.build_tag(GQLCachingService.TAG_REPOSITORY, "ThePortfolioFrontend")
+
+    def test_invalidated_tag_drops_the_entry(self):
+        self.service.store(prefix="issue_counts", value="[1]", request=None, tags=[self.query_tag, self.repository_tag])
+        self.service.invalidate_tags([GQLCachingService.build_tag(GQLCachingService.TAG_REPOSITORY, "OtherRepository")])
+        self.assertEqual(self.service.retrieve(prefix="issue_counts", request=None), "[1]")
+
+        self.service.invalidate_tags([self.repository_tag])
+        self.assertIsNone(self.service.retrieve(prefix="issue_counts", request=None))
+
+        self.service.store(prefix="issue_counts", value="[2]", request=None, tags=[self.query_tag, self.repository_tag])
+        self.assertEqual(self.service.retrieve(prefix="issue_counts", request=None), "[2]")
+
+    def test_entry_without_tags_is_kept(self):
+        self.service.store(prefix="issue_counts", value="[1]", request=None)
+        self.service.invalidate_tags([self.query_tag])
+        self.assertEqual(self.service.retrieve(prefix="issue_counts", request=None), "[1]")
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class GithubLoadersTest(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_nested_owner_resolutions_produce_one_upstream_call(self):
+        repositories = [
+            {"repository": f"repository-{index}", "all": 1, "open": 1, "closed": 0, "url": "", "owner": f"owner-{index % 3}"}
+            for index in range(10)
+        ]
+        get_users = AsyncMock(side_effect=lambda logins: {
+            login: {"id": index, "login": login, "avatar_url": ""} for index, login in enumerate(logins)
+        })
+
+        with patch.object(GithubIssueStatsService, "get_issue_counts", AsyncMock(return_value=repositories)), \
+                patch.object(GithubRestApiService, "get_users", get_users):
+            result = async_to_sync(schema.execute)(
+                "{ issueCounts { repository owner { login } } }",
+                context_value=GithubGraphQLContext(request=None, response=None),
+            )
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            [issue["owner"]["login"] for issue in result.data["issueCounts"]],
+            [repository["owner"] for repository in repositories],
+        )
+        get_users.assert_awaited_once()
+        self.assertCountEqual(get_users.await_args.args[0], ["owner-0", "owner-1", "owner-2"])
@@ -118,6 +118,16 @@ class GithubIssueCount:
     title:typing.Optional[str]
     description:typing.Optional[str]
     icon:typing.Optional[str]
+    owner_login:strawberry.Private[typing.Optional[str]] = None
+
+    @strawberry.field
+    async def owner(self, info:strawberry.Info)->typing.Optional[GithubUser]:
+        """
+        Resolves the owner of the repository through the per-request user loader.
+        """
+        if not self.owner_login:
+            return None
+        return GithubUser.from_dict(await info.context.loaders.users.load(self.owner_login))
 
     @staticmethod
     def from_dict(data:dict):
@@ -132,7 +142,8 @@ class GithubIssueCount:
             title=data.get("title", ""),
             description=data.get("description", ""),
             icon=data.get("icon", ""),
-            url=data.get("url", "")
+            url=data.get("url", ""),
+            owner_login=data.get("owner", "")
         )
     
     def to_dict(self)->dict:
@@ -144,5 +155,6 @@ class GithubIssueCount:
             "title": self.title,
             "description": self.description,
             "icon": self.icon,
-            "url": self.url
+            "url": self.url,
+            "owner": self.owner_login
         }
\ No newline at end of file
@@ -18,9 +18,10 @@ Including another URLconf
 from django.urls import path
 from django.views.decorators.csrf import csrf_exempt
 from .schema import schema
-from . views import CustomGraphQLView
+from . views import CustomGraphQLView, github_webhook
 
 
 urlpatterns = [
     path("graphql/v1", csrf_exempt(CustomGraphQLView.as_view(schema=schema)), name="graphql"),
+    path("webhook/v1", github_webhook, name="github_webhook"),
 ]
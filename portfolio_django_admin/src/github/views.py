@@ -1,10 +1,49 @@
+from strawberry.django.context import StrawberryDjangoContext
 from strawberry.django.views import AsyncGraphQLView
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from authentication.services.auth import decode_token
+from github.constants import WEBHOOK_DELIVERY_HEADER, WEBHOOK_EVENT_HEADER, WEBHOOK_SIGNATURE_HEADER
+from github.services.webhook_service import GithubWebhookService
+from github.loaders import GithubLoaders
+from dataclasses import dataclass, field
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GithubGraphQLContext(StrawberryDjangoContext):
+    loaders: GithubLoaders = field(default_factory=GithubLoaders)
+
 
 class CustomGraphQLView(AsyncGraphQLView):
     
     async def get_context(self, request:HttpRequest, response:HttpResponse):
-        context = await super().get_context(request, response)
-        return context
-        
\ No newline at end of file
+        # A new set of loaders per request, so batching never leaks data across requests
+        return GithubGraphQLContext(request=request, response=response, loaders=GithubLoaders())
+
+
+@csrf_exempt
+@require_POST
+async def github_webhook(request:HttpRequest)->HttpResponse:
+    """
+    Receives Github webhook deliveries, updates the local issue counters and
+    invalidates the cached data they affect.
+    """
+    service = GithubWebhookService()
+    if not service.verify_signature(request.body, request.META.get(WEBHOOK_SIGNATURE_HEADER)):
+        return JsonResponse({"detail": "Invalid signature"}, status=401)
+
+    event = request.META.get(WEBHOOK_EVENT_HEADER, "")
+    try:
+        payload = json.loads(request.body or b"{}")
+    except ValueError:
+        return JsonResponse({"detail": "Invalid payload"}, status=400)
+
+    tags = await service.handle_event(event, payload, request.META.get(WEBHOOK_DELIVERY_HEADER))
+    logger.info("Processed Github webhook event '%s', invalidated tags: %s", event, tags)
+    return JsonResponse({"event": event, "invalidated": tags}, status=200)
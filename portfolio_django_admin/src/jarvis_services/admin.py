@@ -1,3 +1,5 @@
+import codecs
+import hashlib
 
 from django import forms
 from django.contrib import admin, messages
@@ -5,9 +7,13 @@ from django.db import transaction
 from django.db.models import Max
 from django.shortcuts import render, redirect
 from django.urls import path, reverse
+from django.template.defaultfilters import filesizeformat
 from django.utils.html import format_html
 
+import portfolio_django_admin.constants as constants
+from .constants import SERVICE_UPLOAD_BATCH_BYTES
 from .models import Service, ServiceGroup, ServiceContent
+from .services import render_service_pages
 
 
 # ── Multi-file upload helpers ────────────────────────────────────────────────
@@ -61,23 +67,66 @@ class ServiceContentUploadForm(forms.Form):
             raise forms.ValidationError(
                 f"Only .md files are allowed. Invalid file(s): {', '.join(non_md)}"
             )
+        # Sizes come from the upload handler, so nothing is read to enforce the limits.
+        if len(files) > constants.SERVICE_UPLOAD_MAX_FILES:
+            raise forms.ValidationError(
+                f"At most {constants.SERVICE_UPLOAD_MAX_FILES} files can be uploaded at once."
+            )
+        too_large = [f.name for f in files if f.size > constants.SERVICE_UPLOAD_MAX_FILE_BYTES]
+        if too_large:
+            raise forms.ValidationError(
+                f"Files must be at most {filesizeformat(constants.SERVICE_UPLOAD_MAX_FILE_BYTES)}. "
+                f"Too large: {', '.join(too_large)}"
+            )
+        if sum(f.size for f in files) > constants.SERVICE_UPLOAD_MAX_TOTAL_BYTES:
+            raise forms.ValidationError(
+                f"The upload must be at most {filesizeformat(constants.SERVICE_UPLOAD_MAX_TOTAL_BYTES)} in total."
+            )
         return files
 
 
 # ── Internal helper ───────────────────────────────────────────────────────────
 
+def _read_upload(f) -> tuple[str, str]:
+    """Decode an uploaded file chunk by chunk as UTF-8 and hash it on the way."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    digest = hashlib.sha256()
+    parts = []
+    try:
+        for chunk in f.chunks():
+            digest.update(chunk)
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+    except UnicodeDecodeError:
+        raise forms.ValidationError(f'"{f.name}" is not valid UTF-8 text.')
+    # Valid UTF-8 re-encodes to the same bytes, so this equals ServiceContent.hash_content.
+    return "".join(parts), digest.hexdigest()
+
+
 def _bulk_create_contents(service: Service, files: list, start_seq: int) -> None:
-    """Bulk-create ServiceContent rows, reading each file as UTF-8 text."""
-    ServiceContent.objects.bulk_create(
-        [
+    """
+    Bulk-create ServiceContent rows, reading each file as UTF-8 text.
+    Rows are inserted every SERVICE_UPLOAD_BATCH_BYTES of content, so that only
+    one batch is held in memory.
+    """
+    contents = []
+    pending_bytes = 0
+    for i, f in enumerate(files):
+        text, content_hash = _read_upload(f)
+        contents.append(
             ServiceContent(
                 service=service,
                 sequence_number=int(f.name.split("_", 1)[0]) + start_seq if ("_" in f.name) and f.name.split("_")[0].isdigit() else start_seq + i,
-                content=f.read().decode("utf-8"),
+                content=text,
+                content_hash=content_hash,
             )
-            for i, f in enumerate(files)
-        ]
-    )
+        )
+        pending_bytes += f.size
+        if pending_bytes >= SERVICE_UPLOAD_BATCH_BYTES:
+            ServiceContent.objects.bulk_create(contents)
+            contents = []
+            pending_bytes = 0
+    ServiceContent.objects.bulk_create(contents)
 
 
 
@@ -156,6 +205,11 @@ class ServiceAdmin(admin.ModelAdmin):
                     try:
                         with transaction.atomic():
                             # ── Step 2: get or create Service ─────────────────
+                            # Locking the group serializes concurrent uploads to its
+                            # services, including the first upload that creates one,
+                            # so a service is created once and sequence numbers
+                            # cannot interleave.
+                            group = ServiceGroup.objects.select_for_update().get(pk=group.pk)
                             service, created = Service.objects.get_or_create(
                                 title=svc_title,
                                 group=group,
@@ -191,10 +245,11 @@ class ServiceAdmin(admin.ModelAdmin):
                                         f"{max_existing + num_files}).",
                                     )
                                 else:
-                                    # Fewer or equal files → delete all and replace
+                                    # Fewer or equal files → delete all and replace.
+                                    # Only IDs are loaded for the delete, not content.
                                     ServiceContent.objects.filter(
                                         service=service
-                                    ).delete()
+                                    ).only("id", "service_id").delete()
                                     _bulk_create_contents(service, files, start_seq=1)
                                     messages.success(
                                         request,
@@ -202,10 +257,16 @@ class ServiceAdmin(admin.ModelAdmin):
                                         f'"{svc_title}" with {num_files} new file(s).',
                                     )
 
+                            # Render the public page once the new content is committed.
+                            transaction.on_commit(lambda: render_service_pages([service.id]))
+
                         return redirect(
                             reverse("admin:jarvis_services_service_changelist")
                         )
 
+                    except forms.ValidationError as exc:
+                        # Raised while reading the files; nothing was written.
+                        form.add_error("content_files", exc)
                     except Exception as exc:
                         messages.error(request, f"Unexpected error: {exc}")
 
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class JarvisServicesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'jarvis_services'
+
+    def ready(self):
+        from jarvis_services import signals  # noqa: F401
@@ -0,0 +1,20 @@
+SERVICE_CATALOG_CACHE_KEY = "service_catalog__groups"
+SERVICE_PAGE_CACHE_KEY_PREFIX = "service_page"
+
+SERVICE_SEARCH_CONFIG = "english"
+SERVICE_SEARCH_TITLE_WEIGHT = 2.0
+SERVICE_SEARCH_INDEX_CHECK_SECONDS = 1.0
+DEFAULT_SERVICE_SEARCH_RESULTS = 20
+MAX_SERVICE_SEARCH_RESULTS = 50
+
+MARKDOWN_IMPORT_BATCH_SIZE = 500
+MARKDOWN_IMPORT_READ_WORKERS = 8
+SERVICE_UPLOAD_BATCH_BYTES = 4 * 1024 * 1024
+
+SERVICE_CATALOG_SNAPSHOT_FORMAT = "jarvis-service-catalog"
+SERVICE_CATALOG_SNAPSHOT_VERSION = 1
+SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE = 1000
+
+
+def build_service_page_cache_key(service_id) -> str:
+    return f"{SERVICE_PAGE_CACHE_KEY_PREFIX}__{service_id}"
@@ -0,0 +1,33 @@
+import gzip
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from jarvis_services.constants import SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE
+from jarvis_services.services import export_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Export all service groups, services and content blocks to a gzip-compressed "
+        "JSON Lines snapshot, to be restored with import_service_catalog."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Snapshot file to write (.jsonl.gz), or '-' for stdout.")
+        parser.add_argument("--batch-size", type=int, default=SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE)
+
+    def handle(self, *args, **kwargs):
+        path = kwargs["path"]
+        started = time.perf_counter()
+        stream = gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb") if path == "-" else gzip.open(path, "wb")
+        with stream:
+            counts = export_catalog(stream, batch_size=kwargs["batch_size"])
+
+        # The snapshot itself may be on stdout, so the summary goes to stderr then.
+        output = self.stderr if path == "-" else self.stdout
+        output.write(self.style.SUCCESS(
+            f"Exported {counts.get('groups', 0)} group(s), {counts.get('services', 0)} service(s) and "
+            f"{counts.get('contents', 0)} content block(s) in {time.perf_counter() - started:.2f} s."
+        ))
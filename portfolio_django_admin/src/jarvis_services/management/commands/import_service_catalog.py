@@ -0,0 +1,40 @@
+import gzip
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jarvis_services.constants import SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE
+from jarvis_services.services import import_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Restore a snapshot written by export_service_catalog. Groups and services are "
+        "upserted by title and the content of every service in the snapshot is replaced "
+        "by the snapshot's; unchanged content blocks are not written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Snapshot file to read (.jsonl.gz), or '-' for stdin.")
+        parser.add_argument("--batch-size", type=int, default=SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE)
+
+    def handle(self, *args, **kwargs):
+        path = kwargs["path"]
+        started = time.perf_counter()
+        try:
+            stream = gzip.GzipFile(fileobj=sys.stdin.buffer, mode="rb") if path == "-" else gzip.open(path, "rb")
+            with stream:
+                stats = import_catalog(stream, batch_size=kwargs["batch_size"])
+        except OSError as e:
+            raise CommandError(f"Could not read '{path}': {e}")
+        except ValueError as e:
+            raise CommandError(f"Nothing was imported. {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Groups: {stats.get('groups_created', 0)} created, {stats.get('groups_updated', 0)} updated. "
+            f"Services: {stats.get('services_created', 0)} created, {stats.get('services_updated', 0)} updated. "
+            f"Content blocks: {stats.get('contents_created', 0)} created, {stats.get('contents_updated', 0)} updated, "
+            f"{stats.get('contents_removed', 0)} removed, {stats.get('contents_unchanged', 0)} unchanged. "
+            f"Took {time.perf_counter() - started:.2f} s."
+        ))
@@ -1,15 +1,30 @@
+import contextlib
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Tuple
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 
+from jarvis_services.constants import MARKDOWN_IMPORT_BATCH_SIZE, MARKDOWN_IMPORT_READ_WORKERS
 from jarvis_services.models.services import Service, ServiceContent, ServiceGroup
+from jarvis_services.services import invalidate_service_catalog, render_service_pages
+
+
+def read_markdown(path: Path) -> Tuple[str, str]:
+    """Read a markdown file and hash it, in a worker thread."""
+    text = path.read_text(encoding="utf-8")
+    return text, ServiceContent.hash_content(text)
 
 
 class Command(BaseCommand):
     help = (
         "Load markdown files from a directory into Service and ServiceContent models. "
-        "Expected structure: base_path/<group_title>/<service_title>/<seq>_<name>.md"
+        "Expected structure: base_path/<group_title>/<service_title>/<seq>_<name>.md. "
+        "Only content blocks whose hash changed are written."
     )
 
     def add_arguments(self, parser):
@@ -18,37 +33,137 @@ class Command(BaseCommand):
             type=str,
             help="Base directory path structured as group_title/service_title/<seq>_<name>.md",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing anything.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MARKDOWN_IMPORT_BATCH_SIZE,
+            help="Number of files read and written per batch. Bounds the content held in memory.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=MARKDOWN_IMPORT_READ_WORKERS,
+            help="Number of threads reading files.",
+        )
 
     def handle(self, *args, **kwargs):
         base_path = Path(kwargs["base_path"]).resolve()
+        self.dry_run = kwargs["dry_run"]
+        self.verbosity = kwargs["verbosity"]
+        batch_size = max(1, kwargs["batch_size"])
 
         if not base_path.exists() or not base_path.is_dir():
             raise CommandError(f"'{base_path}' does not exist or is not a directory.")
 
-        total_created = 0
-        total_updated = 0
+        started = time.perf_counter()
+        tree, total_files, total_skipped_services = self.__walk(base_path)
+        walked = time.perf_counter()
+
+        # Everything the diff needs is loaded up front: groups, services and content hashes.
+        groups = {group.title: group for group in ServiceGroup.objects.filter(title__in=tree.keys())}
+        services = {
+            (service.group_id, service.title): service
+            for service in Service.objects.filter(group__in=groups.values()).only("id", "title", "group_id")
+        }
+        self.existing = defaultdict(lambda: defaultdict(list))
+        contents = ServiceContent.objects.filter(service__in=services.values()).values_list(
+            "id", "service_id", "sequence_number", "content_hash"
+        ).order_by("created_at")
+        for content_id, service_id, sequence_number, content_hash in contents:
+            self.existing[service_id][sequence_number].append((content_id, content_hash))
+        loaded = time.perf_counter()
+
+        if self.dry_run:
+            self.stdout.write(self.style.WARNING("Dry run, nothing is written."))
+
+        self.totals = defaultdict(int)
+        self.changed_service_ids = []
+        self.read_seconds = self.write_seconds = 0.0
+        self.now = timezone.now()
         total_skipped_groups = 0
+        files_done = 0
+        batch = []
+
+        with ThreadPoolExecutor(max_workers=max(1, kwargs["workers"])) as executor, (
+            contextlib.nullcontext() if self.dry_run else transaction.atomic()
+        ):
+            for group_title, group_services in sorted(tree.items()):
+                group = groups.get(group_title)
+                if group is None:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"[SKIP] Group '{group_title}' not found in database — skipping entire directory."
+                        )
+                    )
+                    total_skipped_groups += 1
+                    continue
+
+                self.stdout.write(self.style.MIGRATE_HEADING(f"\nGroup: {group_title}"))
+
+                for service_title, paths in sorted(group_services.items()):
+                    service = services.get((group.id, service_title))
+                    if service is None:
+                        service = Service(title=service_title, group=group)
+                    batch.append((service, paths))
+                    if sum(len(paths) for _, paths in batch) >= batch_size:
+                        files_done += self.__sync_batch(executor, batch)
+                        self.__report_progress(files_done, total_files, started)
+                        batch = []
+
+            if batch:
+                files_done += self.__sync_batch(executor, batch)
+                self.__report_progress(files_done, total_files, started)
+
+        committed = time.perf_counter()
+        if not self.dry_run:
+            if self.totals["services_created"]:
+                # bulk_create does not send post_save, so the catalog is not invalidated otherwise.
+                invalidate_service_catalog()
+            for index in range(0, len(self.changed_service_ids), batch_size):
+                render_service_pages(self.changed_service_ids[index:index + batch_size])
+
+        finished = time.perf_counter()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n{'Dry run done' if self.dry_run else 'Done'}. "
+                f"{self.totals['services_created']} service(s) created, "
+                f"{self.totals['services_updated']} service(s) updated, "
+                f"{self.totals['services_unchanged']} service(s) unchanged, "
+                f"{total_skipped_groups} group(s) skipped, "
+                f"{total_skipped_services} service(s) skipped. "
+                f"Content blocks: {self.totals['added']} added, "
+                f"{self.totals['updated']} updated, {self.totals['removed']} removed."
+            )
+        )
+        elapsed = finished - started
+        self.stdout.write(
+            f"Walked {total_files} file(s) in {(walked - started) * 1000:.0f} ms, "
+            f"loaded state in {(loaded - walked) * 1000:.0f} ms, "
+            f"read in {self.read_seconds * 1000:.0f} ms, "
+            f"wrote in {self.write_seconds * 1000:.0f} ms, "
+            f"rendered pages in {(finished - committed) * 1000:.0f} ms. "
+            f"Total {elapsed:.2f} s ({files_done / elapsed if elapsed else 0:,.0f} files/s)."
+        )
+
+    def __walk(self, base_path: Path):
+        """
+        List the markdown tree as {group_title: {service_title: {sequence_number: path}}}
+        without reading any file. Services with invalid file names are reported and left out.
+        """
+        tree = defaultdict(dict)
+        total_files = 0
         total_skipped_services = 0
 
         for group_dir in sorted(base_path.iterdir()):
             if not group_dir.is_dir():
                 continue
 
-            group_title = group_dir.name
-
-            try:
-                group = ServiceGroup.objects.get(title=group_title)
-            except ServiceGroup.DoesNotExist:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"[SKIP] Group '{group_title}' not found in database — skipping entire directory."
-                    )
-                )
-                total_skipped_groups += 1
-                continue
-
-            self.stdout.write(self.style.MIGRATE_HEADING(f"\nGroup: {group_title}"))
-
             for service_dir in sorted(group_dir.iterdir()):
                 if not service_dir.is_dir():
                     continue
@@ -68,12 +183,9 @@ class Command(BaseCommand):
                     total_skipped_services += 1
                     continue
 
-                contents_to_create = []
-                parse_error = False
-
+                paths = {}
                 for md_file in md_files:
-                    raw_stem = md_file.stem
-                    prefix = raw_stem.split("_", 1)[0]
+                    prefix = md_file.stem.split("_", 1)[0]
 
                     if not prefix.isdigit():
                         self.stdout.write(
@@ -82,69 +194,119 @@ class Command(BaseCommand):
                                 f"number followed by '_' (e.g. 1_intro.md). Skipping service."
                             )
                         )
-                        parse_error = True
                         break
-
-                    contents_to_create.append(
-                        {
-                            "sequence_number": int(prefix),
-                            "content": md_file.read_text(encoding="utf-8"),
-                        }
-                    )
-
-                if parse_error:
-                    total_skipped_services += 1
-                    continue
-
-                with transaction.atomic():
-                    try:
-                        service = Service.objects.get(title=service_title, group=group)
-                        # Existing service — clear contents and re-add
-                        deleted_count, _ = service.contents.all().delete()
-                        ServiceContent.objects.bulk_create(
-                            [
-                                ServiceContent(
-                                    service=service,
-                                    sequence_number=c["sequence_number"],
-                                    content=c["content"],
-                                )
-                                for c in contents_to_create
-                            ]
-                        )
+                    if int(prefix) in paths:
                         self.stdout.write(
                             self.style.WARNING(
-                                f"  [UPDATE] '{service_title}': removed {deleted_count} old "
-                                f"content(s), added {len(contents_to_create)} new."
-                            )
-                        )
-                        total_updated += 1
-
-                    except Service.DoesNotExist:
-                        # New service — create service and contents
-                        service = Service.objects.create(title=service_title, group=group)
-                        ServiceContent.objects.bulk_create(
-                            [
-                                ServiceContent(
-                                    service=service,
-                                    sequence_number=c["sequence_number"],
-                                    content=c["content"],
-                                )
-                                for c in contents_to_create
-                            ]
-                        )
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f"  [CREATE] '{service_title}': added {len(contents_to_create)} content(s)."
+                                f"  [SKIP] '{md_file.name}': sequence number {int(prefix)} is used by "
+                                f"more than one file. Skipping service."
                             )
                         )
-                        total_created += 1
+                        break
+
+                    paths[int(prefix)] = md_file
+                else:
+                    tree[group_dir.name][service_title] = paths
+                    total_files += len(paths)
+                    continue
 
+                total_skipped_services += 1
+
+        return tree, total_files, total_skipped_services
+
+    def __sync_batch(self, executor: ThreadPoolExecutor, batch: list) -> int:
+        """
+        Read the files of a batch of services concurrently, diff them against the stored
+        hashes and write the difference. Returns the number of files read.
+        """
+        started = time.perf_counter()
+        jobs = [(service, seq, path) for service, paths in batch for seq, path in paths.items()]
+        read = defaultdict(dict)
+        for (service, seq, _), result in zip(jobs, executor.map(read_markdown, [path for _, _, path in jobs])):
+            read[service.id][seq] = result
+        self.read_seconds += time.perf_counter() - started
+
+        new_services = []
+        to_create = []
+        to_update = []
+        to_delete = []
+
+        for service, _ in batch:
+            files = read[service.id]
+            if service._state.adding:
+                new_services.append(service)
+                to_create.extend(
+                    self.__build_content(service, seq, text, content_hash)
+                    for seq, (text, content_hash) in files.items()
+                )
+                self.changed_service_ids.append(service.id)
+                self.stdout.write(
+                    self.style.SUCCESS(f"  [CREATE] '{service.title}': add {len(files)} content(s).")
+                )
+                self.totals["services_created"] += 1
+                continue
+
+            added = updated = removed = 0
+            current = self.existing.pop(service.id, {})
+            for seq, (text, content_hash) in files.items():
+                rows = current.pop(seq, [])
+                if not rows:
+                    to_create.append(self.__build_content(service, seq, text, content_hash))
+                    added += 1
+                    continue
+                (content_id, stored_hash), duplicates = rows[0], rows[1:]
+                if stored_hash != content_hash:
+                    to_update.append(ServiceContent(
+                        id=content_id, content=text, content_hash=content_hash, updated_at=self.now
+                    ))
+                    updated += 1
+                to_delete.extend(content_id for content_id, _ in duplicates)
+                removed += len(duplicates)
+            for rows in current.values():
+                to_delete.extend(content_id for content_id, _ in rows)
+                removed += len(rows)
+
+            if added or updated or removed:
+                self.changed_service_ids.append(service.id)
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  [UPDATE] '{service.title}': add {added}, update {updated}, remove {removed} content(s)."
+                    )
+                )
+                self.totals["services_updated"] += 1
+            else:
+                if self.verbosity > 1:
+                    self.stdout.write(f"  [UNCHANGED] '{service.title}'")
+                self.totals["services_unchanged"] += 1
+
+        self.totals["added"] += len(to_create)
+        self.totals["updated"] += len(to_update)
+        self.totals["removed"] += len(to_delete)
+
+        if not self.dry_run and (new_services or to_create or to_update or to_delete):
+            started = time.perf_counter()
+            Service.objects.bulk_create(new_services)
+            ServiceContent.objects.bulk_create(to_create)
+            ServiceContent.objects.bulk_update(to_update, ["content", "content_hash", "updated_at"])
+            ServiceContent.objects.filter(id__in=to_delete).delete()
+            self.write_seconds += time.perf_counter() - started
+
+        return len(jobs)
+
+    def __report_progress(self, files_done: int, total_files: int, started: float) -> None:
+        if self.verbosity < 1:
+            return
+        elapsed = time.perf_counter() - started
         self.stdout.write(
-            self.style.SUCCESS(
-                f"\nDone. "
-                f"{total_created} service(s) created, "
-                f"{total_updated} service(s) updated, "
-                f"{total_skipped_groups} group(s) skipped, "
-                f"{total_skipped_services} service(s) skipped."
-            )
+            f"  ... {files_done}/{total_files} file(s), "
+            f"{files_done / elapsed if elapsed else 0:,.0f} files/s"
+        )
+
+    @staticmethod
+    def __build_content(service: Service, sequence_number: int, text: str, content_hash: str) -> ServiceContent:
+        return ServiceContent(
+            service=service,
+            sequence_number=sequence_number,
+            content=text,
+            content_hash=content_hash,
         )
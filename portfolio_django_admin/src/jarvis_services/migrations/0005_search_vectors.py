@@ -0,0 +1,51 @@
+# Generated by Django 5.1 on 2026-10-19 17:44
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Vectors are kept current by triggers, so bulk_create and raw updates are covered too.
+SEARCH_COLUMNS = [("services", "title"), ("service_contents", "content")]
+
+
+def create_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        # Other databases keep the column empty and search in Python.
+        return
+    for table, column in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_vector_update BEFORE INSERT OR UPDATE OF {column} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(search_vector, 'pg_catalog.english', {column})"
+        )
+        schema_editor.execute(
+            f"UPDATE {table} SET search_vector = to_tsvector('pg_catalog.english', coalesce({column}, ''))"
+        )
+        schema_editor.execute(f"CREATE INDEX {table}_search_vector_gin ON {table} USING GIN (search_vector)")
+
+
+def drop_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, _ in SEARCH_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_vector_gin")
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_search_vector_update ON {table}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jarvis_services', '0004_service_sequence_number'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='servicecontent',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
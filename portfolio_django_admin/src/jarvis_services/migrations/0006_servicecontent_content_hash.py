@@ -0,0 +1,33 @@
+# Generated by Django 5.1 on 2026-10-19 17:47
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_content_hashes(apps, schema_editor):
+    ServiceContent = apps.get_model("jarvis_services", "ServiceContent")
+    contents = []
+    for content in ServiceContent.objects.only("id", "content").iterator(chunk_size=500):
+        content.content_hash = hashlib.sha256((content.content or "").encode("utf-8")).hexdigest()
+        contents.append(content)
+        if len(contents) == 500:
+            ServiceContent.objects.bulk_update(contents, ["content_hash"])
+            contents = []
+    ServiceContent.objects.bulk_update(contents, ["content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jarvis_services', '0005_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicecontent',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.RunPython(backfill_content_hashes, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+import hashlib
 import uuid
 
 
@@ -24,6 +26,8 @@ class Service(models.Model):
     title = models.CharField(max_length=255, blank=False, null=False)
     group = models.ForeignKey(ServiceGroup, on_delete=models.CASCADE, related_name='services')
     sequence_number = models.PositiveIntegerField(default=1)  # For ordering within a group
+    # Maintained by a database trigger on PostgreSQL, see migration 0005.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -43,6 +47,10 @@ class ServiceContent(models.Model):
     service = models.ForeignKey(Service, on_delete=models.CASCADE, related_name='contents')
     sequence_number = models.PositiveIntegerField(default=1)
     content = models.TextField(blank=True, null=True)
+    # SHA-256 of content, compared by load_services_from_markdown to skip unchanged blocks.
+    content_hash = models.CharField(max_length=64, blank=True, default="", editable=False)
+    # Maintained by a database trigger on PostgreSQL, see migration 0005.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -51,5 +59,16 @@ class ServiceContent(models.Model):
     class Meta:
         db_table = 'service_contents'
 
+    @staticmethod
+    def hash_content(content: str | None) -> str:
+        return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.content_hash = self.hash_content(self.content)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "content" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "content_hash"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Content #{self.sequence_number} for Service: {self.service.title}"
\ No newline at end of file
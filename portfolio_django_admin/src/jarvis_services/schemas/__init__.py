@@ -4,6 +4,8 @@ from .services import (
     ServiceContentOut,
     ServiceGroupInfoOut,
     ServiceInfoOut,
+    ServiceSearchFilters,
+    ServiceSearchResultOut,
 )
 from .error import ErrorMessage
 __all__ = [
@@ -13,6 +15,8 @@ __all__ = [
     
     "ServiceInfoOut",
     "ServiceGroupInfoOut",
+    "ServiceSearchFilters",
+    "ServiceSearchResultOut",
     
     "ErrorMessage",
 ]
\ No newline at end of file
@@ -1,8 +1,11 @@
 from typing import Optional
 from datetime import datetime
 from ninja import Schema
+from pydantic import Field
 from uuid import UUID
 
+from jarvis_services.constants import DEFAULT_SERVICE_SEARCH_RESULTS, MAX_SERVICE_SEARCH_RESULTS
+
 class ServiceGroupOut(Schema):
     id: UUID
     title: str
@@ -11,6 +14,7 @@ class ServiceGroupOut(Schema):
 class ServiceContentOut(Schema):
     id: UUID
     content: Optional[str] = None
+    content_html: Optional[str] = None
     sequence_number: int
 
 class ServiceOut(Schema):
@@ -34,3 +38,17 @@ class ServiceGroupInfoOut(Schema):
     title: str
     is_active: bool
     services: list[ServiceInfoOut] = []
+
+
+class ServiceSearchFilters(Schema):
+    q: str = Field(..., min_length=2, max_length=200)
+    limit: int = Field(DEFAULT_SERVICE_SEARCH_RESULTS, ge=1, le=MAX_SERVICE_SEARCH_RESULTS)
+
+
+class ServiceSearchResultOut(Schema):
+    service_id: UUID
+    title: str
+    group_id: UUID
+    group_title: str
+    rank: float
+    snippet: Optional[str] = Field(None, description="Best matching content with matches in <b> tags")
@@ -2,10 +2,27 @@ from .services import (
     get_service,
     get_services_by_group,
     get_all_service_groups,
+    get_service_catalog,
+    invalidate_service_catalog,
 )
+from .pages import (
+    get_service_page,
+    render_service_pages,
+    invalidate_service_pages,
+)
+from .search import search_services
+from .snapshot import export_catalog, import_catalog
 
 __all__ = [
     "get_service",
     "get_services_by_group",
     "get_all_service_groups",
+    "get_service_catalog",
+    "invalidate_service_catalog",
+    "get_service_page",
+    "render_service_pages",
+    "invalidate_service_pages",
+    "search_services",
+    "export_catalog",
+    "import_catalog",
 ]
\ No newline at end of file
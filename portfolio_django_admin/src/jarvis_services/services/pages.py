@@ -0,0 +1,68 @@
+import gzip
+import hashlib
+import logging
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db.models import Prefetch
+from markdown_it import MarkdownIt
+from typing import Any, Dict, Iterable, Optional
+from uuid import UUID
+
+import portfolio_django_admin.constants as constants
+from jarvis_services.constants import build_service_page_cache_key
+from jarvis_services.models import Service, ServiceContent
+from jarvis_services.schemas import ServiceOut
+from portfolio_django_admin.renderers import dumps
+
+logger = logging.getLogger(__name__)
+
+_markdown = MarkdownIt("commonmark")
+
+
+def build_service_page(service: Service) -> Dict[str, Any]:
+    """
+    Render the public payload of a service whose group and contents are loaded.
+    Returns the JSON body, its gzip encoding and a weak ETag shared by both.
+    """
+    payload = ServiceOut.from_orm(service).model_dump()
+    if constants.SERVICE_CONTENT_RENDER_HTML:
+        for content in payload["contents"]:
+            content["content_html"] = _markdown.render(content["content"] or "")
+    body = dumps(payload)
+    return {
+        "etag": f'W/"{hashlib.sha256(body).hexdigest()[:32]}"',
+        "body": body,
+        "gzip": gzip.compress(body, compresslevel=6, mtime=0),
+    }
+
+
+def render_service_pages(service_ids: Iterable[UUID]) -> Dict[UUID, Dict[str, Any]]:
+    """
+    Render and cache the pages of the given services. Called after content is written,
+    so that public reads find the page in the cache. Returns the pages by service ID.
+    """
+    services = Service.objects.filter(id__in=list(service_ids)).select_related("group").prefetch_related(
+        Prefetch("contents", queryset=ServiceContent.objects.order_by("sequence_number"))
+    )
+    pages = {service.id: build_service_page(service) for service in services}
+    cache.set_many(
+        {build_service_page_cache_key(service_id): page for service_id, page in pages.items()},
+        constants.SERVICE_PAGE_CACHE_SECONDS,
+    )
+    logger.info("Rendered %s service page(s).", len(pages))
+    return pages
+
+
+async def get_service_page(service_id: UUID) -> Optional[Dict[str, Any]]:
+    """
+    Returns the rendered page of a service, rendering it when it is not cached.
+    """
+    page = cache.get(build_service_page_cache_key(service_id))
+    if page is None:
+        page = (await sync_to_async(render_service_pages)([service_id])).get(service_id)
+    return page
+
+
+def invalidate_service_pages(service_ids: Iterable[UUID]) -> None:
+    cache.delete_many([build_service_page_cache_key(service_id) for service_id in service_ids])
@@ -0,0 +1,215 @@
+import html
+import math
+import re
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from collections import Counter, defaultdict
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import Count, F, Max, Q
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from jarvis_services.constants import (
+    SERVICE_SEARCH_CONFIG,
+    SERVICE_SEARCH_INDEX_CHECK_SECONDS,
+    SERVICE_SEARCH_TITLE_WEIGHT,
+)
+from jarvis_services.models import Service, ServiceContent, ServiceGroup
+
+TOKEN_PATTERN = re.compile(r"\w+")
+SNIPPET_WORDS = 30
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index over service titles and contents, used when the database
+    has no full-text search. Every query term must match within the title or within one
+    content block; documents are ranked by TF-IDF with title matches weighted by
+    SERVICE_SEARCH_TITLE_WEIGHT.
+    """
+
+    def __init__(self):
+        self.services: Dict[UUID, Dict[str, Any]] = {}
+        self.contents: Dict[UUID, Tuple[UUID, str]] = {}
+        self._postings: Dict[str, Dict[Tuple[str, UUID], int]] = defaultdict(dict)
+
+    def add_service(self, service_id: UUID, title: str, group_id: UUID, group_title: str) -> None:
+        self.services[service_id] = {"title": title, "group_id": group_id, "group_title": group_title}
+        self._add(("service", service_id), title)
+
+    def add_content(self, content_id: UUID, service_id: UUID, content: Optional[str]) -> None:
+        self.contents[content_id] = (service_id, content or "")
+        self._add(("content", content_id), content)
+
+    def _add(self, key: Tuple[str, UUID], text: Optional[str]) -> None:
+        for term, frequency in Counter(tokenize(text)).items():
+            self._postings[term][key] = frequency
+
+    def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        documents = len(self.services) + len(self.contents)
+        document_scores: Dict[Tuple[str, UUID], float] = defaultdict(float)
+        matched_terms: Dict[Tuple[str, UUID], int] = defaultdict(int)
+        for term in terms:
+            postings = self._postings.get(term, {})
+            idf = math.log(1 + documents / (1 + len(postings)))
+            for key, frequency in postings.items():
+                document_scores[key] += (1 + math.log(frequency)) * idf
+                matched_terms[key] += 1
+
+        # As with the tsvector columns, a title or a content block only matches when it
+        # contains every term; a service's rank sums its matching documents.
+        scores: Dict[UUID, float] = defaultdict(float)
+        best_content: Dict[UUID, Tuple[float, UUID]] = {}
+        for (kind, document_id), score in document_scores.items():
+            if matched_terms[(kind, document_id)] < len(terms):
+                continue
+            if kind == "service":
+                service_id = document_id
+                score *= SERVICE_SEARCH_TITLE_WEIGHT
+            else:
+                service_id = self.contents[document_id][0]
+                current = best_content.get(service_id)
+                if current is None or score > current[0]:
+                    best_content[service_id] = (score, document_id)
+            if service_id in self.services:
+                scores[service_id] += score
+
+        ranked = sorted(
+            scores,
+            key=lambda service_id: scores[service_id],
+            reverse=True,
+        )[:limit]
+        return [
+            {
+                "service_id": service_id,
+                **self.services[service_id],
+                "rank": round(scores[service_id], 6),
+                "snippet": (
+                    build_snippet(self.contents[best_content[service_id][1]][1], terms)
+                    if service_id in best_content else None
+                ),
+            }
+            for service_id in ranked
+        ]
+
+
+def build_snippet(text: str, terms: Iterable[str]) -> str:
+    """
+    Returns about SNIPPET_WORDS words around the first matching term, with matches
+    wrapped in <b> tags like PostgreSQL's ts_headline.
+    """
+    pattern = re.compile(r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\b", re.IGNORECASE)
+    match = pattern.search(text)
+    first = len(text[:match.start()].split()) if match else 0
+    start = max(0, first - SNIPPET_WORDS // 3)
+    window = html.escape(" ".join(text.split()[start:start + SNIPPET_WORDS]))
+    return pattern.sub(lambda found: f"<b>{found.group(0)}</b>", window)
+
+
+_fallback_index: Optional[InvertedIndex] = None
+_fallback_signature = None
+_fallback_checked_at: Optional[float] = None
+_fallback_lock = threading.Lock()
+
+
+def _get_fallback_index() -> InvertedIndex:
+    """
+    Returns the in-memory index, rebuilt when groups, services or contents were added,
+    removed or updated since it was built. Changes are looked for at most once per
+    SERVICE_SEARCH_INDEX_CHECK_SECONDS.
+    """
+    global _fallback_index, _fallback_signature, _fallback_checked_at
+    now = time.monotonic()
+    if _fallback_index is not None and now - _fallback_checked_at < SERVICE_SEARCH_INDEX_CHECK_SECONDS:
+        return _fallback_index
+    signature = (
+        tuple(ServiceGroup.objects.aggregate(
+            count=Count("id"), active=Count("id", filter=Q(is_active=True)), updated_at=Max("updated_at")
+        ).values()),
+        tuple(Service.objects.aggregate(count=Count("id"), updated_at=Max("updated_at")).values()),
+        tuple(ServiceContent.objects.aggregate(count=Count("id"), updated_at=Max("updated_at")).values()),
+    )
+    with _fallback_lock:
+        if _fallback_index is None or signature != _fallback_signature:
+            index = InvertedIndex()
+            services = Service.objects.filter(group__is_active=True).values_list("id", "title", "group_id", "group__title")
+            for service_id, title, group_id, group_title in services:
+                index.add_service(service_id, title, group_id, group_title)
+            for content_id, service_id, content in ServiceContent.objects.values_list("id", "service_id", "content"):
+                index.add_content(content_id, service_id, content)
+            _fallback_index, _fallback_signature = index, signature
+        _fallback_checked_at = now
+        return _fallback_index
+
+
+def _search_postgres(query: str, limit: int) -> List[Dict[str, Any]]:
+    search_query = SearchQuery(query, search_type="websearch", config=SERVICE_SEARCH_CONFIG)
+    results: Dict[UUID, Dict[str, Any]] = {}
+
+    services = (
+        Service.objects.filter(group__is_active=True, search_vector=search_query)
+        .annotate(rank=SearchRank(F("search_vector"), search_query))
+        .order_by("-rank")
+        .values("id", "title", "group_id", "group__title", "rank")[:limit]
+    )
+    for service in services:
+        results[service["id"]] = {
+            "service_id": service["id"],
+            "title": service["title"],
+            "group_id": service["group_id"],
+            "group_title": service["group__title"],
+            "rank": service["rank"] * SERVICE_SEARCH_TITLE_WEIGHT,
+            "snippet": None,
+        }
+
+    # Best matching content blocks first; the headline is only computed for the rows returned.
+    contents = (
+        ServiceContent.objects.filter(service__group__is_active=True, search_vector=search_query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), search_query),
+            snippet=SearchHeadline("content", search_query, config=SERVICE_SEARCH_CONFIG, max_words=SNIPPET_WORDS),
+        )
+        .order_by("-rank")
+        .values("service_id", "service__title", "service__group_id", "service__group__title", "rank", "snippet")[:limit * 3]
+    )
+    for content in contents:
+        result = results.setdefault(content["service_id"], {
+            "service_id": content["service_id"],
+            "title": content["service__title"],
+            "group_id": content["service__group_id"],
+            "group_title": content["service__group__title"],
+            "rank": 0.0,
+            "snippet": None,
+        })
+        result["rank"] += content["rank"]
+        if result["snippet"] is None:
+            result["snippet"] = content["snippet"]
+
+    return sorted(results.values(), key=lambda result: result["rank"], reverse=True)[:limit]
+
+
+def search_services_sync(query: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Full-text search over service titles and contents, best match first.
+    Uses the trigger-maintained tsvector columns on PostgreSQL and an in-memory
+    inverted index on other databases.
+    """
+    if connection.vendor == "postgresql":
+        return _search_postgres(query, limit)
+    return _get_fallback_index().search(query, limit)
+
+
+@sync_to_async
+def search_services(query: str, limit: int) -> List[Dict[str, Any]]:
+    return search_services_sync(query, limit)
@@ -1,8 +1,13 @@
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Prefetch
 from jarvis_services.models import ServiceGroup, Service
 
+from jarvis_services.constants import SERVICE_CATALOG_CACHE_KEY
 from jarvis_services.schemas import ServiceGroupInfoOut
+from portfolio_django_admin.renderers import dumps
+import portfolio_django_admin.constants as constants
 
 from typing import Optional, List
 from uuid import UUID
@@ -17,24 +22,39 @@ def get_service(service_id: UUID) -> Optional[Service]:
     except Service.DoesNotExist:
         return None
     
+def _prefetch_services() -> Prefetch:
+    return Prefetch(
+        "services",
+        queryset=Service.objects.only("id", "title", "sequence_number", "group_id").order_by("sequence_number"),
+    )
+
 @sync_to_async
 def get_services_by_group(group_id: UUID) -> Optional[ServiceGroupInfoOut]:
     try:
-        group = ServiceGroup.objects.get(id=group_id)
-        group_schema = ServiceGroupInfoOut.from_orm(group)
-        if not group.is_active:
-            return None
-
-        group_schema.services = sorted(group_schema.services, key=lambda s: s.sequence_number)        
-        return group_schema
+        group = ServiceGroup.objects.prefetch_related(_prefetch_services()).get(id=group_id, is_active=True)
+        return ServiceGroupInfoOut.from_orm(group)
     except ServiceGroup.DoesNotExist:
         return None
     
 @sync_to_async
 def get_all_service_groups() -> List[ServiceGroupInfoOut]:
-    groups = ServiceGroup.objects.filter(is_active=True).all()
-    group_schemas:list[ServiceGroupInfoOut] = []
-    for group in groups:
-        group_schemas.append(ServiceGroupInfoOut.from_orm(group))
-        group_schemas[-1].services = sorted(group_schemas[-1].services, key=lambda s: s.sequence_number)
-    return group_schemas
\ No newline at end of file
+    groups = ServiceGroup.objects.filter(is_active=True).prefetch_related(_prefetch_services())
+    return [ServiceGroupInfoOut.from_orm(group) for group in groups]
+
+
+async def get_service_catalog() -> bytes:
+    """
+    Returns the JSON body of all active service groups with their services.
+    The body is built with two queries and cached until a Service or ServiceGroup
+    is saved or deleted, see jarvis_services.signals.
+    """
+    body = cache.get(SERVICE_CATALOG_CACHE_KEY)
+    if body is None:
+        groups = await get_all_service_groups()
+        body = dumps([group.model_dump() for group in groups])
+        cache.set(SERVICE_CATALOG_CACHE_KEY, body, constants.SERVICE_CATALOG_CACHE_SECONDS)
+    return body
+
+
+def invalidate_service_catalog() -> None:
+    cache.delete(SERVICE_CATALOG_CACHE_KEY)
\ No newline at end of file
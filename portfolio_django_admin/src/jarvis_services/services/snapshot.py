@@ -0,0 +1,303 @@
+import logging
+from collections import Counter, defaultdict
+from typing import Any, BinaryIO, Dict, Iterable, List, Tuple
+from uuid import UUID
+
+import orjson
+from django.db import transaction
+from django.utils import timezone
+
+from jarvis_services.constants import (
+    SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE,
+    SERVICE_CATALOG_SNAPSHOT_FORMAT,
+    SERVICE_CATALOG_SNAPSHOT_VERSION,
+)
+from jarvis_services.models import Service, ServiceContent, ServiceGroup
+from jarvis_services.services.pages import render_service_pages
+from jarvis_services.services.services import invalidate_service_catalog
+
+logger = logging.getLogger(__name__)
+
+# A snapshot is JSON Lines: a header, then every group, every service and every content
+# block, in that order. Services and contents refer to their parents by title, so a
+# snapshot can be restored into a database whose IDs differ.
+
+
+def _write(stream: BinaryIO, record: Dict[str, Any]) -> None:
+    stream.write(orjson.dumps(record))
+    stream.write(b"\n")
+
+
+def export_catalog(stream: BinaryIO, batch_size: int = SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Write the whole service catalog to a binary stream as a snapshot.
+    Content is read ``batch_size`` rows at a time. Returns the number of records per type.
+    """
+    counts: Counter = Counter()
+    _write(stream, {
+        "format": SERVICE_CATALOG_SNAPSHOT_FORMAT,
+        "version": SERVICE_CATALOG_SNAPSHOT_VERSION,
+        "exported_at": timezone.now().isoformat(),
+    })
+
+    for group in ServiceGroup.objects.order_by("title").values("title", "is_active", "updated_by"):
+        _write(stream, {"type": "group", **group})
+        counts["groups"] += 1
+
+    services = Service.objects.order_by("group__title", "title").values_list(
+        "group__title", "title", "sequence_number", "updated_by"
+    )
+    for group_title, title, sequence_number, updated_by in services:
+        _write(stream, {
+            "type": "service",
+            "group": group_title,
+            "title": title,
+            "sequence_number": sequence_number,
+            "updated_by": updated_by,
+        })
+        counts["services"] += 1
+
+    contents = ServiceContent.objects.order_by(
+        "service__group__title", "service__title", "sequence_number", "created_at"
+    ).values_list("service__group__title", "service__title", "sequence_number", "content")
+    for group_title, service_title, sequence_number, content in contents.iterator(chunk_size=batch_size):
+        _write(stream, {
+            "type": "content",
+            "group": group_title,
+            "service": service_title,
+            "sequence_number": sequence_number,
+            "content": content,
+        })
+        counts["contents"] += 1
+
+    logger.info("Exported service catalog: %s.", dict(counts))
+    return dict(counts)
+
+
+def _read_header(line: bytes) -> Dict[str, Any]:
+    try:
+        header = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        header = None
+    if not isinstance(header, dict) or header.get("format") != SERVICE_CATALOG_SNAPSHOT_FORMAT:
+        raise ValueError("The file is not a service catalog snapshot.")
+    if header.get("version") != SERVICE_CATALOG_SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {header.get('version')!r}, "
+            f"expected {SERVICE_CATALOG_SNAPSHOT_VERSION}."
+        )
+    return header
+
+
+def _upsert_groups(records: List[Dict[str, Any]], stats: Counter) -> Dict[str, UUID]:
+    existing = {
+        title: (is_active, updated_by)
+        for title, is_active, updated_by in ServiceGroup.objects.filter(
+            title__in=[record["title"] for record in records]
+        ).values_list("title", "is_active", "updated_by")
+    }
+    changed = []
+    for record in records:
+        values = (record.get("is_active", True), record.get("updated_by"))
+        if existing.get(record["title"]) != values:
+            stats["groups_updated" if record["title"] in existing else "groups_created"] += 1
+            changed.append(ServiceGroup(title=record["title"], is_active=values[0], updated_by=values[1]))
+    ServiceGroup.objects.bulk_create(
+        changed,
+        update_conflicts=True,
+        unique_fields=["title"],
+        update_fields=["is_active", "updated_by", "updated_at"],
+    )
+    return dict(ServiceGroup.objects.filter(title__in=[record["title"] for record in records]).values_list("title", "id"))
+
+
+def _upsert_services(
+    records: List[Dict[str, Any]], group_ids: Dict[str, UUID], stats: Counter
+) -> Tuple[Dict[Tuple[str, str], UUID], set]:
+    group_titles = {group_id: title for title, group_id in group_ids.items()}
+    existing = {
+        (group_titles[group_id], title): (sequence_number, updated_by)
+        for group_id, title, sequence_number, updated_by in Service.objects.filter(
+            group_id__in=group_ids.values()
+        ).values_list("group_id", "title", "sequence_number", "updated_by")
+    }
+    changed = []
+    changed_keys = set()
+    for record in records:
+        if record["group"] not in group_ids:
+            raise ValueError(f"Service '{record['title']}' refers to unknown group '{record['group']}'.")
+        key = (record["group"], record["title"])
+        values = (record.get("sequence_number", 1), record.get("updated_by"))
+        if existing.get(key) != values:
+            stats["services_updated" if key in existing else "services_created"] += 1
+            changed_keys.add(key)
+            changed.append(Service(
+                title=record["title"],
+                group_id=group_ids[record["group"]],
+                sequence_number=values[0],
+                updated_by=values[1],
+            ))
+    Service.objects.bulk_create(
+        changed,
+        update_conflicts=True,
+        unique_fields=["title", "group"],
+        update_fields=["sequence_number", "updated_by", "updated_at"],
+    )
+    # Only the services in the snapshot, so that contents of other services are left alone.
+    keys = {(record["group"], record["title"]) for record in records}
+    service_ids = {
+        (group_titles[group_id], title): service_id
+        for group_id, title, service_id in Service.objects.filter(
+            group_id__in=group_ids.values()
+        ).values_list("group_id", "title", "id")
+        if (group_titles[group_id], title) in keys
+    }
+    return service_ids, {service_ids[key] for key in changed_keys}
+
+
+class _ContentSync:
+    """
+    Diffs streamed content records against the stored content hashes of the snapshot's
+    services and writes the difference in batches. Blocks of those services that are not
+    in the snapshot are removed by ``finish``.
+    """
+
+    def __init__(self, service_ids: Dict[Tuple[str, str], UUID], changed_service_ids: set, batch_size: int, stats: Counter):
+        self.service_ids = service_ids
+        self.batch_size = batch_size
+        self.stats = stats
+        self.changed_service_ids = changed_service_ids
+        self.seen = set()
+        self.now = timezone.now()
+        self.existing = defaultdict(lambda: defaultdict(list))
+        contents = ServiceContent.objects.filter(service_id__in=service_ids.values()).order_by("created_at").values_list(
+            "id", "service_id", "sequence_number", "content_hash"
+        )
+        for content_id, service_id, sequence_number, content_hash in contents:
+            self.existing[service_id][sequence_number].append((content_id, content_hash))
+        self.to_create: List[ServiceContent] = []
+        self.to_update: List[ServiceContent] = []
+        self.removed: List[UUID] = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        service_id = self.service_ids.get((record["group"], record["service"]))
+        if service_id is None:
+            raise ValueError(f"Content refers to unknown service '{record['group']}' / '{record['service']}'.")
+        sequence_number = record["sequence_number"]
+        if (service_id, sequence_number) in self.seen:
+            raise ValueError(
+                f"Service '{record['service']}' has more than one content block with sequence number {sequence_number}."
+            )
+        self.seen.add((service_id, sequence_number))
+
+        text = record.get("content")
+        content_hash = ServiceContent.hash_content(text)
+        rows = self.existing[service_id].pop(sequence_number, [])
+        if not rows:
+            self.to_create.append(ServiceContent(
+                service_id=service_id, sequence_number=sequence_number, content=text, content_hash=content_hash
+            ))
+        elif rows[0][1] != content_hash:
+            self.to_update.append(ServiceContent(
+                id=rows[0][0], content=text, content_hash=content_hash, updated_at=self.now
+            ))
+        else:
+            self.stats["contents_unchanged"] += 1
+        # Stored duplicates of a sequence number are dropped, as in load_services_from_markdown.
+        self.removed.extend(content_id for content_id, _ in rows[1:])
+        if not rows or rows[0][1] != content_hash or rows[1:]:
+            self.changed_service_ids.add(service_id)
+
+        if len(self.to_create) + len(self.to_update) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        ServiceContent.objects.bulk_create(self.to_create)
+        ServiceContent.objects.bulk_update(self.to_update, ["content", "content_hash", "updated_at"])
+        self.stats["contents_created"] += len(self.to_create)
+        self.stats["contents_updated"] += len(self.to_update)
+        self.to_create, self.to_update = [], []
+
+    def finish(self) -> None:
+        self.flush()
+        removed = self.removed
+        for service_id, rows_by_sequence in self.existing.items():
+            for rows in rows_by_sequence.values():
+                removed.extend(content_id for content_id, _ in rows)
+                self.changed_service_ids.add(service_id)
+        for start in range(0, len(removed), self.batch_size):
+            ServiceContent.objects.filter(id__in=removed[start:start + self.batch_size]).only("id", "service_id").delete()
+        self.stats["contents_removed"] += len(removed)
+
+
+def import_catalog(lines: Iterable[bytes], batch_size: int = SERVICE_CATALOG_SNAPSHOT_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Restore a snapshot written by ``export_catalog`` from an iterable of lines, such as
+    an open file. Groups and services are upserted by title; the content blocks of every
+    service in the snapshot are made to match it, writing only blocks whose hash changed.
+    Groups and services missing from the snapshot are left alone.
+
+    Everything is written in one transaction and content is held ``batch_size`` blocks at
+    a time. Raises ValueError when the snapshot is malformed; nothing is written then.
+    Returns counts of what was created, updated, removed and left unchanged.
+    """
+    lines = iter(lines)
+    _read_header(next(lines, b""))
+    stats: Counter = Counter()
+    groups: List[Dict[str, Any]] = []
+    services: List[Dict[str, Any]] = []
+    # Line of each group and service, since a row can only be upserted once per statement.
+    group_lines: Dict[str, int] = {}
+    service_lines: Dict[Tuple[str, str], int] = {}
+    content_sync = None
+
+    with transaction.atomic():
+        for line_number, line in enumerate(lines, start=2):
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+                kind = record["type"]
+                if kind == "content":
+                    if content_sync is None:
+                        content_sync = _ContentSync(
+                            *_upsert_services(services, _upsert_groups(groups, stats), stats), batch_size, stats
+                        )
+                    content_sync.add(record)
+                elif content_sync is not None:
+                    raise ValueError("Groups and services must come before content.")
+                elif kind == "group":
+                    if record["title"] in group_lines:
+                        raise ValueError(
+                            f"Group '{record['title']}' is already defined on line {group_lines[record['title']]}."
+                        )
+                    group_lines[record["title"]] = line_number
+                    groups.append(record)
+                elif kind == "service":
+                    key = (record["group"], record["title"])
+                    if key in service_lines:
+                        raise ValueError(
+                            f"Service '{record['title']}' of group '{record['group']}' is already defined "
+                            f"on line {service_lines[key]}."
+                        )
+                    service_lines[key] = line_number
+                    services.append(record)
+                else:
+                    raise ValueError(f"Unknown record type {kind!r}.")
+            except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                detail = f"missing field {e}" if isinstance(e, KeyError) else e
+                raise ValueError(f"Line {line_number}: {detail}") from e
+
+        if content_sync is None:
+            content_sync = _ContentSync(*_upsert_services(services, _upsert_groups(groups, stats), stats), batch_size, stats)
+        content_sync.finish()
+
+    if stats["groups_created"] or stats["groups_updated"] or stats["services_created"] or stats["services_updated"]:
+        # bulk_create does not send post_save, so the caches are cleared here.
+        invalidate_service_catalog()
+    changed_service_ids = list(content_sync.changed_service_ids)
+    for start in range(0, len(changed_service_ids), batch_size):
+        render_service_pages(changed_service_ids[start:start + batch_size])
+
+    logger.info("Imported service catalog: %s.", dict(stats))
+    return dict(stats)
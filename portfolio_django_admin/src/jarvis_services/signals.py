@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from jarvis_services.models import Service, ServiceContent, ServiceGroup
+from jarvis_services.services import invalidate_service_catalog, invalidate_service_pages
+
+# Caches are cleared once the write is committed, so that a read running in between
+# cannot cache the old state again.
+
+
+@receiver([post_save, post_delete], sender=ServiceGroup)
+def invalidate_service_group(sender, instance: ServiceGroup, **kwargs):
+    service_ids = list(Service.objects.filter(group_id=instance.id).values_list("id", flat=True))
+    transaction.on_commit(invalidate_service_catalog)
+    transaction.on_commit(lambda: invalidate_service_pages(service_ids))
+
+
+@receiver([post_save, post_delete], sender=Service)
+def invalidate_service(sender, instance: Service, **kwargs):
+    transaction.on_commit(invalidate_service_catalog)
+    transaction.on_commit(lambda: invalidate_service_pages([instance.id]))
+
+
+@receiver([post_save, post_delete], sender=ServiceContent)
+def invalidate_service_content(sender, instance: ServiceContent, **kwargs):
+    transaction.on_commit(lambda: invalidate_service_pages([instance.service_id]))
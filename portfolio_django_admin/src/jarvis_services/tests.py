@@ -1,3 +1,327 @@
-from django.test import TestCase
+import gzip
+import json
+import tempfile
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models.signals import post_save
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+import portfolio_django_admin.constants as constants
+from jarvis_services.admin import ServiceContentUploadForm, _read_upload
+from jarvis_services.management.commands.load_services_from_markdown import (
+    Command as LoadServicesCommand,
+    read_markdown,
+)
+from jarvis_services.models import Service, ServiceContent, ServiceGroup
+from jarvis_services.schemas import ServiceGroupInfoOut, ServiceInfoOut
+from jarvis_services.services import get_service_catalog
+from jarvis_services.services.pages import build_service_page
+from jarvis_services.services.search import InvertedIndex
+from jarvis_services.services.snapshot import _ContentSync, _upsert_groups, _upsert_services, import_catalog
+from jarvis_services.views.services import _service_page_response
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class ServiceCatalogCacheTest(SimpleTestCase):
+
+    def setUp(self):
+        self.groups = [
+            ServiceGroupInfoOut(
+                id=uuid.uuid4(), title="Observability", is_active=True,
+                services=[ServiceInfoOut(id=uuid.uuid4(), title="Dashboards", sequence_number=1)],
+            )
+        ]
+
+    async def test_catalog_is_built_once_until_a_service_changes(self):
+        build = AsyncMock(return_value=self.groups)
+        with patch("jarvis_services.services.services.get_all_service_groups", build):
+            body = await get_service_catalog()
+            await get_service_catalog()
+            self.assertEqual(build.await_count, 1)
+
+            with patch("jarvis_services.signals.transaction.on_commit", side_effect=lambda func: func()):
+                post_save.send(sender=Service, instance=Service(), created=False)
+            await get_service_catalog()
+            self.assertEqual(build.await_count, 2)
+
+        self.assertEqual(json.loads(body)[0]["services"][0]["title"], "Dashboards")
+
+
+class ServicePageTest(SimpleTestCase):
+
+    def setUp(self):
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        group = ServiceGroup(id=uuid.uuid4(), title="Observability", is_active=True)
+        service = Service(id=uuid.uuid4(), title="Dashboards", group=group, sequence_number=1, created_at=now, updated_at=now)
+        contents = [
+            ServiceContent(id=uuid.uuid4(), service=service, sequence_number=number, content=f"# Part {number}")
+            for number in (1, 2)
+        ]
+        service._prefetched_objects_cache = {"contents": ServiceContent.objects.none()}
+        service._prefetched_objects_cache["contents"]._result_cache = contents
+        self.page = build_service_page(service)
+
+    def test_page_is_served_compressed_and_revalidated_by_etag(self):
+        factory = RequestFactory()
+        response = _service_page_response(factory.get("/", headers={"Accept-Encoding": "gzip, br"}), self.page)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        body = json.loads(gzip.decompress(response.content))
+        self.assertEqual([content["content"] for content in body["contents"]], ["# Part 1", "# Part 2"])
+
+        plain = _service_page_response(factory.get("/"), self.page)
+        self.assertEqual(plain.content, self.page["body"])
+
+        not_modified = _service_page_response(factory.get("/", headers={"If-None-Match": response["ETag"]}), self.page)
+        self.assertEqual(not_modified.status_code, 304)
+
+
+class InvertedIndexSearchTest(SimpleTestCase):
+
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.group_id = uuid.uuid4()
+        self.alerting, self.backups = uuid.uuid4(), uuid.uuid4()
+        self.index.add_service(self.alerting, "Alerting", self.group_id, "Observability")
+        self.index.add_service(self.backups, "Backups", self.group_id, "Storage")
+        self.index.add_content(uuid.uuid4(), self.alerting, "Route alerts to the on-call rotation & escalate.")
+        self.index.add_content(uuid.uuid4(), self.backups, "Nightly backups are kept for 30 days. Restore alerts are sent on failure.")
+
+    def test_every_term_must_match_and_titles_rank_higher(self):
+        results = self.index.search("alerting", limit=10)
+        self.assertEqual([result["service_id"] for result in results], [self.alerting])
+        self.assertIsNone(results[0]["snippet"])
+
+        results = self.index.search("alerts", limit=10)
+        self.assertEqual({result["service_id"] for result in results}, {self.alerting, self.backups})
+        self.assertEqual(results[0]["snippet"], "Route <b>alerts</b> to the on-call rotation &amp; escalate.")
+
+        self.assertEqual(self.index.search("restore alerts", limit=10)[0]["service_id"], self.backups)
+        self.assertEqual(self.index.search("restore kubernetes", limit=10), [])
+
+    def test_terms_must_match_within_one_document(self):
+        # "Routing" only appears in the title, "escalate" only in the content: like the
+        # PostgreSQL search, neither matches the query on its own.
+        routing = uuid.uuid4()
+        self.index.add_service(routing, "Routing", self.group_id, "Observability")
+        self.index.add_content(uuid.uuid4(), routing, "Pages escalate after ten minutes.")
+        self.index.add_content(uuid.uuid4(), routing, "Routing rules are ordered.")
+
+        self.assertEqual(self.index.search("routing escalate", limit=10), [])
+        results = self.index.search("routing rules", limit=10)
+        self.assertEqual([result["service_id"] for result in results], [routing])
+        self.assertEqual(results[0]["snippet"], "<b>Routing</b> <b>rules</b> are ordered.")
+
+
+class MarkdownSyncTest(SimpleTestCase):
+
+    def test_walk_keys_blocks_by_sequence_and_skips_ambiguous_services(self):
+        with tempfile.TemporaryDirectory() as base_path:
+            base = Path(base_path)
+            (base / "Web" / "Hosting").mkdir(parents=True)
+            (base / "Web" / "Hosting" / "2_pricing.md").write_text("Pricing")
+            (base / "Web" / "Hosting" / "1_intro.md").write_text("Intro")
+            (base / "Web" / "Mail").mkdir()
+            (base / "Web" / "Mail" / "1_a.md").write_text("A")
+            (base / "Web" / "Mail" / "1_b.md").write_text("B")
+
+            command = LoadServicesCommand(stdout=StringIO())
+            tree, total_files, total_skipped = command._Command__walk(base)
+
+            self.assertEqual(dict(tree), {"Web": {"Hosting": {
+                1: base / "Web" / "Hosting" / "1_intro.md",
+                2: base / "Web" / "Hosting" / "2_pricing.md",
+            }}})
+            self.assertEqual((total_files, total_skipped), (2, 1))
+            self.assertEqual(read_markdown(tree["Web"]["Hosting"][1]), ("Intro", ServiceContent.hash_content("Intro")))
+
+    def test_batch_writes_only_the_blocks_that_changed(self):
+        with tempfile.TemporaryDirectory() as base_path:
+            base = Path(base_path)
+            for name, text in (("1_intro.md", "Intro"), ("2_pricing.md", "New price"), ("1_inbox.md", "Inbox")):
+                (base / name).write_text(text)
+
+            group = ServiceGroup(id=uuid.uuid4(), title="Web")
+            hosting = Service(id=uuid.uuid4(), title="Hosting", group=group)
+            hosting._state.adding = False
+            mail = Service(title="Mail", group=group)
+            kept, changed, gone = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+            command = LoadServicesCommand(stdout=StringIO())
+            command.dry_run, command.verbosity, command.now = False, 1, datetime(2026, 1, 1, tzinfo=timezone.utc)
+            command.totals, command.changed_service_ids = defaultdict(int), []
+            command.read_seconds = command.write_seconds = 0.0
+            command.existing = defaultdict(lambda: defaultdict(list), {hosting.id: {
+                1: [(kept, ServiceContent.hash_content("Intro"))],
+                2: [(changed, ServiceContent.hash_content("Old price"))],
+                3: [(gone, ServiceContent.hash_content("Gone"))],
+            }})
+            batch = [
+                (hosting, {1: base / "1_intro.md", 2: base / "2_pricing.md"}),
+                (mail, {1: base / "1_inbox.md"}),
+            ]
+            with ThreadPoolExecutor(max_workers=2) as executor, \
+                    patch.object(Service.objects, "bulk_create") as create_services, \
+                    patch.object(ServiceContent, "objects") as contents:
+                files = command._Command__sync_batch(executor, batch)
+
+        self.assertEqual(files, 3)
+        self.assertEqual(create_services.call_args.args[0], [mail])
+        created = contents.bulk_create.call_args.args[0]
+        self.assertEqual([(block.service, block.sequence_number, block.content) for block in created], [(mail, 1, "Inbox")])
+        updated = contents.bulk_update.call_args.args[0]
+        self.assertEqual([(block.id, block.content) for block in updated], [(changed, "New price")])
+        self.assertEqual(contents.filter.call_args.kwargs, {"id__in": [gone]})
+        self.assertEqual(command.changed_service_ids, [hosting.id, mail.id])
+        self.assertEqual(
+            dict(command.totals),
+            {"services_created": 1, "services_updated": 1, "added": 1, "updated": 1, "removed": 1},
+        )
+
+    def test_content_hash_follows_content_on_save(self):
+        content = ServiceContent(service_id=uuid.uuid4(), content="Intro")
+        with patch("django.db.models.Model.save") as save:
+            content.save(update_fields=["content"])
+        self.assertEqual(content.content_hash, ServiceContent.hash_content("Intro"))
+        self.assertEqual(save.call_args.kwargs["update_fields"], {"content", "content_hash"})
+        self.assertNotEqual(ServiceContent.hash_content("Intro"), ServiceContent.hash_content("Intro "))
+
+
+class ServiceContentUploadTest(SimpleTestCase):
+
+    def test_upload_is_decoded_across_chunk_boundaries(self):
+        upload = SimpleUploadedFile("1_intro.md", "Café – naïve".encode("utf-8"))
+        upload.DEFAULT_CHUNK_SIZE = 1
+        self.assertEqual(_read_upload(upload), ("Café – naïve", ServiceContent.hash_content("Café – naïve")))
+
+        with self.assertRaisesMessage(Exception, "is not valid UTF-8"):
+            _read_upload(SimpleUploadedFile("2_bad.md", b"\xff\xfe"))
+
+    @patch("portfolio_django_admin.constants.SERVICE_UPLOAD_MAX_FILE_BYTES", 4)
+    def test_files_over_the_size_limit_are_rejected_before_reading(self):
+        form = ServiceContentUploadForm(
+            {"service_group_title": "Web", "service_title": "Hosting"},
+            {"content_files": [SimpleUploadedFile("1_a.md", b"ok"), SimpleUploadedFile("2_b.md", b"too large")]},
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("Too large: 2_b.md", form.errors["content_files"][0])
+
+    def test_too_many_files_reach_the_form_and_get_its_error(self):
+        count = constants.SERVICE_UPLOAD_MAX_FILES + 1
+        request = RequestFactory().post("/", {
+            "service_group_title": "Web",
+            "service_title": "Hosting",
+            "content_files": [SimpleUploadedFile(f"{number}_part.md", b"ok") for number in range(1, count + 1)],
+        })
+        form = ServiceContentUploadForm(request.POST, request.FILES)
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["content_files"],
+            [f"At most {constants.SERVICE_UPLOAD_MAX_FILES} files can be uploaded at once."],
+        )
+
+
+class ServiceCatalogSnapshotTest(SimpleTestCase):
+
+    def test_files_that_are_not_current_snapshots_are_rejected_before_writing(self):
+        with self.assertRaisesMessage(ValueError, "not a service catalog snapshot"):
+            import_catalog([b'{"type": "group", "title": "Web"}\n'])
+        with self.assertRaisesMessage(ValueError, "not a service catalog snapshot"):
+            import_catalog([])
+        with self.assertRaisesMessage(ValueError, "Unsupported snapshot version 2"):
+            import_catalog([b'{"format": "jarvis-service-catalog", "version": 2}\n'])
+
+    @patch("jarvis_services.services.snapshot.transaction.atomic")
+    def test_duplicate_groups_and_services_are_rejected_with_their_lines(self, atomic):
+        header = b'{"format": "jarvis-service-catalog", "version": 1}\n'
+        group = b'{"type": "group", "title": "Web"}\n'
+        service = b'{"type": "service", "group": "Web", "title": "Hosting"}\n'
+
+        with self.assertRaisesMessage(ValueError, "Line 3: Group 'Web' is already defined on line 2."):
+            import_catalog([header, group, group])
+        with self.assertRaisesMessage(
+            ValueError, "Line 4: Service 'Hosting' of group 'Web' is already defined on line 3."
+        ):
+            import_catalog([header, group, service, service])
+
+    def test_only_changed_groups_and_services_are_upserted(self):
+        web, ops = uuid.uuid4(), uuid.uuid4()
+        stats = Counter()
+        with patch.object(ServiceGroup, "objects") as groups:
+            groups.filter.return_value.values_list.side_effect = [
+                [("Web", True, None), ("Ops", True, "alice")],
+                [("Web", web), ("Ops", ops)],
+            ]
+            group_ids = _upsert_groups(
+                [{"title": "Web", "is_active": True, "updated_by": None}, {"title": "Ops", "updated_by": "bob"}],
+                stats,
+            )
+        self.assertEqual(group_ids, {"Web": web, "Ops": ops})
+        self.assertEqual([group.title for group in groups.bulk_create.call_args.args[0]], ["Ops"])
+        self.assertEqual(groups.bulk_create.call_args.kwargs["unique_fields"], ["title"])
+
+        hosting, mail, dns, other = (uuid.uuid4() for _ in range(4))
+        with patch.object(Service, "objects") as services:
+            services.filter.return_value.values_list.side_effect = [
+                [(web, "Hosting", 1, None), (web, "Mail", 2, None), (web, "Other", 1, None)],
+                [(web, "Hosting", hosting), (web, "Mail", mail), (web, "DNS", dns), (web, "Other", other)],
+            ]
+            service_ids, changed = _upsert_services(
+                [
+                    {"group": "Web", "title": "Hosting", "sequence_number": 1},
+                    {"group": "Web", "title": "Mail", "sequence_number": 3},
+                    {"group": "Web", "title": "DNS"},
+                ],
+                group_ids,
+                stats,
+            )
+        self.assertEqual(service_ids, {("Web", "Hosting"): hosting, ("Web", "Mail"): mail, ("Web", "DNS"): dns})
+        self.assertEqual(changed, {mail, dns})
+        self.assertEqual([service.title for service in services.bulk_create.call_args.args[0]], ["Mail", "DNS"])
+        self.assertEqual(
+            dict(stats), {"groups_updated": 1, "services_updated": 1, "services_created": 1}
+        )
+
+        with patch.object(Service, "objects") as services, \
+                self.assertRaisesMessage(ValueError, "refers to unknown group 'Mail'"):
+            services.filter.return_value.values_list.return_value = []
+            _upsert_services([{"group": "Mail", "title": "Inbox"}], group_ids, stats)
+        services.bulk_create.assert_not_called()
+
+    def test_content_blocks_are_diffed_by_hash(self):
+        hosting, mail = uuid.uuid4(), uuid.uuid4()
+        kept, changed, duplicate, gone, same = (uuid.uuid4() for _ in range(5))
+        stats = Counter()
+        with patch.object(ServiceContent, "objects") as contents:
+            contents.filter.return_value.order_by.return_value.values_list.return_value = [
+                (kept, hosting, 1, ServiceContent.hash_content("Intro")),
+                (changed, hosting, 2, ServiceContent.hash_content("Old price")),
+                (duplicate, hosting, 2, ServiceContent.hash_content("Older price")),
+                (gone, hosting, 3, ServiceContent.hash_content("Gone")),
+                (same, mail, 1, ServiceContent.hash_content("Inbox")),
+            ]
+            sync = _ContentSync({("Web", "Hosting"): hosting, ("Web", "Mail"): mail}, set(), 10, stats)
+            for sequence_number, text in ((1, "Intro"), (2, "New price"), (4, "FAQ")):
+                sync.add({"group": "Web", "service": "Hosting", "sequence_number": sequence_number, "content": text})
+            sync.add({"group": "Web", "service": "Mail", "sequence_number": 1, "content": "Inbox"})
+            with self.assertRaisesMessage(ValueError, "more than one content block with sequence number 1"):
+                sync.add({"group": "Web", "service": "Mail", "sequence_number": 1, "content": "Inbox"})
+            sync.finish()
+
+        created = contents.bulk_create.call_args.args[0]
+        self.assertEqual([(block.sequence_number, block.content) for block in created], [(4, "FAQ")])
+        updated = contents.bulk_update.call_args.args[0]
+        self.assertEqual([(block.id, block.content) for block in updated], [(changed, "New price")])
+        self.assertEqual(contents.filter.call_args.kwargs, {"id__in": [duplicate, gone]})
+        self.assertEqual(sync.changed_service_ids, {hosting})
+        self.assertEqual(
+            dict(stats),
+            {"contents_unchanged": 2, "contents_created": 1, "contents_updated": 1, "contents_removed": 2},
+        )
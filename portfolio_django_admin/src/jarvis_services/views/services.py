@@ -1,19 +1,23 @@
 import logging
 
-from ninja import Router
+from ninja import Query, Router
 from uuid import UUID
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 
 from jarvis_services.schemas import (
     ServiceGroupInfoOut,
     ServiceOut,
+    ServiceSearchFilters,
+    ServiceSearchResultOut,
     ErrorMessage
 )
 
 from jarvis_services.services import (
-    get_service,
+    get_service_page,
     get_services_by_group,
-    get_all_service_groups,
+    get_service_catalog,
+    search_services,
 )
 
 router = Router(tags=["Services"], auth=None)
@@ -23,15 +27,27 @@ logger = logging.getLogger(__name__)
 # Service endpoints
 # ---------------------------------------------------------------------------
 
+def _service_page_response(request, page: dict) -> HttpResponse:
+    client_etags = [tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))]
+    if page["etag"].removeprefix("W/") in client_etags:
+        response = HttpResponseNotModified()
+    elif "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = HttpResponse(page["gzip"], content_type="application/json")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(page["body"], content_type="application/json")
+    response["ETag"] = page["etag"]
+    response["Vary"] = "Accept-Encoding"
+    return response
+
+
 @router.get("/service/{service_id}/", response={404: ErrorMessage, 200: ServiceOut})
 async def get_service_endpoint(request, service_id: UUID):
-    service = await get_service(service_id)
-    if not service:
+    # Pages are rendered when content is written, so a request is one cache read.
+    page = await get_service_page(service_id)
+    if not page:
         return 404, ErrorMessage(message="Service not found")
-    service = ServiceOut.from_orm(service)
-    if service.contents:
-        service.contents = sorted(service.contents, key=lambda c: c.sequence_number, reverse=False)
-    return service
+    return _service_page_response(request, page)
 
 @router.get("/group/{group_id}/", response={404: ErrorMessage, 200: ServiceGroupInfoOut})
 async def get_services_by_group_endpoint(request, group_id: UUID):
@@ -42,5 +58,10 @@ async def get_services_by_group_endpoint(request, group_id: UUID):
 
 @router.get("/groups/", response={200: list[ServiceGroupInfoOut]})
 async def get_all_service_groups_endpoint(request):
-    groups = await get_all_service_groups()
-    return groups
\ No newline at end of file
+    # The catalog is served as a cached, already serialized body.
+    return HttpResponse(await get_service_catalog(), content_type="application/json")
+
+
+@router.get("/search/", response={200: list[ServiceSearchResultOut]})
+async def search_services_endpoint(request, filters: Query[ServiceSearchFilters]):
+    return await search_services(filters.q, filters.limit)
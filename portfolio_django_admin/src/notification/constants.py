@@ -4,4 +4,6 @@ from enum import Enum
 class NotificationType(Enum):
     INVITATION = "invitation"
     ALERT = "alert"
-    
\ No newline at end of file
+
+
+NOTIFICATION_BULK_CREATE_BATCH_SIZE = 1000
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -9,4 +9,13 @@ class PublishUserNotificationDTO(BaseModel):
     description: Optional[str] = Field(None, description="Message content of the notification")
     image_url: Optional[str] = Field(None, description="URL of the image to be displayed in the notification")
     link_url: Optional[str] = Field(None, description="URL to navigate when the notification is clicked")
-    notification_type: Optional[str] = Field(None, description="Type of the notification, e.g. 'info', 'warning', 'error'")
\ No newline at end of file
+    notification_type: Optional[str] = Field(None, description="Type of the notification, e.g. 'info', 'warning', 'error'")
+
+
+class PublishBulkUserNotificationDTO(BaseModel):
+    user_ids: List[int] = Field(..., description="IDs of the users to receive the same notification")
+    title: str = Field(..., description="Title of the notification")
+    description: Optional[str] = Field(None, description="Message content of the notification")
+    image_url: Optional[str] = Field(None, description="URL of the image to be displayed in the notification")
+    link_url: Optional[str] = Field(None, description="URL to navigate when the notification is clicked")
+    notification_type: Optional[str] = Field(None, description="Type of the notification, e.g. 'info', 'warning', 'error'")
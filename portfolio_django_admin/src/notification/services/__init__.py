@@ -1,6 +1,7 @@
 from .notification_service import (
     get_user_id_by_username,
     create_notification,
+    create_notifications,
     get_user_notifications,
     get_user_unread_notifications,
     mark_notifications_as_read
@@ -9,6 +10,7 @@ from .notification_service import (
 __all__ = [
     "get_user_id_by_username",
     "create_notification",
+    "create_notifications",
     "get_user_notifications",
     "get_user_unread_notifications",
     "mark_notifications_as_read",
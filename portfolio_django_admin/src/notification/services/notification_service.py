@@ -1,5 +1,6 @@
 from notification.models import UserNotification
-from notification.dto import PublishUserNotificationDTO
+from notification.constants import NOTIFICATION_BULK_CREATE_BATCH_SIZE
+from notification.dto import PublishBulkUserNotificationDTO, PublishUserNotificationDTO
 from django.contrib.auth import get_user_model
 from django.core.paginator import Paginator
 from django.db.models import QuerySet
@@ -17,6 +18,22 @@ async def create_notification(dto: PublishUserNotificationDTO) -> UserNotificati
     )
 
 
+async def create_notifications(dto: PublishBulkUserNotificationDTO) -> int:
+    notifications = [
+        UserNotification(
+            user_id=user_id,
+            title=dto.title,
+            description=dto.description,
+            image_url=dto.image_url,
+            link_url=dto.link_url,
+            notification_type=dto.notification_type,
+        )
+        for user_id in dict.fromkeys(dto.user_ids)
+    ]
+    await UserNotification.objects.abulk_create(notifications, batch_size=NOTIFICATION_BULK_CREATE_BATCH_SIZE)
+    return len(notifications)
+
+
 async def get_user_id_by_username(username: str) -> int:
     try:
         return await get_user_model().objects.filter(username=username).values_list('id', flat=True).aget()
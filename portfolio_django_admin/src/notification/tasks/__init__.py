@@ -1,5 +1,6 @@
-from .process_notification import publish_notification
+from .process_notification import publish_bulk_notification, publish_notification
 
 __all__ = [
     'publish_notification',
+    'publish_bulk_notification',
 ]
\ No newline at end of file
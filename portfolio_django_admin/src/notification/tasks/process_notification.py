@@ -1,6 +1,6 @@
 from celery import shared_task
-from notification.dto import PublishUserNotificationDTO
-from notification.services.notification_service import create_notification
+from notification.dto import PublishBulkUserNotificationDTO, PublishUserNotificationDTO
+from notification.services.notification_service import create_notification, create_notifications
 
 import asyncio
 import logging
@@ -16,4 +16,13 @@ def publish_notification(notification_data: dict):
     notification = PublishUserNotificationDTO(**notification_data)
     logger.info(f"Publishing notification for user_id: {notification.user_id}, title: {notification.title}, description: {notification.description}, image_url: {notification.image_url}, link_url: {notification.link_url}, notification_type: {notification.notification_type}")
     asyncio.run(publish(notification))
-    logger.info(f"Notification saved for user_id: {notification.user_id}")
\ No newline at end of file
+    logger.info(f"Notification saved for user_id: {notification.user_id}")
+
+
+@shared_task(ignore_result=True)
+def publish_bulk_notification(notification_data: dict):
+    # One message for many recipients, saved with batched inserts.
+    notification = PublishBulkUserNotificationDTO(**notification_data)
+    logger.info(f"Publishing notification for {len(notification.user_ids)} user(s), title: {notification.title}, notification_type: {notification.notification_type}")
+    created = asyncio.run(create_notifications(notification))
+    logger.info(f"Notification saved for {created} user(s)")
\ No newline at end of file
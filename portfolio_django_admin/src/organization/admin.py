@@ -1,7 +1,8 @@
 from django.contrib import admin
-from .models import Organization, OrganizationUser, Device, DeviceConfiguration
+from .models import Organization, OrganizationUser, Device, DeviceConfiguration, ResourceProvisionJob
 
 admin.site.register(Organization)
 admin.site.register(OrganizationUser)
 admin.site.register(Device)
 admin.site.register(DeviceConfiguration)
+admin.site.register(ResourceProvisionJob)
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Tuple
 from uuid import UUID
 
 
@@ -24,6 +25,14 @@ class UserInvitationStatus(str, Enum):
     ACCEPTED = "accepted"
     DECLINED = "declined"
 
+class ProvisionJobStatus(str, Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+ACTIVE_PROVISION_JOB_STATUSES = [ProvisionJobStatus.PENDING.value, ProvisionJobStatus.IN_PROGRESS.value]
+
 class DeviceType(Enum):
     DESKTOP = "Desktop"
 
@@ -32,6 +41,41 @@ class DeviceDataType(Enum):
     CPU_AND_MEMORY_USAGE = "cpu_and_memory_usage"
     IO_DEVICE_USAGE = "io_device_usage"
 
+class DeviceEventType(str, Enum):
+    HEARTBEAT = "heartbeat"
+    UPLOAD = "upload"
+    PROCESSED = "processed"
+
+DEVICE_EVENT_FIELDS = {
+    DeviceEventType.HEARTBEAT.value: "last_heartbeat_at",
+    DeviceEventType.UPLOAD.value: "last_upload_at",
+    DeviceEventType.PROCESSED.value: "last_processed_at",
+}
+MAX_DEVICE_EVENTS_PER_BATCH = 100
+
+DEFAULT_DEVICE_PAGE_SIZE = 50
+MAX_DEVICE_PAGE_SIZE = 200
+
+DEFAULT_ORGANIZATION_USER_PAGE_SIZE = 50
+MAX_ORGANIZATION_USER_PAGE_SIZE = 200
+
+DEVICE_IMPORT_CHUNK_SIZE = 500
+DEVICE_CONFIGURATION_BULK_CHUNK_SIZE = 1000
+MAX_DEVICE_IMPORT_ROWS = 10000
+MAX_DEVICE_IMPORT_CSV_BYTES = 5 * 1024 * 1024
+
+ORGANIZATION_PURGE_BATCH_SIZE = 1000
+ORGANIZATION_PURGE_SWEEP_LIMIT = 100
+
+# Parts of an organization with their own change version, so that writes to one
+# part do not invalidate cached reads of another.
+class OrganizationVersionScope(str, Enum):
+    # Organization details and memberships
+    ORGANIZATION = "organization"
+    # Devices and their configurations
+    DEVICES = "devices"
+
+
 class OsType(str, Enum):
     WINDOWS = "Windows"
     UBUNTU = "Ubuntu"
@@ -45,7 +89,32 @@ class OsVersion(str, Enum):
 
 CACHE_KEY_PREFIX = "org_role_cache"
 CACHE_TIMEOUT = 86400  # 24 hours
+DEVICE_REVOCATION_VERSION_CACHE_KEY = "device_token_revocations__version"
+ORG_VERSION_CACHE_KEY_PREFIX = "org_version"
+# Writes made outside the services (e.g. Django admin) do not bump the version,
+# so it is regenerated after this timeout at the latest.
+ORG_VERSION_CACHE_TIMEOUT = 900
+FLEET_SUMMARY_CACHE_KEY_PREFIX = "fleet_summary"
+RESOURCE_CACHE_KEY_PREFIX = "org_resource"
+RESOURCE_GENERATION_CACHE_KEY_PREFIX = "org_resource_generation"
+RESOURCE_GENERATION_CACHE_TIMEOUT = 86400
 
 
 def build_cache_key(organization_id: UUID, username: str) -> str:
     return f"{CACHE_KEY_PREFIX}__{organization_id}__{username}"
+
+
+def build_org_version_cache_key(organization_id: UUID, scope: OrganizationVersionScope) -> str:
+    return f"{ORG_VERSION_CACHE_KEY_PREFIX}__{organization_id}__{scope.value}"
+
+
+def build_fleet_summary_cache_key(organization_id: UUID, versions: Tuple[int, ...]) -> str:
+    return f"{FLEET_SUMMARY_CACHE_KEY_PREFIX}__{organization_id}__{'_'.join(map(str, versions))}"
+
+
+def build_resource_generation_cache_key(organization_id: str) -> str:
+    return f"{RESOURCE_GENERATION_CACHE_KEY_PREFIX}__{organization_id}"
+
+
+def build_resource_cache_key(organization_id: str, generation: int, subject: str) -> str:
+    return f"{RESOURCE_CACHE_KEY_PREFIX}__{organization_id}__{generation}__{subject}"
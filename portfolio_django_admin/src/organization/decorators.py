@@ -1,10 +1,16 @@
 from functools import wraps
 import asyncio
-from typing import List, Union
+import hashlib
+import inspect
+import time
+from typing import List, Optional, Union
 from uuid import UUID
 from authentication.constants import OrganizationRoleType
+from organization.constants import OrganizationVersionScope
 from django.core.cache import cache
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
+from django.http.response import HttpResponseBase
+from django.utils.http import parse_etags
 
 
 def is_function_async(func):
@@ -116,3 +122,51 @@ def require_org_roles(allowed_roles: Union[OrganizationRoleType, List[Organizati
 
         return wrapper
     return decorator
+
+
+def etag_org_version(*scopes: OrganizationVersionScope, max_age_seconds: Optional[float] = None):
+    """
+    Decorator adding a weak ETag to an async GET view of an organization. The ETag is
+    derived from the change versions of the given scopes and the request path, so a
+    request with a matching ``If-None-Match`` header gets a 304 without calling the view.
+    With ``max_age_seconds`` the ETag also changes every that many seconds, for views
+    showing data that is written too often to be versioned, like device heartbeats.
+    Apply it below ``require_org_roles`` so that access is still checked.
+    Results still go through ninja's response validation: the ETag is set on ninja's
+    temporal response, or on the response itself when the view returns an HttpResponse.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(request, org_id: UUID, *args, etag_response: HttpResponse = None, **kwargs):
+            from organization.services.change_version import get_organization_versions
+
+            versions = get_organization_versions(org_id, scopes)
+            window = int(time.time() // max_age_seconds) if max_age_seconds else None
+            digest = hashlib.sha256(f"{versions}:{window}:{request.get_full_path()}".encode()).hexdigest()[:32]
+            etag = f'W/"{digest}"'
+
+            if_none_match = request.headers.get("If-None-Match")
+            if if_none_match:
+                client_etags = [tag.removeprefix("W/") for tag in parse_etags(if_none_match)]
+                if "*" in client_etags or etag.removeprefix("W/") in client_etags:
+                    response = HttpResponseNotModified()
+                    response["ETag"] = etag
+                    return response
+
+            result = await func(request, org_id, *args, **kwargs)
+            if isinstance(result, HttpResponseBase):
+                response, status = result, result.status_code
+            else:
+                response, status = etag_response, result[0] if isinstance(result, tuple) and len(result) == 2 else 200
+            if status == 200 and response is not None:
+                response["ETag"] = etag
+            return result
+
+        # ninja passes its temporal response to a parameter annotated with HttpResponse.
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("etag_response", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=HttpResponse),
+        ])
+        return wrapper
+    return decorator
@@ -0,0 +1,69 @@
+import time
+import uuid
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from ninja.renderers import JSONRenderer
+
+from organization.schemas import DeviceOut, DevicePageOut, serialize_device
+from portfolio_django_admin.renderers import ORJSONRenderer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare serializing a page of devices through DeviceOut, ninja response validation and "
+        "the json renderer with building the response from values() rows and rendering with orjson."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--devices", type=int, default=10000)
+        parser.add_argument("--rounds", type=int, default=5)
+
+    def handle(self, *args, **kwargs):
+        organization_id = uuid.uuid4()
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "organization_id": organization_id,
+                "name": f"device-{i}",
+                "description": "Build agent in the office",
+                "device_type": "Desktop",
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+                "last_heartbeat_at": now,
+                "last_upload_at": now,
+                "last_processed_at": None,
+                "os_type": "Ubuntu",
+                "os_version": "24",
+                "script_downloaded_at": None,
+                "script_downloaded_by": None,
+            }
+            for i in range(kwargs["devices"])
+        ]
+
+        def schema_path():
+            page = DevicePageOut(items=[DeviceOut(**row) for row in rows], next_cursor=None)
+            # What ninja does with the returned value before rendering it.
+            data = DevicePageOut.model_validate(page.model_dump()).model_dump()
+            return JSONRenderer().render(None, data, response_status=200)
+
+        def fast_path():
+            data = {"items": [serialize_device(row) for row in rows], "next_cursor": None}
+            return ORJSONRenderer().render(None, data, response_status=200)
+
+        before = self.__measure(schema_path, kwargs["rounds"])
+        after = self.__measure(fast_path, kwargs["rounds"])
+        self.stdout.write(self.style.SUCCESS(
+            f"{kwargs['devices']} devices: DeviceOut + json {before:.1f} ms, "
+            f"values() rows + orjson {after:.1f} ms ({before / after:.1f}x faster)"
+        ))
+
+    def __measure(self, func, rounds: int) -> float:
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
@@ -0,0 +1,84 @@
+import asyncio
+import statistics
+import time
+from unittest.mock import patch
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from organization.models import Device
+from organization.services.gateway import CircuitBreaker, GatewayClientPool
+from organization.services.resources import resource_cache
+from organization.views.devices import fetch_installation_details
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the latency of the installation-details endpoint for an existing device "
+        "against an in-process Jarvis gateway stub with a fixed response delay."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("device_id", type=str, help="ID of an existing device of a paid organization.")
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--gateway-latency-ms", type=float, default=80.0)
+        parser.add_argument(
+            "--resource-cache",
+            action="store_true",
+            help="Keep the organization resource cache warm instead of clearing it before every request.",
+        )
+
+    def handle(self, *args, **kwargs):
+        try:
+            device = Device.objects.get(id=kwargs["device_id"])
+        except (Device.DoesNotExist, ValueError):
+            raise CommandError(f"Device '{kwargs['device_id']}' does not exist.")
+
+        latencies = asyncio.run(self.__run(device, kwargs))
+        latencies.sort()
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(latencies)} requests, gateway latency {kwargs['gateway_latency_ms']:.0f} ms: "
+            f"mean {statistics.mean(latencies):.1f} ms, "
+            f"p50 {latencies[len(latencies) // 2]:.1f} ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95) - 1]:.1f} ms"
+        ))
+
+    async def __run(self, device: Device, options: dict) -> list:
+        delay = options["gateway_latency_ms"] / 1000
+
+        async def gateway(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(delay)
+            return httpx.Response(200, json={
+                "organization_id": str(device.organization_id),
+                "name": "benchmark",
+                "is_active": True,
+                "indices": [{
+                    "name": "user_access",
+                    "major_version": 1,
+                    "minor_version": 0,
+                    "patch_version": 0,
+                    "last_attempted_provisioned_at": "2026-01-01T00:00:00Z",
+                    "provision_status": "completed",
+                }],
+            })
+
+        pool = GatewayClientPool("http://gateway", timeout=10, max_connections=10, transport=httpx.MockTransport(gateway))
+        breaker = CircuitBreaker(failure_threshold=1000, reset_timeout=0)
+        # The role check is skipped, only the endpoint itself is measured.
+        view = fetch_installation_details.__wrapped__
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION="Bearer benchmark")
+
+        latencies = []
+        with patch("organization.services.gateway.gateway_pool", pool), \
+                patch("organization.services.gateway.gateway_breaker", breaker):
+            for _ in range(options["iterations"]):
+                if not options["resource_cache"]:
+                    resource_cache.invalidate(str(device.organization_id))
+                started = time.perf_counter()
+                response = await view(request, device.organization_id, device.id)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if isinstance(response, tuple) and response[0] != 200:
+                    raise CommandError(f"Endpoint returned {response[0]}: {response[1]}")
+            await pool.aclose()
+        return latencies
@@ -0,0 +1,61 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from organization.constants import DEVICE_IMPORT_CHUNK_SIZE
+from organization.models import Organization
+from organization.services.device_import import import_devices_sync, parse_device_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Create devices of an organization from a CSV file (streamed row by row) or a JSON array. "
+        "Rows that fail validation or whose name is taken are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("organization_id", type=str)
+        parser.add_argument("path", type=str, help="CSV or JSON file, or '-' to read CSV from stdin.")
+        parser.add_argument("--format", choices=["csv", "json"], default=None, help="Defaults to the file extension.")
+        parser.add_argument("--chunk-size", type=int, default=DEVICE_IMPORT_CHUNK_SIZE)
+        parser.add_argument("--updated-by", type=str, default=None)
+        parser.add_argument("--max-errors", type=int, default=20, help="Number of rejected rows to print.")
+
+    def handle(self, *args, **kwargs):
+        organization_id = kwargs["organization_id"]
+        try:
+            if not Organization.objects.filter(id=organization_id).exists():
+                raise CommandError(f"Organization '{organization_id}' does not exist.")
+        except ValueError:
+            raise CommandError(f"'{organization_id}' is not a valid organization ID.")
+
+        path = kwargs["path"]
+        file_format = kwargs["format"] or ("json" if path.endswith(".json") else "csv")
+        stream = sys.stdin if path == "-" else Path(path).open(encoding="utf-8-sig", newline="")
+        try:
+            rows = json.load(stream) if file_format == "json" else parse_device_csv(stream)
+            if file_format == "json" and not isinstance(rows, list):
+                raise CommandError("A JSON import must be an array of devices.")
+
+            started = time.perf_counter()
+            created, errors = import_devices_sync(
+                organization_id, rows, updated_by=kwargs["updated_by"], chunk_size=kwargs["chunk_size"]
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for error in errors[:kwargs["max_errors"]]:
+            self.stderr.write(f"Row {error['row']} ({error['name']}): {error['message']}")
+        if len(errors) > kwargs["max_errors"]:
+            self.stderr.write(f"... and {len(errors) - kwargs['max_errors']} more rejected row(s).")
+
+        rows_read = created + len(errors)
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created} device(s), rejected {len(errors)} of {rows_read} row(s) in {elapsed:.2f} s "
+            f"({rows_read / elapsed if elapsed else 0:,.0f} rows/s)."
+        ))
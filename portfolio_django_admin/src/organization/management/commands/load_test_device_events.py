@@ -0,0 +1,82 @@
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.services.auth import create_device_access_token
+from organization.constants import DeviceEventType
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate devices reporting batched events to the device-events endpoint of a running "
+        "server. Every device reports once per interval, at a random offset within it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("organization_id", type=str, help="Organization the simulated devices belong to.")
+        parser.add_argument("--url", type=str, default="http://localhost:8000/api/organization/v1/device-events/")
+        parser.add_argument("--devices", type=int, default=5000)
+        parser.add_argument("--interval", type=float, default=60.0, help="Seconds between reports of a device.")
+        parser.add_argument("--duration", type=float, default=120.0)
+        parser.add_argument("--events-per-batch", type=int, default=3)
+        parser.add_argument("--max-connections", type=int, default=200)
+
+    def handle(self, *args, **kwargs):
+        tokens = [
+            create_device_access_token(
+                device_id=f"load-test-{i}",
+                organization_id=kwargs["organization_id"],
+                device_type="Desktop",
+                elastic_indices=[],
+            )
+            for i in range(kwargs["devices"])
+        ]
+        latencies, errors, elapsed = asyncio.run(self.__run(tokens, kwargs))
+        if not latencies:
+            raise CommandError(f"No request succeeded ({errors} errors).")
+
+        latencies.sort()
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(latencies)} batches in {elapsed:.0f} s ({len(latencies) / elapsed:,.0f} req/s, "
+            f"target {kwargs['devices'] / kwargs['interval']:,.0f} req/s), {errors} errors; "
+            f"latency p50 {latencies[len(latencies) // 2]:.1f} ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95) - 1]:.1f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.1f} ms, "
+            f"mean {statistics.mean(latencies):.1f} ms"
+        ))
+
+    async def __run(self, tokens: list, options: dict):
+        latencies = []
+        errors = 0
+        event_types = [event_type.value for event_type in DeviceEventType]
+        limits = httpx.Limits(max_connections=options["max_connections"], max_keepalive_connections=options["max_connections"])
+        started = time.monotonic()
+        deadline = started + options["duration"]
+
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            async def report(token: str):
+                nonlocal errors
+                await asyncio.sleep(random.uniform(0, options["interval"]))
+                while time.monotonic() < deadline:
+                    events = [{"type": random.choice(event_types)} for _ in range(options["events_per_batch"])]
+                    sent = time.perf_counter()
+                    try:
+                        response = await client.post(
+                            options["url"],
+                            json={"events": events},
+                            headers={"Authorization": f"Bearer {token}"},
+                        )
+                        if response.status_code == 202:
+                            latencies.append((time.perf_counter() - sent) * 1000)
+                        else:
+                            errors += 1
+                    except httpx.HTTPError:
+                        errors += 1
+                    await asyncio.sleep(options["interval"])
+
+            await asyncio.gather(*[report(token) for token in tokens])
+        return latencies, errors, min(time.monotonic(), deadline) - started
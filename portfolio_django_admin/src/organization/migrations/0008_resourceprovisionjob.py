@@ -0,0 +1,33 @@
+# Generated by Django 5.1 on 2026-10-19 17:25
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0007_device_last_processed_at_device_last_upload_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResourceProvisionJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'PENDING'), ('in_progress', 'IN_PROGRESS'), ('completed', 'COMPLETED'), ('failed', 'FAILED')], db_index=True, default='pending', max_length=20)),
+                ('requested_by', models.CharField(max_length=255)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='provision_jobs', to='organization.organization')),
+            ],
+            options={
+                'db_table': 'resource_provision_jobs',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'in_progress'])), fields=('organization',), name='unique_active_provision_job')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-19 17:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0008_resourceprovisionjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedDeviceToken',
+            fields=[
+                ('digest', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'revoked_device_tokens',
+            },
+        ),
+    ]
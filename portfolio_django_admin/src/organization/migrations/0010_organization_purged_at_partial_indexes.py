@@ -0,0 +1,26 @@
+# Generated by Django 5.1 on 2026-10-19 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0009_revokeddevicetoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='purged_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(condition=models.Q(('status', 'deleted'), _negated=True), fields=['id'], name='organizations_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(condition=models.Q(('purged_at__isnull', True), ('status', 'deleted')), fields=['updated_at'], name='organizations_purge_idx'),
+        ),
+    ]
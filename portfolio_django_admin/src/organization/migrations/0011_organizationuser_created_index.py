@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-10-19 18:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0010_organization_purged_at_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organizationuser',
+            index=models.Index(fields=['organization', 'created_at', 'id'], name='organization_users_created_idx'),
+        ),
+    ]
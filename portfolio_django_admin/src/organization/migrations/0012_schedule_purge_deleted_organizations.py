@@ -0,0 +1,36 @@
+from django.db import migrations
+from django.utils import timezone
+
+TASK_NAME = "Purge deleted organizations"
+TASK = "organization.tasks.purge_deleted_organizations.purge_deleted_organizations"
+
+
+def schedule_purge_sweep(apps, schema_editor):
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTasks = apps.get_model("django_celery_beat", "PeriodicTasks")
+
+    schedule, _ = IntervalSchedule.objects.get_or_create(every=1, period="hours")
+    PeriodicTask.objects.get_or_create(name=TASK_NAME, defaults={"task": TASK, "interval": schedule})
+    # Historical models send no signals, so the scheduler is told about the change here.
+    PeriodicTasks.objects.update_or_create(ident=1, defaults={"last_update": timezone.now()})
+
+
+def unschedule_purge_sweep(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTasks = apps.get_model("django_celery_beat", "PeriodicTasks")
+
+    PeriodicTask.objects.filter(name=TASK_NAME).delete()
+    PeriodicTasks.objects.update_or_create(ident=1, defaults={"last_update": timezone.now()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0011_organizationuser_created_index'),
+        ('django_celery_beat', '0019_alter_periodictasks_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_purge_sweep, unschedule_purge_sweep),
+    ]
@@ -5,13 +5,18 @@ from .organization import (
 
 from .devices import (
     Device,
-    DeviceConfiguration
+    DeviceConfiguration,
+    RevokedDeviceToken
 )
 
+from .resources import ResourceProvisionJob
+
 
 __all__ = [
     'Organization',
     'OrganizationUser',
     'Device',
-    'DeviceConfiguration'
+    'DeviceConfiguration',
+    'RevokedDeviceToken',
+    'ResourceProvisionJob'
 ]
\ No newline at end of file
@@ -62,3 +62,15 @@ class DeviceConfiguration(models.Model):
         db_table = 'device_configurations'
 
 
+
+
+class RevokedDeviceToken(models.Model):
+    """
+    SHA-256 digest of a device access token that must no longer be accepted,
+    because its device was deactivated, removed or issued a new token.
+    """
+    digest = models.CharField(max_length=64, primary_key=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'revoked_device_tokens'
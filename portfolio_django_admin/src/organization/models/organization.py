@@ -30,9 +30,25 @@ class Organization(models.Model):
     last_payment_method = models.CharField(max_length=20, 
                                         choices=[(method.value, method.name) for method in PaymentMethod],
                                         null=True, blank=True)
+    # Set once the devices and memberships of a deleted organization have been removed.
+    purged_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = 'organizations'
+        indexes = [
+            # Joins that exclude deleted organizations only visit live rows.
+            models.Index(
+                fields=['id'],
+                condition=~models.Q(status=OrganizationStatus.DELETED.value),
+                name='organizations_live_idx',
+            ),
+            # Deleted organizations still waiting for purge_deleted_organizations.
+            models.Index(
+                fields=['updated_at'],
+                condition=models.Q(status=OrganizationStatus.DELETED.value, purged_at__isnull=True),
+                name='organizations_purge_idx',
+            ),
+        ]
         
 
     def __str__(self):
@@ -73,6 +89,10 @@ class OrganizationUser(models.Model):
     class Meta:
         unique_together = ('organization', 'user')
         db_table = 'organization_users'
+        indexes = [
+            # Member pages of an organization, in list_organization_users order.
+            models.Index(fields=['organization', 'created_at', 'id'], name='organization_users_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.organization.name} - {self.user.username} - {self.role}"
@@ -0,0 +1,41 @@
+from django.db import models
+import uuid
+
+from organization.constants import ProvisionJobStatus, ACTIVE_PROVISION_JOB_STATUSES
+from .organization import Organization
+
+
+class ResourceProvisionJob(models.Model):
+    """
+    A provisioning request for the Elastic indices of an organization. The gateway
+    is called and polled by the ``provision_organization_resource`` task.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name='provision_jobs')
+    status = models.CharField(
+        max_length=20,
+        choices=[(status.value, status.name) for status in ProvisionJobStatus],
+        default=ProvisionJobStatus.PENDING.value,
+        db_index=True
+    )
+    requested_by = models.CharField(max_length=255)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'resource_provision_jobs'
+        constraints = [
+            # At most one provisioning run per organization at a time.
+            models.UniqueConstraint(
+                fields=['organization'],
+                condition=models.Q(status__in=ACTIVE_PROVISION_JOB_STATUSES),
+                name='unique_active_provision_job',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.organization_id} - {self.status}"
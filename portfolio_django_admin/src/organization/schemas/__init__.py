@@ -6,6 +6,8 @@ from .organization import (
     OrganizationUserIn,
     OrganizationUserUpdateIn,
     OrganizationUserOut,
+    OrganizationUserListFilters,
+    OrganizationUserPageOut,
     OrganizationInvitationOut,
     OrganizationLeaveOut,
     OrganizationInvitationResponseIn,
@@ -15,18 +17,35 @@ from .organization import (
 from .devices import (
     DeviceIn,
     DeviceUpdate,
+    DeviceImportIn,
+    DeviceImportBatchIn,
+    DeviceImportErrorOut,
+    DeviceImportOut,
     DeviceOut,
+    DEVICE_OUT_FIELDS,
+    serialize_device,
+    DeviceListFilters,
+    DevicePageOut,
     DeviceDetailOut,
     DeviceConfigurationIn,
     DeviceConfigurationOut,
+    DeviceConfigurationBulkIn,
+    DeviceConfigurationBulkOut,
     DeviceConnectionStatusOut,
-    DeviceInstallationDetailsOut
+    FleetConnectionCountsOut,
+    LagPercentilesOut,
+    FleetSummaryOut,
+    DeviceInstallationDetailsOut,
+    DeviceEventIn,
+    DeviceEventBatchIn,
+    DeviceEventBatchOut,
 )
 
 from .resources import (
     ManageResourceDto,
     ResourceIndexDto,
     ResourceDto,
+    ResourceProvisionJobOut,
 )
 
 __all__ = [
@@ -37,19 +56,38 @@ __all__ = [
     "OrganizationUserIn",
     "OrganizationUserUpdateIn",
     "OrganizationUserOut",
+    "OrganizationUserListFilters",
+    "OrganizationUserPageOut",
     "OrganizationInvitationOut",
     "OrganizationLeaveOut",
     "OrganizationInvitationResponseIn",
     "ErrorMessage",
     "DeviceIn",
     "DeviceUpdate",
+    "DeviceImportIn",
+    "DeviceImportBatchIn",
+    "DeviceImportErrorOut",
+    "DeviceImportOut",
     "DeviceOut",
+    "DEVICE_OUT_FIELDS",
+    "serialize_device",
+    "DeviceListFilters",
+    "DevicePageOut",
     "DeviceDetailOut",
     "DeviceConfigurationIn",
     "DeviceConfigurationOut",
+    "DeviceConfigurationBulkIn",
+    "DeviceConfigurationBulkOut",
     "DeviceConnectionStatusOut",
+    "FleetConnectionCountsOut",
+    "LagPercentilesOut",
+    "FleetSummaryOut",
     "DeviceInstallationDetailsOut",
+    "DeviceEventIn",
+    "DeviceEventBatchIn",
+    "DeviceEventBatchOut",
     "ManageResourceDto",
     "ResourceIndexDto",
     "ResourceDto",
+    "ResourceProvisionJobOut",
 ]
\ No newline at end of file
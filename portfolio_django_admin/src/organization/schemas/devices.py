@@ -1,9 +1,21 @@
 from ninja import Schema
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Union
 from uuid import UUID
 from datetime import datetime
 
-from organization.constants import DeviceType, DeviceDataType, OsType, OsVersion
+from pydantic import Field
+
+from organization.constants import (
+    DeviceType,
+    DeviceDataType,
+    DeviceEventType,
+    OsType,
+    OsVersion,
+    MAX_DEVICE_EVENTS_PER_BATCH,
+    DEFAULT_DEVICE_PAGE_SIZE,
+    MAX_DEVICE_PAGE_SIZE,
+    MAX_DEVICE_IMPORT_ROWS,
+)
 
 
 class DeviceIn(Schema):
@@ -20,6 +32,28 @@ class DeviceUpdate(Schema):
     os_version: Optional[OsVersion] = None
 
 
+class DeviceImportIn(DeviceIn):
+    name: str = Field(..., min_length=1, max_length=255)
+    configurations: List[DeviceDataType] = []
+
+
+class DeviceImportBatchIn(Schema):
+    # Rows are validated against DeviceImportIn one by one during the import, so that an
+    # invalid row is reported with its number instead of rejecting the whole batch.
+    devices: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_DEVICE_IMPORT_ROWS)
+
+
+class DeviceImportErrorOut(Schema):
+    row: int
+    name: Optional[str] = None
+    message: str
+
+
+class DeviceImportOut(Schema):
+    created: int
+    errors: List[DeviceImportErrorOut]
+
+
 class DeviceConfigurationOut(Schema):
     id: UUID
     device_id: UUID
@@ -47,6 +81,35 @@ class DeviceOut(Schema):
     configurations: List[DeviceConfigurationOut] = []
 
 
+# Fields of DeviceOut that are read straight from a Device row.
+DEVICE_OUT_FIELDS = tuple(field for field in DeviceOut.model_fields if field != "configurations")
+
+
+def serialize_device(device: Union[Any, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the DeviceOut representation of a Device instance or a ``values(*DEVICE_OUT_FIELDS)`` row.
+    """
+    if isinstance(device, dict):
+        data = {field: device[field] for field in DEVICE_OUT_FIELDS}
+    else:
+        data = {field: getattr(device, field) for field in DEVICE_OUT_FIELDS}
+    data["configurations"] = []
+    return data
+
+
+class DeviceListFilters(Schema):
+    cursor: Optional[str] = None
+    limit: int = Field(DEFAULT_DEVICE_PAGE_SIZE, ge=1, le=MAX_DEVICE_PAGE_SIZE)
+    is_active: Optional[bool] = None
+    os_type: Optional[OsType] = None
+    stale_since: Optional[datetime] = Field(None, description="Only devices without a heartbeat since this time")
+
+
+class DevicePageOut(Schema):
+    items: List[DeviceOut]
+    next_cursor: Optional[str] = None
+
+
 class DeviceDetailOut(DeviceOut):
     configurations: List["DeviceConfigurationOut"] = []
 
@@ -55,6 +118,21 @@ class DeviceConfigurationIn(Schema):
     data_type: DeviceDataType
 
 
+class DeviceConfigurationBulkIn(Schema):
+    data_types: List[DeviceDataType] = Field(..., min_length=1)
+    device_ids: Optional[List[UUID]] = Field(
+        None, max_length=MAX_DEVICE_IMPORT_ROWS, description="Devices to change. All devices matching the filters when omitted."
+    )
+    is_active: Optional[bool] = None
+    os_type: Optional[OsType] = None
+    all: bool = Field(False, description="Change every device of the organization. Required when no devices or filters are given.")
+
+
+class DeviceConfigurationBulkOut(Schema):
+    devices: Optional[int] = Field(None, description="Devices selected for the assignment")
+    removed: Optional[int] = Field(None, description="Configurations removed")
+
+
 class DeviceConnectionStatusOut(Schema):
     device_id: UUID
     is_active: bool
@@ -62,9 +140,45 @@ class DeviceConnectionStatusOut(Schema):
     last_upload_at: Optional[datetime] = None
     last_processed_at: Optional[datetime] = None
 
+
+class FleetConnectionCountsOut(Schema):
+    online: int
+    stale: int
+    never_connected: int
+
+
+class LagPercentilesOut(Schema):
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+
+
+class FleetSummaryOut(Schema):
+    total: int
+    inactive: int
+    connection: FleetConnectionCountsOut = Field(..., description="Active devices by heartbeat recency")
+    os_type: Dict[str, int]
+    device_type: Dict[str, int]
+    upload_lag_seconds: LagPercentilesOut
+    processed_lag_seconds: LagPercentilesOut
+    online_window_seconds: int
+    generated_at: datetime
+
 class DeviceInstallationDetailsOut(Schema):
     api_key: str
     organization_id: UUID
     device_id: UUID
     device_name: str
     message: Optional[str] = None
+
+
+class DeviceEventIn(Schema):
+    type: DeviceEventType
+    occurred_at: Optional[datetime] = None
+
+
+class DeviceEventBatchIn(Schema):
+    events: List[DeviceEventIn] = Field(..., min_length=1, max_length=MAX_DEVICE_EVENTS_PER_BATCH)
+
+
+class DeviceEventBatchOut(Schema):
+    accepted: int
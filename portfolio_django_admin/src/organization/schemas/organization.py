@@ -1,8 +1,14 @@
 from ninja import Schema
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
+from pydantic import Field
 from authentication.constants import OrganizationRoleType
+from organization.constants import (
+    DEFAULT_ORGANIZATION_USER_PAGE_SIZE,
+    MAX_ORGANIZATION_USER_PAGE_SIZE,
+    UserInvitationStatus,
+)
 
 
 class OrganizationIn(Schema):
@@ -51,6 +57,18 @@ class OrganizationUserOut(Schema):
     updated_at: datetime
     invitation_status: str
 
+
+class OrganizationUserListFilters(Schema):
+    cursor: Optional[str] = None
+    limit: int = Field(DEFAULT_ORGANIZATION_USER_PAGE_SIZE, ge=1, le=MAX_ORGANIZATION_USER_PAGE_SIZE)
+    role: Optional[OrganizationRoleType] = None
+    invitation_status: Optional[UserInvitationStatus] = None
+
+
+class OrganizationUserPageOut(Schema):
+    items: List[OrganizationUserOut]
+    next_cursor: Optional[str] = None
+
 class OrganizationInvitationOut(Schema):
     id: UUID
     organization_id: UUID
@@ -1,5 +1,8 @@
+from ninja import Schema
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from uuid import UUID
+from datetime import datetime
 
 class ManageResourceDto(BaseModel):
     """
@@ -27,4 +30,15 @@ class ResourceDto(BaseModel):
     organization_id: str = Field(..., description="ID of the organization")
     name: str = Field(..., description="Name of the organization")
     is_active: bool = Field(..., description="Whether the organization is active")
-    indices: List[ResourceIndexDto] = Field(default_factory=list, description="List of indices associated with the organization")
\ No newline at end of file
+    indices: List[ResourceIndexDto] = Field(default_factory=list, description="List of indices associated with the organization")
+
+class ResourceProvisionJobOut(Schema):
+    id: UUID
+    organization_id: UUID
+    status: str
+    requested_by: str
+    attempts: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
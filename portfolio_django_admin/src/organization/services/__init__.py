@@ -31,10 +31,27 @@ from .devices import (
     remove_device,
     add_device_configuration,
     remove_device_configuration,
+    assign_device_configurations,
+    remove_device_configurations,
     get_device_connection_status,
+    get_installation_device,
     generate_device_access_token,
 )
 
+from .fleet import get_fleet_summary
+
+from .device_import import import_devices, parse_device_csv, read_device_csv
+
+from .provisioning import (
+    start_resource_provision_job,
+    get_resource_provision_job,
+)
+
+from .device_auth import (
+    DeviceAuthBearer,
+    revoke_device_tokens,
+)
+
 from .resources import ResourceService
 
 __all__ = [
@@ -64,8 +81,19 @@ __all__ = [
     "remove_device",
     "add_device_configuration",
     "remove_device_configuration",
+    "assign_device_configurations",
+    "remove_device_configurations",
     "get_device_connection_status",
+    "get_installation_device",
     "generate_device_access_token",
+    "get_fleet_summary",
+    "import_devices",
+    "parse_device_csv",
+    "read_device_csv",
+    "start_resource_provision_job",
+    "get_resource_provision_job",
+    "DeviceAuthBearer",
+    "revoke_device_tokens",
 
     "ResourceService",
 ]
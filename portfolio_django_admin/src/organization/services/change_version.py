@@ -0,0 +1,36 @@
+import time
+
+from django.core.cache import cache
+from typing import Iterable, Tuple
+from uuid import UUID
+
+from organization.constants import ORG_VERSION_CACHE_TIMEOUT, OrganizationVersionScope, build_org_version_cache_key
+
+
+def get_organization_version(org_id: UUID, scope: OrganizationVersionScope) -> int:
+    """
+    Returns the change version of one part of an organization, see OrganizationVersionScope.
+    A new version is generated when none is cached.
+    """
+    key = build_org_version_cache_key(org_id, scope)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(key, version, ORG_VERSION_CACHE_TIMEOUT):
+            version = cache.get(key, version)
+    return version
+
+
+def get_organization_versions(org_id: UUID, scopes: Iterable[OrganizationVersionScope]) -> Tuple[int, ...]:
+    return tuple(get_organization_version(org_id, scope) for scope in scopes)
+
+
+def bump_organization_versions(org_ids: Iterable[UUID], *scopes: OrganizationVersionScope) -> None:
+    """
+    Marks the given parts of organizations as changed. Their next read generates a new version.
+    """
+    cache.delete_many([build_org_version_cache_key(org_id, scope) for org_id in org_ids for scope in scopes])
+
+
+def bump_organization_version(org_id: UUID, *scopes: OrganizationVersionScope) -> None:
+    bump_organization_versions([org_id], *scopes)
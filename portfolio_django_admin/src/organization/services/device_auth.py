@@ -0,0 +1,138 @@
+import hashlib
+import logging
+import time
+
+from collections import OrderedDict
+from django.core.cache import cache
+from jose import JWTError
+from ninja.security import HttpBearer
+from typing import Iterable, Optional
+
+import portfolio_django_admin.constants as constants
+from authentication.services.auth import decode_token
+from organization.constants import DEVICE_REVOCATION_VERSION_CACHE_KEY
+from organization.models import RevokedDeviceToken
+
+logger = logging.getLogger(__name__)
+
+
+def get_device_token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class DeviceTokenVerifier:
+    """
+    Verifies device access tokens without touching the database on the happy path.
+
+    Signatures are checked locally and verified claims are kept in a bounded LRU, so
+    repeated calls from the same device cost a hash and two set/dict lookups. Revoked
+    tokens are held as a set of SHA-256 digests; every ``sync_interval`` seconds the
+    revocation version in the cache is compared with the local one and the set is
+    reloaded from ``RevokedDeviceToken`` only when it changed.
+    """
+
+    def __init__(self, sync_interval: float, max_entries: int):
+        self.sync_interval = sync_interval
+        self.max_entries = max_entries
+        self._revoked: set[bytes] = set()
+        self._verified: "OrderedDict[str, dict]" = OrderedDict()
+        self._version = None
+        self._synced_at: Optional[float] = None
+
+    def is_sync_due(self) -> bool:
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_interval
+
+    async def sync(self, force: bool = False) -> None:
+        if not force and not self.is_sync_due():
+            return
+        version = cache.get(DEVICE_REVOCATION_VERSION_CACHE_KEY)
+        if force or self._synced_at is None or version != self._version:
+            digests = [digest async for digest in RevokedDeviceToken.objects.values_list("digest", flat=True)]
+            self.load_revocations(digests, version)
+            logger.info("Loaded %s revoked device token(s) (version %s).", len(digests), version)
+        self._synced_at = time.monotonic()
+
+    def load_revocations(self, digests: Iterable[str], version=None) -> None:
+        self._revoked = {bytes.fromhex(digest) for digest in digests}
+        self._version = version
+        self._verified.clear()
+
+    def revoke_locally(self, digests: Iterable[str]) -> None:
+        for digest in digests:
+            self._revoked.add(bytes.fromhex(digest))
+        self._verified.clear()
+
+    def verify(self, token: str) -> Optional[dict]:
+        """
+        Returns the claims of a valid, non-revoked device token, otherwise None.
+        Does not sync the revocation set, see ``averify``.
+        """
+        if hashlib.sha256(token.encode("utf-8")).digest() in self._revoked:
+            return None
+
+        claims = self._verified.get(token)
+        if claims is not None:
+            self._verified.move_to_end(token)
+            return claims
+
+        try:
+            claims = decode_token(token)
+        except JWTError:
+            return None
+        if not claims.get("sub") or not claims.get("organization_id"):
+            # User access tokens are signed with the same key but are not device tokens.
+            return None
+
+        self._verified[token] = claims
+        while len(self._verified) > self.max_entries:
+            self._verified.popitem(last=False)
+        return claims
+
+    async def averify(self, token: str) -> Optional[dict]:
+        await self.sync()
+        return self.verify(token)
+
+
+device_token_verifier = DeviceTokenVerifier(
+    sync_interval=constants.DEVICE_REVOCATION_SYNC_SECONDS,
+    max_entries=constants.DEVICE_TOKEN_CACHE_MAX_ENTRIES,
+)
+
+
+def _bump_revocation_version() -> None:
+    try:
+        cache.incr(DEVICE_REVOCATION_VERSION_CACHE_KEY)
+    except ValueError:
+        if not cache.add(DEVICE_REVOCATION_VERSION_CACHE_KEY, 1, None):
+            cache.incr(DEVICE_REVOCATION_VERSION_CACHE_KEY)
+
+
+async def revoke_device_tokens(tokens: Iterable[Optional[str]]) -> None:
+    """
+    Revoke device access tokens in every process. Empty tokens are ignored.
+    """
+    digests = [get_device_token_digest(token) for token in tokens if token]
+    if not digests:
+        return
+    await RevokedDeviceToken.objects.abulk_create(
+        [RevokedDeviceToken(digest=digest) for digest in digests],
+        ignore_conflicts=True,
+    )
+    _bump_revocation_version()
+    device_token_verifier.revoke_locally(digests)
+
+
+async def is_device_token_revoked(token: str) -> bool:
+    """
+    Check the database rather than the local revocation set, which may lag behind.
+    """
+    return await RevokedDeviceToken.objects.filter(digest=get_device_token_digest(token)).aexists()
+
+
+class DeviceAuthBearer(HttpBearer):
+    """
+    Authenticates requests made with a device access token. ``request.auth`` is set
+    to the token claims.
+    """
+    async def authenticate(self, request, token):
+        return await device_token_verifier.averify(token)
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from datetime import datetime
+from django.db.models import Case, DateTimeField, F, Q, Value, When
+from django.db.models.functions import Greatest
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, Optional, Tuple
+
+import portfolio_django_admin.constants as constants
+from organization.constants import DEVICE_EVENT_FIELDS
+from organization.models import Device
+
+logger = logging.getLogger(__name__)
+
+DeviceKey = Tuple[str, str]
+WRITE_CHUNK_SIZE = 500
+
+
+def write_device_events(pending: Dict[DeviceKey, Dict[str, datetime]]) -> int:
+    """
+    Write buffered device timestamps with one UPDATE per field and chunk of devices.
+    Timestamps never move backwards and inactive devices are left untouched.
+    @param pending: dict - Latest timestamp per field, keyed by (organization ID, device name).
+    """
+    updated = 0
+    for field in DEVICE_EVENT_FIELDS.values():
+        updates = [(key, fields[field]) for key, fields in pending.items() if field in fields]
+        for start in range(0, len(updates), WRITE_CHUNK_SIZE):
+            chunk = [
+                (Q(organization_id=organization_id, name=device_name), timestamp)
+                for (organization_id, device_name), timestamp in updates[start:start + WRITE_CHUNK_SIZE]
+            ]
+            updated += Device.objects.filter(reduce(or_, [condition for condition, _ in chunk]), is_active=True).update(**{
+                field: Case(
+                    *[
+                        When(condition, then=Greatest(F(field), Value(timestamp, output_field=DateTimeField())))
+                        for condition, timestamp in chunk
+                    ],
+                    default=F(field),
+                )
+            })
+    return updated
+
+
+class DeviceEventBuffer:
+    """
+    Collects device events in memory and writes them in the background.
+
+    Events of a device are merged into the latest timestamp per field, so the size of
+    the buffer is bounded by the number of reporting devices rather than by the number
+    of events. A flush runs every ``flush_interval`` seconds, or as soon as
+    ``max_pending`` devices are waiting. Events still buffered when the process stops
+    are lost; devices report again on their next interval.
+    """
+
+    def __init__(self, flush_interval: float, max_pending: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[DeviceKey, Dict[str, datetime]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def pending_devices(self) -> int:
+        return len(self._pending)
+
+    def add(self, organization_id: str, device_name: str, events: Iterable[Tuple[str, datetime]]) -> None:
+        """
+        Buffer events of a device.
+        @param events: Iterable[Tuple[str, datetime]] - Pairs of Device field and timestamp.
+        """
+        self._merge((organization_id, device_name), events)
+        self._ensure_flusher()
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    def _merge(self, key: DeviceKey, events: Iterable[Tuple[str, datetime]]) -> None:
+        fields = self._pending.setdefault(key, {})
+        for field, timestamp in events:
+            current = fields.get(field)
+            if current is None or timestamp > current:
+                fields[field] = timestamp
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._wakeup = asyncio.Event()
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all buffered events. Returns the number of devices written.
+        On failure the events are merged back and retried with the next flush.
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            await sync_to_async(write_device_events)(pending)
+        except Exception as e:
+            logger.error("Failed to write events of %s device(s): %s", len(pending), e)
+            for key, fields in pending.items():
+                self._merge(key, fields.items())
+            return 0
+        return len(pending)
+
+
+device_event_buffer = DeviceEventBuffer(
+    flush_interval=constants.DEVICE_EVENT_FLUSH_SECONDS,
+    max_pending=constants.DEVICE_EVENT_FLUSH_MAX_DEVICES,
+)
@@ -0,0 +1,170 @@
+import csv
+import io
+import logging
+
+from asgiref.sync import sync_to_async
+from itertools import islice
+from pydantic import ValidationError
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from uuid import UUID
+
+from organization.constants import (
+    DEVICE_IMPORT_CHUNK_SIZE,
+    MAX_DEVICE_IMPORT_CSV_BYTES,
+    MAX_DEVICE_IMPORT_ROWS,
+    OrganizationVersionScope,
+)
+from organization.models import Device, DeviceConfiguration
+from organization.schemas import DeviceImportIn
+from organization.services.change_version import bump_organization_version
+
+logger = logging.getLogger(__name__)
+
+DEVICE_CSV_CONFIGURATIONS_SEPARATOR = ";"
+
+
+def parse_device_csv(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Yield device rows of a CSV file with a header line. Rows are read one at a time.
+    Empty cells are treated as missing and ``configurations`` holds data types
+    separated by semicolons.
+    """
+    for row in csv.DictReader(stream):
+        device = {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+        configurations = device.pop("configurations", "")
+        device["configurations"] = [
+            data_type.strip() for data_type in configurations.split(DEVICE_CSV_CONFIGURATIONS_SEPARATOR) if data_type.strip()
+        ]
+        yield device
+
+
+def read_device_csv(
+    stream: BinaryIO,
+    size: Optional[int],
+    max_rows: int = MAX_DEVICE_IMPORT_ROWS,
+    max_bytes: int = MAX_DEVICE_IMPORT_CSV_BYTES,
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Read the device rows of an uploaded CSV file. Files over ``max_bytes`` are refused
+    before reading and files over ``max_rows`` rows before anything is imported.
+    """
+    if size is not None and size > max_bytes:
+        return None, f"The file is larger than {max_bytes} bytes."
+    try:
+        rows = list(islice(parse_device_csv(io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")), max_rows + 1))
+    except (UnicodeDecodeError, csv.Error) as e:
+        return None, f"The file is not a valid UTF-8 CSV file: {e}"
+    if len(rows) > max_rows:
+        return None, f"The file has more than {max_rows} rows."
+    return rows, None
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+    )
+
+
+def _import_device_chunk(
+    org_id: UUID,
+    chunk: List[Tuple[int, Any]],
+    seen_names: set,
+    updated_by: Optional[str],
+) -> Tuple[int, List[Dict[str, Any]]]:
+    errors = []
+    candidates: List[Tuple[int, DeviceImportIn]] = []
+    for row_number, row in chunk:
+        try:
+            device = row if isinstance(row, DeviceImportIn) else DeviceImportIn.model_validate(row)
+        except ValidationError as e:
+            name = row.get("name") if isinstance(row, dict) else None
+            errors.append({"row": row_number, "name": name, "message": _format_validation_error(e)})
+            continue
+        if device.name in seen_names:
+            errors.append({"row": row_number, "name": device.name, "message": "The name appears more than once in the import."})
+            continue
+        seen_names.add(device.name)
+        candidates.append((row_number, device))
+
+    existing = set(
+        Device.objects.filter(organization_id=org_id, name__in=[device.name for _, device in candidates])
+        .values_list("name", flat=True)
+    )
+    devices = []
+    configurations = []
+    rows = {}
+    for row_number, device in candidates:
+        if device.name in existing:
+            errors.append({"row": row_number, "name": device.name, "message": "A device with this name already exists in the organization."})
+            continue
+        fields = dict(
+            organization_id=org_id,
+            name=device.name,
+            description=device.description,
+            device_type=device.device_type.value,
+            updated_by=updated_by,
+        )
+        # Unset OS fields keep the model defaults.
+        if device.os_type:
+            fields["os_type"] = device.os_type.value
+        if device.os_version:
+            fields["os_version"] = device.os_version.value
+        instance = Device(**fields)
+        devices.append(instance)
+        rows[instance.id] = (row_number, device.name)
+        configurations.extend(
+            DeviceConfiguration(device_id=instance.id, data_type=data_type.value)
+            for data_type in dict.fromkeys(device.configurations)
+        )
+
+    if not devices:
+        return 0, errors
+
+    # IDs are generated here, so rows skipped because a concurrent request created the
+    # same name are found by reading the IDs back instead of failing the whole chunk.
+    Device.objects.bulk_create(devices, ignore_conflicts=True)
+    created = set(Device.objects.filter(id__in=rows.keys()).values_list("id", flat=True))
+    for device_id, (row_number, name) in rows.items():
+        if device_id not in created:
+            errors.append({"row": row_number, "name": name, "message": "A device with this name already exists in the organization."})
+    DeviceConfiguration.objects.bulk_create(
+        [configuration for configuration in configurations if configuration.device_id in created]
+    )
+    return len(created), errors
+
+
+def import_devices_sync(
+    org_id: UUID,
+    rows: Iterable[Any],
+    updated_by: Optional[str] = None,
+    chunk_size: int = DEVICE_IMPORT_CHUNK_SIZE,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Create devices with their configurations from dicts or DeviceImportIn rows.
+    Returns the number of devices created and the errors of rejected rows, numbered from 1.
+
+    Rows are consumed ``chunk_size`` at a time, so a streamed source is never held in
+    memory. Each chunk costs one query for name conflicts and one ``bulk_create`` per
+    table, whatever its size.
+    """
+    created = 0
+    errors: List[Dict[str, Any]] = []
+    seen_names: set = set()
+    numbered = enumerate(rows, start=1)
+    while chunk := list(islice(numbered, chunk_size)):
+        chunk_created, chunk_errors = _import_device_chunk(org_id, chunk, seen_names, updated_by)
+        created += chunk_created
+        errors.extend(chunk_errors)
+
+    if created:
+        bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
+    logger.info("Imported %s device(s) into organization %s, rejected %s row(s).", created, org_id, len(errors))
+    return created, errors
+
+
+async def import_devices(
+    org_id: UUID,
+    rows: Iterable[Any],
+    updated_by: Optional[str] = None,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    return await sync_to_async(import_devices_sync)(org_id, rows, updated_by)
@@ -1,13 +1,29 @@
+import base64
+import json
 import logging
 import httpx
 
-from django.db.models import QuerySet
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Q, QuerySet
 from organization.models import Device, DeviceConfiguration
-from organization.schemas import ResourceIndexDto
+from organization.schemas import ResourceIndexDto, DEVICE_OUT_FIELDS
+from organization.constants import (
+    DEFAULT_DEVICE_PAGE_SIZE,
+    DEVICE_CONFIGURATION_BULK_CHUNK_SIZE,
+    OrganizationVersionScope,
+)
 import portfolio_django_admin.constants as constants
-from authentication.services.auth import create_device_access_token
-
-from typing import Optional, Tuple
+from authentication.services.auth import (
+    build_device_access_token_claims,
+    create_device_access_token,
+    decode_token,
+)
+from jose import JWTError
+from organization.services.device_auth import is_device_token_revoked, revoke_device_tokens
+from organization.services.change_version import bump_organization_version
+
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 
@@ -35,6 +51,7 @@ async def add_device(
         os_type=os_type,
         os_version=os_version,
     )
+    bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
 
     return device, None
 
@@ -52,10 +69,13 @@ async def update_device(
     except Device.DoesNotExist:
         return None, "Device not found in this organization."
 
+    revoked_api_key = None
     if name and name != device.name:
         if await Device.objects.filter(organization_id=org_id, name=name).aexists():
             return None, "A device with this name already exists in the organization."
         device.name = name
+        # The token subject is the device name, so the old token must stop verifying.
+        revoked_api_key, device.api_key = device.api_key, None
 
     if description is not None:
         device.description = description
@@ -68,10 +88,55 @@ async def update_device(
 
     device.updated_at = datetime.now(timezone.utc)
     await device.asave()
+    await revoke_device_tokens([revoked_api_key])
+    bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
     return device, None
 
-async def list_devices(org_id: UUID) -> QuerySet[Device]:
-    return Device.objects.filter(organization_id=org_id).order_by('name')
+def encode_device_cursor(name: str, device_id: UUID) -> str:
+    return base64.urlsafe_b64encode(json.dumps([name, str(device_id)]).encode()).decode()
+
+
+def decode_device_cursor(cursor: str) -> Optional[Tuple[str, UUID]]:
+    try:
+        name, device_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return name, UUID(device_id)
+    except (ValueError, TypeError):
+        return None
+
+
+async def list_devices(
+    org_id: UUID,
+    limit: int = DEFAULT_DEVICE_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    os_type: Optional[str] = None,
+    stale_since: Optional[datetime] = None,
+) -> Tuple[List[dict], Optional[str], Optional[str]]:
+    """
+    Returns a page of device rows ordered by (name, id), the cursor of the next page and an error.
+    Rows only hold DEVICE_OUT_FIELDS, so api_key is never read.
+    Pages continue after the cursor instead of using an offset, so every page costs the
+    same index range scan regardless of its position.
+    """
+    devices = Device.objects.filter(organization_id=org_id)
+    if cursor:
+        position = decode_device_cursor(cursor)
+        if position is None:
+            return [], None, "Invalid cursor."
+        name, device_id = position
+        devices = devices.filter(Q(name__gt=name) | Q(name=name, id__gt=device_id))
+    if is_active is not None:
+        devices = devices.filter(is_active=is_active)
+    if os_type:
+        devices = devices.filter(os_type=os_type)
+    if stale_since:
+        devices = devices.filter(Q(last_heartbeat_at__isnull=True) | Q(last_heartbeat_at__lt=stale_since))
+
+    page = [
+        device async for device in devices.values(*DEVICE_OUT_FIELDS).order_by('name', 'id')[:limit + 1]
+    ]
+    next_cursor = encode_device_cursor(page[limit - 1]["name"], page[limit - 1]["id"]) if len(page) > limit else None
+    return page[:limit], next_cursor, None
 
 
 async def get_device_details(org_id: UUID, device_id: UUID) -> Optional[Device]:
@@ -94,6 +159,8 @@ async def deactivate_device(
         device.updated_by = updated_by
         device.updated_at = datetime.now(timezone.utc)
         await device.asave()
+        await revoke_device_tokens([device.api_key])
+        bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
         return device, None
     except Device.DoesNotExist:
         return None, "Device not found in this organization."
@@ -103,6 +170,8 @@ async def remove_device(org_id: UUID, device_id: UUID) -> Tuple[bool, Optional[s
     try:
         device = await Device.objects.aget(id=device_id, organization_id=org_id)
         await device.adelete()
+        await revoke_device_tokens([device.api_key])
+        bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
         return True, None
     except Device.DoesNotExist:
         return False, "Device not found in this organization."
@@ -123,6 +192,7 @@ async def add_device_configuration(
         device=device,
         data_type=data_type,
     )
+    bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
 
     return config, None
 
@@ -135,43 +205,170 @@ async def remove_device_configuration(
             id=config_id, device_id=device_id, device__organization_id=org_id
         )
         await config.adelete()
+        bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
         return True, None
     except DeviceConfiguration.DoesNotExist:
         return False, "Configuration not found for this device."
 
 
+def _select_devices(
+    org_id: UUID,
+    device_ids: Optional[List[UUID]] = None,
+    is_active: Optional[bool] = None,
+    os_type: Optional[str] = None,
+    select_all: bool = False,
+) -> Tuple[Optional[QuerySet[Device]], Optional[str]]:
+    """
+    Devices of an organization, narrowed to ``device_ids`` and the filters.
+    Selecting the whole fleet takes ``select_all``, so that a request without a
+    selector cannot change every device by accident.
+    """
+    if device_ids is None and is_active is None and not os_type and not select_all:
+        return None, "Select devices by device_ids or filters, or set all to change every device."
+    devices = Device.objects.filter(organization_id=org_id)
+    if device_ids is not None:
+        devices = devices.filter(id__in=device_ids)
+    if is_active is not None:
+        devices = devices.filter(is_active=is_active)
+    if os_type:
+        devices = devices.filter(os_type=os_type)
+    return devices, None
+
+
+def assign_device_configurations_sync(
+    org_id: UUID,
+    data_types: List[str],
+    device_ids: Optional[List[UUID]] = None,
+    is_active: Optional[bool] = None,
+    os_type: Optional[str] = None,
+    select_all: bool = False,
+) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Add the data types to every selected device. Configurations a device already has
+    are left as they are. Returns the number of selected devices.
+    """
+    devices, error = _select_devices(org_id, device_ids, is_active, os_type, select_all)
+    if error:
+        return None, error
+    selected = list(devices.values_list('id', flat=True))
+    with transaction.atomic():
+        for start in range(0, len(selected), DEVICE_CONFIGURATION_BULK_CHUNK_SIZE):
+            DeviceConfiguration.objects.bulk_create(
+                [
+                    DeviceConfiguration(device_id=device_id, data_type=data_type)
+                    for device_id in selected[start:start + DEVICE_CONFIGURATION_BULK_CHUNK_SIZE]
+                    for data_type in data_types
+                ],
+                ignore_conflicts=True,
+            )
+    if selected:
+        bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
+    return len(selected), None
+
+
+async def assign_device_configurations(
+    org_id: UUID,
+    data_types: List[str],
+    device_ids: Optional[List[UUID]] = None,
+    is_active: Optional[bool] = None,
+    os_type: Optional[str] = None,
+    select_all: bool = False,
+) -> Tuple[Optional[int], Optional[str]]:
+    return await sync_to_async(assign_device_configurations_sync)(
+        org_id, data_types, device_ids, is_active, os_type, select_all
+    )
+
+
+async def remove_device_configurations(
+    org_id: UUID,
+    data_types: List[str],
+    device_ids: Optional[List[UUID]] = None,
+    is_active: Optional[bool] = None,
+    os_type: Optional[str] = None,
+    select_all: bool = False,
+) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Remove the data types from every selected device with one DELETE.
+    Returns the number of configurations removed.
+    """
+    devices, error = _select_devices(org_id, device_ids, is_active, os_type, select_all)
+    if error:
+        return None, error
+    removed, _ = await DeviceConfiguration.objects.filter(
+        device__in=devices,
+        data_type__in=data_types,
+    ).adelete()
+    if removed:
+        bump_organization_version(org_id, OrganizationVersionScope.DEVICES)
+    return removed, None
+
+
 async def get_device_connection_status(
     org_id: UUID, device_id: UUID
 ) -> Optional[Device]:
     try:
-        return await Device.objects.only('id', 'is_active', 'last_heartbeat_at').aget(
+        return await Device.objects.only('id', 'is_active', 'last_heartbeat_at', 'last_upload_at', 'last_processed_at').aget(
+            id=device_id, organization_id=org_id
+        )
+    except Device.DoesNotExist:
+        return None
+
+async def get_installation_device(org_id: UUID, device_id: UUID) -> Optional[Device]:
+    """
+    Load a device together with its organization in a single query.
+    """
+    try:
+        return await Device.objects.select_related('organization').aget(
             id=device_id, organization_id=org_id
         )
     except Device.DoesNotExist:
         return None
 
+
+def _is_device_access_token_current(api_key: Optional[str], claims: dict) -> bool:
+    if not api_key:
+        return False
+    try:
+        current = decode_token(api_key)
+    except JWTError:
+        # Signed with a rotated secret or otherwise unreadable.
+        return False
+    current.pop("jti", None)
+    return current == claims
+
+
 async def generate_device_access_token(
-    device_id: UUID,
-    organization_id: UUID,
+    device: Device,
     resources:list[ResourceIndexDto]
 )->tuple[Optional[str], Optional[str]]:
-    try:
-        device = await Device.objects.aget(id=device_id, organization__id=organization_id)
+    """
+    Return the access token of the device, signing and storing a new one only when
+    the stored ``api_key`` no longer matches the device or the index versions, or has
+    been revoked (e.g. the device was deactivated and reactivated in the Django admin).
+    """
+    if not device.is_active:
+        return None, "The device is deactivated."
 
-        api_key = create_device_access_token(
+    try:
+        token_fields = dict(
             device_id=str(device.name),
-            organization_id=str(organization_id),
+            organization_id=str(device.organization_id),
             device_type=device.device_type,
             elastic_indices=[{ "index": resource.name, "version": f"{resource.major_version}.{resource.minor_version}.{resource.patch_version}" } for resource in resources],
             os_type=device.os_type,
             os_version=device.os_version,
         )
-        device.api_key = api_key
+        if _is_device_access_token_current(
+            device.api_key, build_device_access_token_claims(**token_fields)
+        ) and not await is_device_token_revoked(device.api_key):
+            return device.api_key, None
+
+        logger.info("Access token of device %s is missing, outdated or revoked. Generating a new one.", device.id)
+        previous_api_key = device.api_key
+        device.api_key = create_device_access_token(**token_fields)
         await device.asave(update_fields=["api_key"])
-        return api_key, None
+        await revoke_device_tokens([previous_api_key])
+        return device.api_key, None
     except Exception as e:
         logger.error("Failed to generate API key for device %s: %s", device.id, e)
         return None, "Failed to generate access token for the device."
-    except Device.DoesNotExist:
-        return None, "Device not found."
-
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from django.core.cache import cache
+from django.db.models import Aggregate, Count, DateTimeField, DurationField, F, Q, Value
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import portfolio_django_admin.constants as constants
+from organization.constants import DeviceType, OrganizationVersionScope, OsType, build_fleet_summary_cache_key
+from organization.models import Device
+from organization.services.change_version import get_organization_versions
+
+LAG_PERCENTILES = {"p50": 0.5, "p95": 0.95}
+
+
+class PercentileCont(Aggregate):
+    """
+    PostgreSQL ``percentile_cont`` ordered-set aggregate.
+    """
+    function = "percentile_cont"
+    template = "%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)"
+
+    def __init__(self, expression, percentile: float, **extra):
+        super().__init__(expression, percentile=float(percentile), **extra)
+
+
+def _build_fleet_aggregates(now: datetime) -> Dict[str, Aggregate]:
+    active = Q(is_active=True)
+    online_since = now - timedelta(seconds=constants.DEVICE_ONLINE_WINDOW_SECONDS)
+    aggregates = {
+        "total": Count("id"),
+        "inactive": Count("id", filter=~active),
+        "online": Count("id", filter=active & Q(last_heartbeat_at__gte=online_since)),
+        "stale": Count("id", filter=active & Q(last_heartbeat_at__lt=online_since)),
+        "never_connected": Count("id", filter=active & Q(last_heartbeat_at__isnull=True)),
+    }
+    for os_type in OsType:
+        aggregates[f"os_type__{os_type.value}"] = Count("id", filter=Q(os_type=os_type.value))
+    for device_type in DeviceType:
+        aggregates[f"device_type__{device_type.value}"] = Count("id", filter=Q(device_type=device_type.value))
+    for field in ("last_upload_at", "last_processed_at"):
+        lag = Value(now, output_field=DateTimeField()) - F(field)
+        for name, percentile in LAG_PERCENTILES.items():
+            aggregates[f"{field}__{name}"] = PercentileCont(
+                lag, percentile, filter=active, output_field=DurationField()
+            )
+    return aggregates
+
+
+def build_fleet_summary(row: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """
+    Shape the result of the fleet aggregate query into the FleetSummaryOut representation.
+    """
+    def seconds(lag: Optional[timedelta]) -> Optional[float]:
+        return round(lag.total_seconds(), 3) if lag is not None else None
+
+    return {
+        "total": row["total"],
+        "inactive": row["inactive"],
+        "connection": {
+            "online": row["online"],
+            "stale": row["stale"],
+            "never_connected": row["never_connected"],
+        },
+        "os_type": {os_type.value: row[f"os_type__{os_type.value}"] for os_type in OsType},
+        "device_type": {device_type.value: row[f"device_type__{device_type.value}"] for device_type in DeviceType},
+        "upload_lag_seconds": {name: seconds(row[f"last_upload_at__{name}"]) for name in LAG_PERCENTILES},
+        "processed_lag_seconds": {name: seconds(row[f"last_processed_at__{name}"]) for name in LAG_PERCENTILES},
+        "online_window_seconds": constants.DEVICE_ONLINE_WINDOW_SECONDS,
+        "generated_at": now,
+    }
+
+
+async def get_fleet_summary(org_id: UUID) -> Dict[str, Any]:
+    """
+    Returns device counts by connection state, OS and type plus upload and processing lag
+    percentiles of an organization.
+
+    The summary is computed with one aggregate query and cached under the organization's
+    device version, so device writes replace it and any number of dashboard reads in
+    between share it. Heartbeats and uploads arrive every few seconds and would never
+    let it be reused, so connection states and lags are instead kept for at most
+    DEVICE_FLEET_SUMMARY_CACHE_SECONDS.
+    """
+    cache_key = build_fleet_summary_cache_key(org_id, get_organization_versions(
+        org_id, [OrganizationVersionScope.DEVICES]
+    ))
+    summary = cache.get(cache_key)
+    if summary is not None:
+        return summary
+
+    now = datetime.now(timezone.utc)
+    row = await Device.objects.filter(organization_id=org_id).aaggregate(**_build_fleet_aggregates(now))
+    summary = build_fleet_summary(row, now)
+    cache.set(cache_key, summary, constants.DEVICE_FLEET_SUMMARY_CACHE_SECONDS)
+    return summary
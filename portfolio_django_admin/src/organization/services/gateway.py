@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import random
+import time
+import weakref
+import httpx
+import portfolio_django_admin.constants as constants
+
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = ["GET", "PUT", "DELETE"]
+RETRYABLE_STATUS_CODES = [502, 503, 504]
+
+
+class GatewayUnavailableError(Exception):
+    """Raised without contacting the Jarvis gateway while its circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing upstream for ``reset_timeout`` seconds after
+    ``failure_threshold`` consecutive failures. Once the timeout elapsed, requests
+    are let through again; the first success closes the breaker and another
+    failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow_request(self) -> bool:
+        return not self.is_open
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            if self._opened_at is None or not self.is_open:
+                logger.warning("Jarvis gateway circuit breaker opened after %s failure(s).", self._failures)
+            self._opened_at = time.monotonic()
+
+
+class GatewayClientPool:
+    """
+    Process-wide pool of keep-alive connections to the Jarvis gateway.
+    httpx clients are bound to the event loop they were first used on, so one
+    client is kept per running loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        max_connections: int,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.transport = transport
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+    def get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client:
+            await client.aclose()
+
+
+gateway_pool = GatewayClientPool(
+    base_url=constants.JARVIS_GATEWAY_URL,
+    timeout=constants.JARVIS_GATEWAY_TIMEOUT_SECONDS,
+    max_connections=constants.JARVIS_GATEWAY_MAX_CONNECTIONS,
+)
+
+gateway_breaker = CircuitBreaker(
+    failure_threshold=constants.JARVIS_GATEWAY_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=constants.JARVIS_GATEWAY_BREAKER_RESET_SECONDS,
+)
+
+
+async def send_gateway_request(method: str, url: str, headers: Optional[dict] = None, **kwargs) -> httpx.Response:
+    """
+    Send a request to the Jarvis gateway through the shared pool.
+
+    Idempotent requests are retried up to ``JARVIS_GATEWAY_MAX_RETRIES`` times on
+    connection errors and 502/503/504 responses, with full-jitter exponential
+    backoff. Every outcome is reported to the circuit breaker, and no request is
+    sent while it is open.
+    Raises ``GatewayUnavailableError`` when the breaker is open and
+    ``httpx.HTTPStatusError`` for error responses.
+    """
+    method = method.upper()
+    attempts = 1 + (constants.JARVIS_GATEWAY_MAX_RETRIES if method in IDEMPOTENT_METHODS else 0)
+
+    for attempt in range(attempts):
+        if not gateway_breaker.allow_request():
+            raise GatewayUnavailableError("The Jarvis gateway is unavailable. Please try again later.")
+
+        try:
+            response = await gateway_pool.get_client().request(method, url, headers=headers, **kwargs)
+        except httpx.TransportError as e:
+            gateway_breaker.record_failure()
+            logger.warning("Jarvis gateway %s %s failed (attempt %s/%s): %s", method, url, attempt + 1, attempts, e)
+            if attempt + 1 >= attempts:
+                raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                gateway_breaker.record_success()
+                response.raise_for_status()
+                return response
+
+            gateway_breaker.record_failure()
+            logger.warning(
+                "Jarvis gateway %s %s returned %s (attempt %s/%s)",
+                method, url, response.status_code, attempt + 1, attempts,
+            )
+            if attempt + 1 >= attempts:
+                response.raise_for_status()
+
+        await asyncio.sleep(random.uniform(0, constants.JARVIS_GATEWAY_RETRY_BACKOFF_SECONDS * (2 ** attempt)))
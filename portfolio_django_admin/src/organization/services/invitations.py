@@ -3,9 +3,11 @@ from django.db.models import QuerySet
 from organization.models import Organization, OrganizationUser
 from organization.constants import (
     OrganizationStatus,
+    OrganizationVersionScope,
     UserInvitationStatus
 )
 from organization.tasks import process_invitation
+from organization.services.change_version import bump_organization_version
 from notification.tasks import publish_notification
 from notification.dto import PublishUserNotificationDTO
 from notification.constants import NotificationType
@@ -34,6 +36,7 @@ async def invite_organization_user(
         return None, "The user is already a member of the organization."
 
     org_user = await OrganizationUser.objects.acreate(organization=org, user=user, role=role, invited_by=invited_by)
+    bump_organization_version(org_id, OrganizationVersionScope.ORGANIZATION)
     process_invitation.delay(str(org_user.id))
     publish_notification.delay(
         PublishUserNotificationDTO(
@@ -75,6 +78,7 @@ async def respond_to_organization_invite(
             return None, "The invitation has already been responded to."
         org_user.invitation_status = UserInvitationStatus.ACCEPTED.value if accept else UserInvitationStatus.DECLINED.value
         await org_user.asave()
+        bump_organization_version(org_id, OrganizationVersionScope.ORGANIZATION)
 
         if accept:
             publish_notification.delay(
@@ -1,9 +1,13 @@
+import base64
+import json
+
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 from django.contrib.auth.models import AbstractUser
 from django.core.cache import cache
 from asgiref.sync import sync_to_async
+import portfolio_django_admin.constants as constants
 from organization.models import Organization, OrganizationUser
 from authentication.constants import (
     OrganizationRoleType,
@@ -11,12 +15,15 @@ from authentication.constants import (
 )
 from organization.constants import (
     OrganizationStatus,
+    OrganizationVersionScope,
     UserInvitationStatus,
     CACHE_TIMEOUT,
+    DEFAULT_ORGANIZATION_USER_PAGE_SIZE,
     build_cache_key,
 )
-from notification.tasks import publish_notification
-from notification.dto import PublishUserNotificationDTO
+from organization.services.change_version import bump_organization_version
+from notification.tasks import publish_bulk_notification, publish_notification
+from notification.dto import PublishBulkUserNotificationDTO, PublishUserNotificationDTO
 from notification.constants import NotificationType
 
 from typing import Optional, List, Tuple
@@ -89,6 +96,7 @@ async def update_organization(org_id: UUID, description: str, updated_by_usernam
         org.updated_by = updated_by_username
         org.updated_at = datetime.now(timezone.utc)
         await org.asave()
+        bump_organization_version(org_id, OrganizationVersionScope.ORGANIZATION)
 
         org_owner = await OrganizationUser.objects.filter(organization=org, role=OrganizationRoleType.OWNER.value).select_related('user').afirst()
         if org_owner:
@@ -108,23 +116,31 @@ async def update_organization(org_id: UUID, description: str, updated_by_usernam
 
 async def delete_organization(org_id: UUID) -> bool:
     try:
-        org_members = OrganizationUser.objects.filter(organization_id=org_id).select_related('user')
         org = await Organization.objects.exclude(status=OrganizationStatus.DELETED.value).aget(id=org_id)
         org.status = OrganizationStatus.DELETED.value
         await org.asave()
+        bump_organization_version(org_id, *OrganizationVersionScope)
+
+        # One query for the members, one broker message and one cache round-trip for all of them.
+        members = [
+            member async for member in OrganizationUser.objects.filter(organization_id=org_id).values_list('user_id', 'user__username')
+        ]
+        if members:
+            publish_bulk_notification.delay(
+                PublishBulkUserNotificationDTO(
+                    user_ids=[user_id for user_id, _ in members],
+                    description=f"Organization {org.name} has been deleted.",
+                    title="Organization Deleted",
+                    notification_type=NotificationType.ALERT.value
+                ).model_dump()
+            )
+            cache.delete_many([build_cache_key(org_id, username) for _, username in members])
 
-        if await org_members.acount() > 0:    
-            async for member in org_members:
-                publish_notification.delay(
-                    PublishUserNotificationDTO(
-                        user_id=member.user.id,
-                        description=f"Organization {org.name} has been deleted.",
-                        title="Organization Deleted",
-                        notification_type=NotificationType.ALERT.value
-                    ).model_dump()
-                )
-                cache_key = build_cache_key(org_id, member.user.username)
-                cache.delete(cache_key)
+        # Devices and memberships are removed in the background. With a grace period
+        # the periodic purge_deleted_organizations picks the organization up instead.
+        if constants.ORGANIZATION_PURGE_DELAY_SECONDS <= 0:
+            from organization.tasks import purge_deleted_organization
+            purge_deleted_organization.delay(str(org_id))
         return True
     except Organization.DoesNotExist:
         return False
@@ -140,9 +156,51 @@ async def get_organization_user_role(org_id: UUID, user_id: int) -> Optional[str
 
 
 
-async def list_organization_users(org_id: UUID) -> QuerySet[OrganizationUser]:
-    return OrganizationUser.objects.filter(organization_id=org_id).exclude(
-        organization__status=OrganizationStatus.DELETED.value).select_related('user').order_by('created_at')
+def encode_organization_user_cursor(created_at: datetime, org_user_id: UUID) -> str:
+    return base64.urlsafe_b64encode(json.dumps([created_at.isoformat(), str(org_user_id)]).encode()).decode()
+
+
+def decode_organization_user_cursor(cursor: str) -> Optional[Tuple[datetime, UUID]]:
+    try:
+        created_at, org_user_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(org_user_id)
+    except (ValueError, TypeError):
+        return None
+
+
+async def list_organization_users(
+    org_id: UUID,
+    limit: int = DEFAULT_ORGANIZATION_USER_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    role: Optional[str] = None,
+    invitation_status: Optional[str] = None,
+) -> Tuple[List[OrganizationUser], Optional[str], Optional[str]]:
+    """
+    Returns a page of members ordered by (created_at, id), the cursor of the next page and an error.
+    Only the fields of OrganizationUserOut are loaded; of the user that is the email.
+    Pages continue after the cursor along organization_users_created_idx, so every page
+    costs the same regardless of its position.
+    """
+    org_users = OrganizationUser.objects.filter(organization_id=org_id).exclude(
+        organization__status=OrganizationStatus.DELETED.value)
+    if cursor:
+        position = decode_organization_user_cursor(cursor)
+        if position is None:
+            return [], None, "Invalid cursor."
+        created_at, org_user_id = position
+        org_users = org_users.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=org_user_id))
+    if role:
+        org_users = org_users.filter(role=role)
+    if invitation_status:
+        org_users = org_users.filter(invitation_status=invitation_status)
+
+    page = [
+        org_user async for org_user in org_users.select_related('user').only(
+            'id', 'organization_id', 'role', 'created_at', 'updated_at', 'invitation_status', 'user__email'
+        ).order_by('created_at', 'id')[:limit + 1]
+    ]
+    next_cursor = encode_organization_user_cursor(page[limit - 1].created_at, page[limit - 1].id) if len(page) > limit else None
+    return page[:limit], next_cursor, None
     
 
 async def update_organization_user_role(
@@ -154,6 +212,7 @@ async def update_organization_user_role(
         )
         org_user.role = role
         await org_user.asave()
+        bump_organization_version(org_id, OrganizationVersionScope.ORGANIZATION)
         cache_key = build_cache_key(org_id, org_user.user.username)
         if cache.get(cache_key) is not None:
             cache.set(cache_key, role, CACHE_TIMEOUT)
@@ -175,6 +234,7 @@ async def remove_organization_user(
         username = org_user.user.username
         await org_user.adelete()
         cache.delete(build_cache_key(org_id, username))
+        bump_organization_version(org_id, OrganizationVersionScope.ORGANIZATION)
         return True, None
     except OrganizationUser.DoesNotExist:
         return False, "The user is not a member of the organization or has been deleted."
@@ -191,6 +251,7 @@ async def leave_organization(org_id: UUID, user_id: int) -> Tuple[bool, Optional
         username = org_user.user.username
         await org_user.adelete()
         cache.delete(build_cache_key(org_id, username))
+        bump_organization_version(org_id, OrganizationVersionScope.ORGANIZATION)
 
         org_members = OrganizationUser.objects.filter(organization_id=org_id).select_related('user')
         async for member in org_members:
@@ -0,0 +1,78 @@
+import logging
+
+from datetime import timedelta
+from django.db import IntegrityError
+from django.utils import timezone
+import portfolio_django_admin.constants as constants
+from organization.models import Organization, ResourceProvisionJob
+from organization.constants import OrganizationStatus, ProvisionJobStatus, ACTIVE_PROVISION_JOB_STATUSES
+
+from typing import Optional, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+async def start_resource_provision_job(
+    org_id: UUID, requested_by: str
+) -> Tuple[Optional[ResourceProvisionJob], Optional[str]]:
+    """
+    Create a provisioning job for the organization and queue it. If a job is already
+    pending or in progress for the organization, that job is returned instead, unless
+    its task was lost: such a job is failed and a new one is started.
+    """
+    from organization.tasks import provision_organization_resource
+
+    if not await Organization.objects.exclude(status=OrganizationStatus.DELETED.value).filter(id=org_id).aexists():
+        return None, "The organization does not exist or has been deleted."
+
+    await _expire_stale_provision_jobs(org_id)
+    job = await _get_active_provision_job(org_id)
+    if job:
+        return job, None
+
+    try:
+        job = await ResourceProvisionJob.objects.acreate(organization_id=org_id, requested_by=requested_by)
+    except IntegrityError:
+        # Another request created the active job in the meantime.
+        job = await _get_active_provision_job(org_id)
+        if job:
+            return job, None
+        return None, "Unable to start provisioning. Please try again later."
+
+    provision_organization_resource.delay(str(job.id))
+    return job, None
+
+
+async def get_resource_provision_job(org_id: UUID, job_id: UUID) -> Optional[ResourceProvisionJob]:
+    try:
+        return await ResourceProvisionJob.objects.aget(id=job_id, organization_id=org_id)
+    except ResourceProvisionJob.DoesNotExist:
+        return None
+
+
+async def _expire_stale_provision_jobs(org_id: UUID) -> None:
+    """
+    Fail active jobs that have not been updated for JARVIS_PROVISION_STALE_SECONDS.
+    Polls update their job well within that time, so such a job's task was lost,
+    for example because it could not be queued, and nothing would ever finish it.
+    """
+    now = timezone.now()
+    expired = await ResourceProvisionJob.objects.filter(
+        organization_id=org_id,
+        status__in=ACTIVE_PROVISION_JOB_STATUSES,
+        updated_at__lt=now - timedelta(seconds=constants.JARVIS_PROVISION_STALE_SECONDS),
+    ).aupdate(
+        status=ProvisionJobStatus.FAILED.value,
+        last_error="Provisioning stopped making progress.",
+        completed_at=now,
+        updated_at=now,
+    )
+    if expired:
+        logger.warning("start_resource_provision_job: Failed %s stale provision job(s) of org %s.", expired, org_id)
+
+
+async def _get_active_provision_job(org_id: UUID) -> Optional[ResourceProvisionJob]:
+    return await ResourceProvisionJob.objects.filter(
+        organization_id=org_id, status__in=ACTIVE_PROVISION_JOB_STATUSES
+    ).order_by('-created_at').afirst()
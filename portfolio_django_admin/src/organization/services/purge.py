@@ -0,0 +1,113 @@
+import httpx
+import logging
+
+from django.db.models import QuerySet
+from django.utils import timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from authentication.constants import ORG_ADMIN_ROLES
+from authentication.services.auth import create_access_token
+from organization.constants import (
+    ORGANIZATION_PURGE_BATCH_SIZE,
+    OrganizationStatus,
+    OrganizationVersionScope,
+    UserInvitationStatus,
+)
+from organization.models import Device, DeviceConfiguration, Organization, OrganizationUser, ResourceProvisionJob
+from organization.services.change_version import bump_organization_version
+from organization.services.device_auth import revoke_device_tokens
+from organization.services.resources import ResourceService
+
+logger = logging.getLogger(__name__)
+
+
+def pending_purge_organizations() -> QuerySet[Organization]:
+    """
+    Deleted organizations whose dependent rows have not been removed yet.
+    Matches the organizations_purge_idx partial index.
+    """
+    return Organization.objects.filter(status=OrganizationStatus.DELETED.value, purged_at__isnull=True)
+
+
+async def _delete_in_batches(queryset: QuerySet, batch_size: int) -> int:
+    """
+    Delete the rows of a queryset ``batch_size`` at a time, so that no single statement
+    locks or loads the whole set.
+    """
+    deleted = 0
+    while ids := [pk async for pk in queryset.values_list("pk", flat=True)[:batch_size]]:
+        await queryset.model.objects.filter(pk__in=ids).adelete()
+        deleted += len(ids)
+    return deleted
+
+
+async def _deprovision(org_id: UUID) -> Optional[str]:
+    """
+    Deprovision the gateway index of an organization on behalf of one of its admins.
+    Organizations may have been provisioned without a provision job, so the gateway
+    is always asked; an index it does not know counts as deprovisioned.
+    Returns an error when there is no admin to act as.
+    """
+    username = await OrganizationUser.objects.filter(
+        organization_id=org_id,
+        role__in=ORG_ADMIN_ROLES,
+        invitation_status=UserInvitationStatus.ACCEPTED.value,
+    ).order_by("created_at").values_list("user__username", flat=True).afirst()
+    if username is None:
+        logger.warning("purge_organization: Org %s has no admin to deprovision its resources as.", org_id)
+        return "The organization has no admin to deprovision its resources as."
+    try:
+        async with ResourceService(jwt_token=await create_access_token(username)) as svc:
+            await svc.deprovision_organization_index(str(org_id))
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code != 404:
+            raise
+        logger.info("purge_organization: Org %s has no gateway index to deprovision.", org_id)
+    return None
+
+
+async def purge_organization(
+    org_id: UUID, batch_size: int = ORGANIZATION_PURGE_BATCH_SIZE
+) -> Tuple[Optional[Dict[str, int]], Optional[str]]:
+    """
+    Remove what a deleted organization leaves behind: its gateway index, devices with
+    their configurations and tokens, provision jobs and memberships. The organization
+    row is kept and marked as purged. Returns the number of rows removed per table.
+
+    Rows are removed in batches, so that no statement locks or loads the whole set.
+    A purge that fails midway is resumed by the next run, since every step only sees
+    the rows left. Device tokens are revoked before their devices are deleted, so a
+    failure in between leaves no valid token without a device to revoke it by.
+    Organizations whose gateway index cannot be deprovisioned are left unpurged.
+    """
+    if not await pending_purge_organizations().filter(id=org_id).aexists():
+        return None, "The organization is not deleted or has already been purged."
+
+    # Needs an admin membership, so it runs before memberships are removed.
+    error = await _deprovision(org_id)
+    if error:
+        return None, error
+
+    counts = {"devices": 0, "device_configurations": 0}
+    devices = Device.objects.filter(organization_id=org_id)
+    while batch := [device async for device in devices.values_list("id", "api_key")[:batch_size]]:
+        device_ids: List[UUID] = [device_id for device_id, _ in batch]
+        await revoke_device_tokens([api_key for _, api_key in batch])
+        counts["device_configurations"] += await _delete_in_batches(
+            DeviceConfiguration.objects.filter(device_id__in=device_ids), batch_size
+        )
+        await Device.objects.filter(id__in=device_ids).adelete()
+        counts["devices"] += len(batch)
+
+    counts["provision_jobs"] = await _delete_in_batches(
+        ResourceProvisionJob.objects.filter(organization_id=org_id), batch_size
+    )
+    counts["organization_users"] = await _delete_in_batches(
+        OrganizationUser.objects.filter(organization_id=org_id), batch_size
+    )
+
+    await Organization.objects.filter(id=org_id).aupdate(purged_at=timezone.now())
+    bump_organization_version(org_id, *OrganizationVersionScope)
+    logger.info("purge_organization: Purged org %s: %s", org_id, counts)
+    return counts, None
@@ -1,7 +1,59 @@
-from typing import Optional
+import time
 import httpx
 import portfolio_django_admin.constants as constants
+from django.core.cache import cache
+from jose import JWTError
+from typing import Optional
+from authentication.services.auth import decode_token
+from organization.constants import (
+    RESOURCE_GENERATION_CACHE_TIMEOUT,
+    build_resource_cache_key,
+    build_resource_generation_cache_key,
+)
 from organization.schemas.resources import ManageResourceDto, ResourceDto
+from organization.services.gateway import send_gateway_request
+
+
+class ResourceCache:
+    """
+    Short-lived cache of ``ResourceDto`` per organization and caller, shared by the web
+    processes and the Celery workers through the Django cache. Index versions and provision
+    status change rarely, so reads within the TTL are answered without calling the gateway.
+
+    The gateway authorizes every request with the caller's token, so an entry is only
+    served back to the token subject it was fetched for. Entries are keyed under a
+    per-organization generation; ``invalidate`` drops the generation, which orphans every
+    caller's entry at once. Orphaned entries expire with the TTL.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+
+    def _generation(self, organization_id: str) -> int:
+        key = build_resource_generation_cache_key(organization_id)
+        generation = cache.get(key)
+        if generation is None:
+            generation = time.time_ns()
+            if not cache.add(key, generation, RESOURCE_GENERATION_CACHE_TIMEOUT):
+                generation = cache.get(key, generation)
+        return generation
+
+    def get(self, organization_id: str, subject: str) -> Optional[ResourceDto]:
+        data = cache.get(build_resource_cache_key(organization_id, self._generation(organization_id), subject))
+        return ResourceDto(**data) if data is not None else None
+
+    def set(self, organization_id: str, subject: str, resource: ResourceDto) -> None:
+        cache.set(
+            build_resource_cache_key(organization_id, self._generation(organization_id), subject),
+            resource.model_dump(mode="json"),
+            self.ttl,
+        )
+
+    def invalidate(self, organization_id: str) -> None:
+        cache.delete(build_resource_generation_cache_key(organization_id))
+
+
+resource_cache = ResourceCache(ttl=constants.JARVIS_RESOURCE_CACHE_TTL_SECONDS)
 
 
 class ResourceService:
@@ -10,48 +62,70 @@ class ResourceService:
     The openapi.json file is available in docs/ folder.
     It uses httpx based async communication to update and retrieve organization specific data in the organization service.
     It forwards user's JWT bearer token received by this application to the organization service for authentication and authorization.
+    Requests go through the process-wide gateway connection pool, so entering and
+    leaving the context manager does not open or close any connection.
     """
 
     def __init__(self, jwt_token: str):
-        self.base_url = constants.JARVIS_GATEWAY_URL
         self.jwt_token = jwt_token
-        self._client: Optional[httpx.AsyncClient] = None
+
+    def _cache_subject(self) -> Optional[str]:
+        """
+        The verified subject of the caller's token, which scopes its cache entries.
+        Tokens that do not verify are never served from or stored in the cache.
+        """
+        try:
+            return decode_token(self.jwt_token).get("sub")
+        except JWTError:
+            return None
 
     async def __aenter__(self) -> "ResourceService":
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={"Authorization": f"Bearer {self.jwt_token}"},
-        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        return None
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return await send_gateway_request(
+            method,
+            url,
+            headers={"Authorization": f"Bearer {self.jwt_token}"},
+            **kwargs,
+        )
 
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
 
-    async def get_organization(self, organization_id: str) -> ResourceDto:
+    async def get_organization(self, organization_id: str, use_cache: bool = True) -> ResourceDto:
         """
         Retrieve organization information.
         GET /organization/{organization_id}/v1
+        Served from the shared resource cache while the caller's entry is fresh.
         """
-        response = await self._client.get(f"/organization/{organization_id}/v1")
-        response.raise_for_status()
-        return ResourceDto(**response.json())
+        subject = self._cache_subject() if use_cache else None
+        if subject:
+            resource = resource_cache.get(organization_id, subject)
+            if resource is not None:
+                return resource
+
+        response = await self._request("GET", f"/organization/{organization_id}/v1")
+        resource = ResourceDto(**response.json())
+        if subject:
+            resource_cache.set(organization_id, subject, resource)
+        return resource
 
     async def create_organization(self, payload: ManageResourceDto) -> ResourceDto:
         """
         Create a new organization.
         POST /organization/v1
         """
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             "/organization/v1",
             json=payload.model_dump(),
         )
-        response.raise_for_status()
+        resource_cache.invalidate(payload.organization_id)
         return ResourceDto(**response.json())
 
     async def update_organization(self, payload: ManageResourceDto) -> ResourceDto:
@@ -59,11 +133,12 @@ class ResourceService:
         Update an existing organization.
         PUT /organization/v1
         """
-        response = await self._client.put(
+        response = await self._request(
+            "PUT",
             "/organization/v1",
             json=payload.model_dump(),
         )
-        response.raise_for_status()
+        resource_cache.invalidate(payload.organization_id)
         return ResourceDto(**response.json())
 
     async def delete_organization(self, organization_id: str) -> ResourceDto:
@@ -71,8 +146,8 @@ class ResourceService:
         Delete an organization.
         DELETE /organization/{organization_id}/v1
         """
-        response = await self._client.delete(f"/organization/{organization_id}/v1")
-        response.raise_for_status()
+        response = await self._request("DELETE", f"/organization/{organization_id}/v1")
+        resource_cache.invalidate(organization_id)
         return ResourceDto(**response.json())
 
     # ------------------------------------------------------------------
@@ -84,10 +159,11 @@ class ResourceService:
         Provision the search index for an organization.
         POST /organization/{organization_id}/provision/v1
         """
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             f"/organization/{organization_id}/provision/v1"
         )
-        response.raise_for_status()
+        resource_cache.invalidate(organization_id)
         return response.json()
 
     async def deprovision_organization_index(self, organization_id: str) -> dict:
@@ -95,8 +171,9 @@ class ResourceService:
         Deprovision the search index for an organization.
         POST /organization/{organization_id}/deprovision/v1
         """
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             f"/organization/{organization_id}/deprovision/v1"
         )
-        response.raise_for_status()
+        resource_cache.invalidate(organization_id)
         return response.json()
@@ -1,11 +1,17 @@
 from .manage_device_connections import manage_device_connections
 from .process_invitation import process_invitation
 from .update_device_heartbeat import update_device_heartbeat, update_device_last_upload, update_device_last_processed
+from .provision_organization_resource import provision_organization_resource, poll_resource_provision_job
+from .purge_deleted_organizations import purge_deleted_organization, purge_deleted_organizations
 
 __all__ = [
     'manage_device_connections',
     'process_invitation',
     'update_device_heartbeat',
     'update_device_last_upload',
-    'update_device_last_processed'
+    'update_device_last_processed',
+    'provision_organization_resource',
+    'poll_resource_provision_job',
+    'purge_deleted_organization',
+    'purge_deleted_organizations',
 ]
\ No newline at end of file
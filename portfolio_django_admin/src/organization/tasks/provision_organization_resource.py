@@ -0,0 +1,152 @@
+from celery import shared_task
+from django.utils import timezone
+from typing import Optional
+import asyncio
+import logging
+
+import portfolio_django_admin.constants as constants
+import organization.services.gateway as gateway
+from organization.constants import ProvisionJobStatus
+from organization.models import OrganizationUser, ResourceProvisionJob
+from organization.schemas import ResourceDto
+from organization.services.resources import ResourceService, resource_cache
+from authentication.constants import ORG_ADMIN_ROLES
+from authentication.services.auth import create_access_token
+from notification.tasks.process_notification import publish_bulk_notification
+from notification.dto import PublishBulkUserNotificationDTO
+from notification.constants import NotificationType
+
+logger = logging.getLogger(__name__)
+
+
+async def _call_gateway(job: ResourceProvisionJob, provision: bool):
+    """
+    Call the gateway on behalf of the user who requested the job. A fresh access
+    token is issued for every call since polling may outlive the user's token.
+    """
+    token = await create_access_token(job.requested_by)
+    try:
+        async with ResourceService(jwt_token=token) as svc:
+            if provision:
+                return await svc.provision_organization_index(str(job.organization_id))
+            resource = await svc.get_organization(str(job.organization_id), use_cache=False)
+            # The gateway moves the status and index versions on its own while provisioning,
+            # so the web processes re-read them instead of serving a cached snapshot.
+            resource_cache.invalidate(str(job.organization_id))
+            return resource
+    finally:
+        # Every task run has its own event loop, so its pooled client is closed here.
+        await gateway.gateway_pool.aclose()
+
+
+def get_provision_status(resource: Optional[ResourceDto]) -> str:
+    """
+    Aggregate the provision status of all indices of the organization resource.
+    """
+    statuses = [index.provision_status for index in resource.indices] if resource else []
+    if ProvisionJobStatus.FAILED.value in statuses:
+        return ProvisionJobStatus.FAILED.value
+    if statuses and all(status == ProvisionJobStatus.COMPLETED.value for status in statuses):
+        return ProvisionJobStatus.COMPLETED.value
+    return ProvisionJobStatus.IN_PROGRESS.value
+
+
+def get_poll_delay(attempts: int) -> float:
+    return min(
+        constants.JARVIS_PROVISION_POLL_INITIAL_SECONDS * (2 ** max(attempts - 1, 0)),
+        constants.JARVIS_PROVISION_POLL_MAX_SECONDS,
+    )
+
+
+def _finish_job(job: ResourceProvisionJob, status: str, error: Optional[str] = None):
+    job.status = status
+    job.last_error = error
+    job.completed_at = timezone.now()
+    job.save(update_fields=["status", "last_error", "attempts", "completed_at", "updated_at"])
+
+    organization = job.organization
+    if status == ProvisionJobStatus.COMPLETED.value:
+        title = f"[{organization.name}] Resources Provisioned"
+        description = f"The resources of your organization {organization.name} have been provisioned."
+    else:
+        title = f"[{organization.name}] Resource Provisioning Failed"
+        description = f"Provisioning the resources of your organization {organization.name} failed: {error}"
+
+    admin_ids = list(OrganizationUser.objects.filter(
+        organization_id=job.organization_id,
+        role__in=ORG_ADMIN_ROLES,
+    ).values_list('user_id', flat=True))
+    if admin_ids:
+        publish_bulk_notification.delay(
+            PublishBulkUserNotificationDTO(
+                user_ids=admin_ids,
+                title=title,
+                description=description,
+                notification_type=NotificationType.ALERT.value
+            ).model_dump()
+        )
+
+
+@shared_task(ignore_result=True)
+def provision_organization_resource(job_id: str):
+    """
+    Start provisioning the resources of a job's organization on the gateway and
+    schedule polling of its status.
+    """
+    try:
+        job = ResourceProvisionJob.objects.select_related('organization').get(id=job_id)
+    except ResourceProvisionJob.DoesNotExist:
+        logger.warning("provision_organization_resource: Job %s does not exist.", job_id)
+        return
+    if job.status != ProvisionJobStatus.PENDING.value:
+        return
+
+    job.attempts += 1
+    try:
+        asyncio.run(_call_gateway(job, provision=True))
+    except Exception as e:
+        logger.error("provision_organization_resource: Failed to provision org %s: %s", job.organization_id, e)
+        _finish_job(job, ProvisionJobStatus.FAILED.value, "The gateway rejected the provisioning request.")
+        return
+
+    job.status = ProvisionJobStatus.IN_PROGRESS.value
+    job.save(update_fields=["status", "attempts", "updated_at"])
+    poll_resource_provision_job.apply_async((job_id,), countdown=get_poll_delay(1))
+
+
+@shared_task(ignore_result=True)
+def poll_resource_provision_job(job_id: str):
+    """
+    Check the provision status of a job on the gateway. Completed and failed jobs
+    are closed and the admins of the organization notified; otherwise the poll is
+    rescheduled with exponential backoff until JARVIS_PROVISION_TIMEOUT_SECONDS.
+    """
+    try:
+        job = ResourceProvisionJob.objects.select_related('organization').get(id=job_id)
+    except ResourceProvisionJob.DoesNotExist:
+        logger.warning("poll_resource_provision_job: Job %s does not exist.", job_id)
+        return
+    if job.status != ProvisionJobStatus.IN_PROGRESS.value:
+        return
+
+    job.attempts += 1
+    try:
+        status = get_provision_status(asyncio.run(_call_gateway(job, provision=False)))
+    except Exception as e:
+        # Gateway hiccups do not fail the job, the next poll tries again.
+        logger.warning("poll_resource_provision_job: Failed to poll org %s: %s", job.organization_id, e)
+        status = ProvisionJobStatus.IN_PROGRESS.value
+        job.last_error = str(e)
+
+    if status == ProvisionJobStatus.COMPLETED.value:
+        _finish_job(job, status)
+        return
+    if status == ProvisionJobStatus.FAILED.value:
+        _finish_job(job, status, "One or more indices could not be provisioned.")
+        return
+    if (timezone.now() - job.created_at).total_seconds() > constants.JARVIS_PROVISION_TIMEOUT_SECONDS:
+        _finish_job(job, ProvisionJobStatus.FAILED.value, "Provisioning did not complete in time.")
+        return
+
+    job.save(update_fields=["attempts", "last_error", "updated_at"])
+    poll_resource_provision_job.apply_async((job_id,), countdown=get_poll_delay(job.attempts))
@@ -0,0 +1,52 @@
+from celery import shared_task
+from django.utils import timezone
+from datetime import timedelta
+import asyncio
+import logging
+
+import portfolio_django_admin.constants as constants
+import organization.services.gateway as gateway
+from organization.constants import ORGANIZATION_PURGE_SWEEP_LIMIT
+from organization.services.purge import pending_purge_organizations, purge_organization
+
+logger = logging.getLogger(__name__)
+
+
+async def _purge(org_id: str):
+    try:
+        return await purge_organization(org_id)
+    finally:
+        # Every task run has its own event loop, so its pooled client is closed here.
+        await gateway.gateway_pool.aclose()
+
+
+@shared_task(ignore_result=True)
+def purge_deleted_organization(org_id: str):
+    """
+    Remove the devices, memberships and gateway resources of a deleted organization.
+    A failed purge is left to purge_deleted_organizations to retry.
+    """
+    try:
+        counts, error = asyncio.run(_purge(org_id))
+    except Exception as e:
+        logger.error("purge_deleted_organization: Failed to purge org %s: %s", org_id, e)
+        return
+    if error:
+        logger.info("purge_deleted_organization: Skipped org %s: %s", org_id, error)
+
+
+@shared_task(ignore_result=True)
+def purge_deleted_organizations():
+    """
+    Periodically enqueues a purge for organizations deleted more than
+    ORGANIZATION_PURGE_DELAY_SECONDS ago that have not been purged yet, at most
+    ORGANIZATION_PURGE_SWEEP_LIMIT per run. Scheduled hourly by migration 0012.
+    """
+    cutoff = timezone.now() - timedelta(seconds=constants.ORGANIZATION_PURGE_DELAY_SECONDS)
+    org_ids = list(
+        pending_purge_organizations().filter(updated_at__lte=cutoff)
+        .order_by('updated_at').values_list('id', flat=True)[:ORGANIZATION_PURGE_SWEEP_LIMIT]
+    )
+    for org_id in org_ids:
+        purge_deleted_organization.delay(str(org_id))
+    logger.info("purge_deleted_organizations: Enqueued %s purge(s).", len(org_ids))
@@ -0,0 +1,736 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from ninja import Router, Schema
+from ninja.testing import TestAsyncClient
+from datetime import datetime, timedelta, timezone
+from unittest import skipUnless
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import io
+import json
+import re
+import uuid
+from jose import jwt
+
+import portfolio_django_admin.constants as constants
+from organization.decorators import etag_org_version
+from organization.models import Device, ResourceProvisionJob
+from organization.schemas import DeviceImportBatchIn, DeviceOut, ManageResourceDto, ResourceDto, ResourceIndexDto, serialize_device
+from portfolio_django_admin.renderers import ORJSONRenderer
+from ninja.renderers import JSONRenderer
+from organization.services import ResourceService, generate_device_access_token, list_devices, update_device
+from organization.services.organization import (
+    decode_organization_user_cursor,
+    delete_organization,
+    encode_organization_user_cursor,
+    list_organization_users,
+)
+from organization.constants import OrganizationVersionScope, build_cache_key
+from organization.services.devices import (
+    _select_devices,
+    assign_device_configurations_sync,
+    decode_device_cursor,
+    encode_device_cursor,
+    remove_device_configurations,
+)
+from organization.services.device_auth import DeviceTokenVerifier, get_device_token_digest
+from organization.services.change_version import bump_organization_version
+from organization.services.device_events import DeviceEventBuffer
+from organization.services.fleet import get_fleet_summary
+from organization.services.device_import import import_devices_sync, parse_device_csv, read_device_csv
+from organization.views.device_events import router as device_events_router
+from authentication.services.auth import create_device_access_token
+from organization.services.gateway import CircuitBreaker, GatewayClientPool, GatewayUnavailableError
+from organization.tasks.provision_organization_resource import _call_gateway, get_poll_delay, get_provision_status
+from organization.services.provisioning import start_resource_provision_job
+from organization.services.purge import _deprovision, purge_organization
+from organization.tasks.purge_deleted_organizations import purge_deleted_organizations
+
+ORGANIZATION_SERVICE_SPEC = settings.BASE_DIR.parent.parent / "docs" / "organization_service.json"
+
+
+class StubGateway:
+    """
+    In-process Jarvis gateway serving the routes of docs/organization_service.json.
+    ``failures`` makes the next N requests answer with 503.
+    """
+
+    def __init__(self):
+        spec = json.loads(ORGANIZATION_SERVICE_SPEC.read_text())
+        self.routes = [
+            (method.upper(), re.compile("^" + re.sub(r"\{[^}]+\}", "[^/]+", path) + "$"))
+            for path, operations in spec["paths"].items()
+            for method in operations
+        ]
+        self.requests: list[httpx.Request] = []
+        self.failures = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if not any(method == request.method and pattern.match(request.url.path) for method, pattern in self.routes):
+            return httpx.Response(404, json={"detail": "Not Found"})
+        if self.failures > 0:
+            self.failures -= 1
+            return httpx.Response(503, json={"detail": "Service Unavailable"})
+        if request.url.path.endswith(("/provision/v1", "/deprovision/v1")):
+            return httpx.Response(200, json={"status": "in_progress"})
+        return httpx.Response(200, json={
+            "organization_id": "b1f8c7de-0000-4000-8000-000000000001",
+            "name": "Acme",
+            "is_active": True,
+            "indices": [{
+                "name": "user_access",
+                "major_version": 1,
+                "minor_version": 0,
+                "patch_version": 0,
+                "last_attempted_provisioned_at": "2026-01-01T00:00:00Z",
+                "provision_status": "completed",
+            }],
+        })
+
+
+@skipUnless(ORGANIZATION_SERVICE_SPEC.exists(), "docs/organization_service.json is not available")
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class ResourceServiceGatewayTest(SimpleTestCase):
+
+    def setUp(self):
+        self.gateway = StubGateway()
+        self.pool = GatewayClientPool("http://gateway", timeout=1, max_connections=5, transport=httpx.MockTransport(self.gateway))
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for target, value in [
+            ("organization.services.gateway.gateway_pool", self.pool),
+            ("organization.services.gateway.gateway_breaker", self.breaker),
+        ]:
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(constants, "JARVIS_GATEWAY_RETRY_BACKOFF_SECONDS", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache.clear()
+
+    async def test_requests_share_pooled_client_with_per_request_auth(self):
+        async with ResourceService(jwt_token="token-a") as svc:
+            resource = await svc.get_organization("org-1")
+        client = self.pool.get_client()
+        async with ResourceService(jwt_token="token-b") as svc:
+            await svc.get_organization("org-1")
+
+        self.assertEqual(resource.indices[0].name, "user_access")
+        self.assertIs(self.pool.get_client(), client)
+        self.assertEqual(
+            [request.headers["Authorization"] for request in self.gateway.requests],
+            ["Bearer token-a", "Bearer token-b"],
+        )
+        await self.pool.aclose()
+
+    async def test_idempotent_request_is_retried(self):
+        self.gateway.failures = 2
+        resource = await ResourceService(jwt_token="token").get_organization("org-1")
+
+        self.assertEqual(resource.name, "Acme")
+        self.assertEqual(len(self.gateway.requests), 3)
+
+    async def test_non_idempotent_request_is_not_retried(self):
+        self.gateway.failures = 1
+        with self.assertRaises(httpx.HTTPStatusError):
+            await ResourceService(jwt_token="token").create_organization(ManageResourceDto(organization_id="org-1"))
+
+        self.assertEqual(len(self.gateway.requests), 1)
+
+    async def test_open_breaker_fails_fast(self):
+        self.gateway.failures = 100
+        with self.assertRaises(httpx.HTTPStatusError):
+            await ResourceService(jwt_token="token").get_organization("org-1")
+        self.assertEqual(len(self.gateway.requests), 3)
+
+        with self.assertRaises(GatewayUnavailableError):
+            await ResourceService(jwt_token="token").get_organization("org-1")
+        self.assertEqual(len(self.gateway.requests), 3)
+
+    async def test_resource_is_cached_until_a_write_invalidates_it(self):
+        svc = ResourceService(jwt_token=self.user_token("alice"))
+        first = await svc.get_organization("org-1")
+        second = await svc.get_organization("org-1")
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.gateway.requests), 1)
+
+        await svc.provision_organization_index("org-1")
+        await svc.get_organization("org-1")
+        self.assertEqual(
+            [request.url.path for request in self.gateway.requests],
+            ["/organization/org-1/v1", "/organization/org-1/provision/v1", "/organization/org-1/v1"],
+        )
+
+    async def test_cached_resource_is_only_served_to_the_same_caller(self):
+        alice, mallory = self.user_token("alice"), self.user_token("mallory")
+        for token in [alice, alice, mallory, "not-a-jwt", "not-a-jwt"]:
+            await ResourceService(jwt_token=token).get_organization("org-1")
+
+        self.assertEqual(
+            [request.headers["Authorization"] for request in self.gateway.requests],
+            [f"Bearer {alice}", f"Bearer {mallory}", "Bearer not-a-jwt", "Bearer not-a-jwt"],
+        )
+
+    async def test_provision_poll_drops_cached_resources_of_every_caller(self):
+        alice = self.user_token("alice")
+        await ResourceService(jwt_token=alice).get_organization("org-1")
+        job = ResourceProvisionJob(organization_id="org-1", requested_by="bob")
+        with patch("organization.tasks.provision_organization_resource.create_access_token", AsyncMock(return_value=self.user_token("bob"))):
+            await _call_gateway(job, provision=False)
+        await ResourceService(jwt_token=alice).get_organization("org-1")
+
+        self.assertEqual(len(self.gateway.requests), 3)
+
+    @staticmethod
+    def user_token(username: str) -> str:
+        return jwt.encode({"sub": username}, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+class DeviceAccessTokenTest(SimpleTestCase):
+
+    def setUp(self):
+        self.device = Device(name="build-agent", organization_id="b1f8c7de-0000-4000-8000-000000000001")
+        self.indices = [ResourceIndexDto(
+            name="user_access", major_version=1, minor_version=0, patch_version=0,
+            last_attempted_provisioned_at="2026-01-01T00:00:00Z", provision_status="completed",
+        )]
+
+        self.revoke_device_tokens = AsyncMock()
+        self.is_device_token_revoked = AsyncMock(return_value=False)
+        for target, mock in [
+            ("organization.services.devices.revoke_device_tokens", self.revoke_device_tokens),
+            ("organization.services.devices.is_device_token_revoked", self.is_device_token_revoked),
+            ("organization.services.devices.bump_organization_version", MagicMock()),
+        ]:
+            patcher = patch(target, mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_token_is_reused_while_index_versions_match(self):
+        with patch.object(Device, "asave", AsyncMock()) as asave:
+            first, _ = await generate_device_access_token(self.device, self.indices)
+            second, _ = await generate_device_access_token(self.device, self.indices)
+
+        self.assertEqual(first, second)
+        asave.assert_awaited_once_with(update_fields=["api_key"])
+
+    async def test_token_is_signed_again_when_an_index_version_changes(self):
+        with patch.object(Device, "asave", AsyncMock()) as asave:
+            first, _ = await generate_device_access_token(self.device, self.indices)
+            self.indices[0].minor_version = 1
+            second, _ = await generate_device_access_token(self.device, self.indices)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.device.api_key, second)
+        self.assertEqual(asave.await_count, 2)
+
+    async def test_revoked_token_is_replaced_with_a_new_one(self):
+        with patch.object(Device, "asave", AsyncMock()):
+            first, _ = await generate_device_access_token(self.device, self.indices)
+            self.is_device_token_revoked.return_value = True
+            second, _ = await generate_device_access_token(self.device, self.indices)
+
+        self.assertNotEqual(first, second)
+        self.is_device_token_revoked.assert_awaited_with(first)
+        self.revoke_device_tokens.assert_awaited_with([first])
+
+    async def test_renaming_a_device_revokes_its_token(self):
+        self.device.api_key = "token-of-build-agent"
+        other_devices = MagicMock(aexists=AsyncMock(return_value=False))
+        with patch.object(Device.objects, "aget", AsyncMock(return_value=self.device)), \
+                patch.object(Device.objects, "filter", MagicMock(return_value=other_devices)), \
+                patch.object(Device, "asave", AsyncMock()):
+            device, error = await update_device(self.device.organization_id, self.device.id, name="release-agent")
+
+        self.assertIsNone(error)
+        self.assertIsNone(device.api_key)
+        self.revoke_device_tokens.assert_awaited_once_with(["token-of-build-agent"])
+
+
+class ResourceProvisionPollingTest(SimpleTestCase):
+
+    def build_resource(self, *statuses):
+        return ResourceDto(organization_id="org-1", name="Acme", is_active=True, indices=[
+            ResourceIndexDto(
+                name=f"index_{i}", major_version=1, minor_version=0, patch_version=0,
+                last_attempted_provisioned_at="2026-01-01T00:00:00Z", provision_status=status,
+            )
+            for i, status in enumerate(statuses)
+        ])
+
+    def test_provision_status_is_aggregated_over_indices(self):
+        self.assertEqual(get_provision_status(self.build_resource("completed", "completed")), "completed")
+        self.assertEqual(get_provision_status(self.build_resource("completed", "in_progress")), "in_progress")
+        self.assertEqual(get_provision_status(self.build_resource("completed", "failed")), "failed")
+        self.assertEqual(get_provision_status(self.build_resource()), "in_progress")
+        self.assertEqual(get_provision_status(None), "in_progress")
+
+    @patch.object(constants, "JARVIS_PROVISION_STALE_SECONDS", 600)
+    async def test_stale_active_job_is_failed_before_a_new_one_is_started(self):
+        job = ResourceProvisionJob(id=uuid.uuid4())
+        with patch("organization.services.provisioning.Organization.objects") as organizations, \
+                patch("organization.services.provisioning.ResourceProvisionJob.objects") as jobs, \
+                patch("organization.tasks.provision_organization_resource") as provision:
+            organizations.exclude.return_value.filter.return_value.aexists = AsyncMock(return_value=True)
+            jobs.filter.return_value.aupdate = AsyncMock(return_value=1)
+            jobs.filter.return_value.order_by.return_value.afirst = AsyncMock(return_value=None)
+            jobs.acreate = AsyncMock(return_value=job)
+            started, error = await start_resource_provision_job(uuid.uuid4(), requested_by="alice")
+
+        self.assertEqual((started, error), (job, None))
+        cutoff = jobs.filter.call_args_list[0].kwargs["updated_at__lt"]
+        self.assertAlmostEqual((datetime.now(timezone.utc) - cutoff).total_seconds(), 600, delta=5)
+        self.assertEqual(jobs.filter.return_value.aupdate.call_args.kwargs["status"], "failed")
+        provision.delay.assert_called_once_with(str(job.id))
+
+    async def test_conflicting_start_asks_to_try_again(self):
+        with patch("organization.services.provisioning.Organization.objects") as organizations, \
+                patch("organization.services.provisioning.ResourceProvisionJob.objects") as jobs:
+            organizations.exclude.return_value.filter.return_value.aexists = AsyncMock(return_value=True)
+            jobs.filter.return_value.aupdate = AsyncMock(return_value=0)
+            jobs.filter.return_value.order_by.return_value.afirst = AsyncMock(return_value=None)
+            jobs.acreate = AsyncMock(side_effect=IntegrityError)
+            job, error = await start_resource_provision_job(uuid.uuid4(), requested_by="alice")
+
+        self.assertIsNone(job)
+        self.assertIn("try again", error)
+
+    def test_poll_delay_backs_off_up_to_the_maximum(self):
+        with patch.object(constants, "JARVIS_PROVISION_POLL_INITIAL_SECONDS", 5), \
+                patch.object(constants, "JARVIS_PROVISION_POLL_MAX_SECONDS", 60):
+            self.assertEqual([get_poll_delay(attempt) for attempt in range(1, 7)], [5, 10, 20, 40, 60, 60])
+
+
+class DeviceTokenVerifierTest(SimpleTestCase):
+
+    def setUp(self):
+        self.verifier = DeviceTokenVerifier(sync_interval=60, max_entries=2)
+        self.verifier.load_revocations([])
+        self.token = create_device_access_token(
+            device_id="build-agent", organization_id="org-1", device_type="Desktop", elastic_indices=[],
+        )
+
+    def test_valid_token_is_accepted(self):
+        claims = self.verifier.verify(self.token)
+        self.assertEqual((claims["sub"], claims["organization_id"]), ("build-agent", "org-1"))
+        self.assertIs(self.verifier.verify(self.token), claims)
+
+    def test_revoked_token_is_rejected(self):
+        self.verifier.verify(self.token)
+        self.verifier.revoke_locally([get_device_token_digest(self.token)])
+        self.assertIsNone(self.verifier.verify(self.token))
+
+        reissued = create_device_access_token(
+            device_id="build-agent", organization_id="org-1", device_type="Desktop", elastic_indices=[],
+        )
+        self.assertNotEqual(reissued, self.token)
+        self.assertIsNotNone(self.verifier.verify(reissued))
+
+    def test_tampered_and_user_tokens_are_rejected(self):
+        self.assertIsNone(self.verifier.verify(self.token[:-2] + "xx"))
+        user_token = jwt.encode({"sub": "alice", "roles": []}, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        self.assertIsNone(self.verifier.verify(user_token))
+
+
+class DeviceEventIngestionTest(SimpleTestCase):
+
+    def setUp(self):
+        self.buffer = DeviceEventBuffer(flush_interval=3600, max_pending=1000)
+        self.token = create_device_access_token(
+            device_id="build-agent", organization_id="b1f8c7de-0000-4000-8000-000000000001",
+            device_type="Desktop", elastic_indices=[],
+        )
+        for target, value in [
+            ("organization.views.device_events.device_event_buffer", self.buffer),
+            ("organization.services.device_auth.device_token_verifier.sync", AsyncMock()),
+        ]:
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_batch_is_buffered_as_latest_timestamp_per_field(self):
+        client = TestAsyncClient(device_events_router)
+        response = await client.post("/", headers={"Authorization": f"Bearer {self.token}"}, json={"events": [
+            {"type": "heartbeat", "occurred_at": "2026-01-01T00:00:00Z"},
+            {"type": "heartbeat", "occurred_at": "2026-01-01T00:01:00Z"},
+            {"type": "upload", "occurred_at": "2026-01-01T00:00:30Z"},
+        ]})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json(), {"accepted": 3})
+        with patch("organization.services.device_events.write_device_events") as write:
+            self.assertEqual(await self.buffer.flush(), 1)
+        write.assert_called_once_with({
+            ("b1f8c7de-0000-4000-8000-000000000001", "build-agent"): {
+                "last_heartbeat_at": datetime(2026, 1, 1, 0, 1, tzinfo=timezone.utc),
+                "last_upload_at": datetime(2026, 1, 1, 0, 0, 30, tzinfo=timezone.utc),
+            }
+        })
+
+    async def test_invalid_token_and_oversized_batch_are_rejected(self):
+        client = TestAsyncClient(device_events_router)
+        response = await client.post("/", headers={"Authorization": "Bearer invalid"}, json={"events": [{"type": "heartbeat"}]})
+        self.assertEqual(response.status_code, 401)
+
+        response = await client.post("/", headers={"Authorization": f"Bearer {self.token}"}, json={"events": [{"type": "heartbeat"}] * 101})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self.buffer.pending_devices, 0)
+
+    async def test_failed_flush_keeps_events(self):
+        self.buffer.add("org-1", "build-agent", [("last_heartbeat_at", datetime(2026, 1, 1, tzinfo=timezone.utc))])
+        with patch("organization.services.device_events.write_device_events", side_effect=Exception("db down")):
+            self.assertEqual(await self.buffer.flush(), 0)
+        self.assertEqual(self.buffer.pending_devices, 1)
+
+
+class DeviceListCursorTest(SimpleTestCase):
+
+    def test_cursor_round_trip(self):
+        device = Device(name="build-agent")
+        self.assertEqual(decode_device_cursor(encode_device_cursor(device.name, device.id)), ("build-agent", device.id))
+
+    async def test_invalid_cursor_is_rejected(self):
+        devices, next_cursor, error = await list_devices("b1f8c7de-0000-4000-8000-000000000001", cursor="not-a-cursor")
+        self.assertEqual((devices, next_cursor, error), ([], None, "Invalid cursor."))
+
+
+class DeviceSerializationTest(SimpleTestCase):
+
+    def test_fast_path_renders_like_the_validated_schema(self):
+        device = Device(
+            name="build-agent", organization_id=uuid.UUID("b1f8c7de-0000-4000-8000-000000000001"),
+            created_at=datetime(2026, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            updated_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        )
+        validated = DeviceOut(**serialize_device(device)).model_dump()
+
+        self.assertEqual(serialize_device(device), validated)
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(None, serialize_device(device), response_status=200)),
+            json.loads(JSONRenderer().render(None, validated, response_status=200)),
+        )
+
+
+class ETagViewOut(Schema):
+    id: uuid.UUID
+    calls: int
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class OrganizationETagTest(SimpleTestCase):
+
+    def setUp(self):
+        self.org_id = uuid.uuid4()
+        self.calls = 0
+        router = Router()
+
+        @router.get("/{org_id}", response={200: ETagViewOut})
+        @etag_org_version(OrganizationVersionScope.ORGANIZATION)
+        async def view(request, org_id: uuid.UUID):
+            self.calls += 1
+            return 200, {"id": org_id, "calls": self.calls, "unlisted": "not in the schema"}
+
+        self.client = TestAsyncClient(router)
+
+    async def get(self, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        path = f"/{self.org_id}"
+        return await self.client.get(path, headers=headers, get_full_path=lambda: path)
+
+    async def test_matching_etag_is_answered_without_calling_the_view(self):
+        response = await self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('W/"'))
+
+        not_modified = await self.get(response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+        self.assertEqual(self.calls, 1)
+
+    async def test_change_produces_a_new_etag(self):
+        etag = (await self.get())["ETag"]
+        bump_organization_version(self.org_id, OrganizationVersionScope.ORGANIZATION)
+
+        response = await self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["calls"], 2)
+
+    async def test_other_scopes_keep_the_etag_and_results_are_validated(self):
+        response = await self.get()
+        bump_organization_version(self.org_id, OrganizationVersionScope.DEVICES)
+
+        self.assertEqual((await self.get(response["ETag"])).status_code, 304)
+        self.assertEqual(response.json(), {"id": str(self.org_id), "calls": 1})
+
+    async def test_etag_with_a_max_age_changes_every_window(self):
+        router = Router()
+
+        @router.get("/{org_id}", response={200: ETagViewOut})
+        @etag_org_version(OrganizationVersionScope.DEVICES, max_age_seconds=30)
+        async def view(request, org_id: uuid.UUID):
+            self.calls += 1
+            return 200, {"id": org_id, "calls": self.calls}
+
+        self.client = TestAsyncClient(router)
+        with patch("organization.decorators.time.time", return_value=600):
+            etag = (await self.get())["ETag"]
+        with patch("organization.decorators.time.time", return_value=629):
+            self.assertEqual((await self.get(etag)).status_code, 304)
+        with patch("organization.decorators.time.time", return_value=630):
+            self.assertEqual((await self.get(etag)).status_code, 200)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class FleetSummaryTest(SimpleTestCase):
+
+    def setUp(self):
+        self.org_id = uuid.uuid4()
+        self.row = {
+            "total": 5, "inactive": 1, "online": 2, "stale": 1, "never_connected": 1,
+            "os_type__Windows": 3, "os_type__Ubuntu": 2, "device_type__Desktop": 5,
+            "last_upload_at__p50": timedelta(seconds=90), "last_upload_at__p95": timedelta(minutes=10),
+            "last_processed_at__p50": None, "last_processed_at__p95": None,
+        }
+
+    async def test_summary_is_computed_once_until_devices_change(self):
+        aggregate = AsyncMock(return_value=self.row)
+        with patch.object(Device.objects, "filter", return_value=type("QS", (), {"aaggregate": aggregate})()):
+            summary = await get_fleet_summary(self.org_id)
+            await get_fleet_summary(self.org_id)
+            self.assertEqual(aggregate.await_count, 1)
+
+            bump_organization_version(self.org_id, OrganizationVersionScope.ORGANIZATION)
+            await get_fleet_summary(self.org_id)
+            self.assertEqual(aggregate.await_count, 1)
+
+            bump_organization_version(self.org_id, OrganizationVersionScope.DEVICES)
+            await get_fleet_summary(self.org_id)
+            self.assertEqual(aggregate.await_count, 2)
+
+        self.assertEqual(summary["connection"], {"online": 2, "stale": 1, "never_connected": 1})
+        self.assertEqual(summary["os_type"], {"Windows": 3, "Ubuntu": 2})
+        self.assertEqual(summary["upload_lag_seconds"], {"p50": 90.0, "p95": 600.0})
+        self.assertEqual(summary["processed_lag_seconds"], {"p50": None, "p95": None})
+
+
+class DeviceImportTest(SimpleTestCase):
+
+    def test_csv_rows_are_validated_and_checked_against_existing_names(self):
+        stream = io.StringIO(
+            "name,description,os_type,configurations\n"
+            "agent-1,,Windows,user_access; io_device_usage\n"
+            "agent-2,Taken,,\n"
+            "agent-1,Repeated,,\n"
+            "agent-3,,Solaris,\n"
+            ",No name,,\n"
+        )
+        rows = list(parse_device_csv(stream))
+        self.assertEqual(rows[0], {"name": "agent-1", "os_type": "Windows", "configurations": ["user_access", "io_device_usage"]})
+
+        class Rows(list):
+            def values_list(self, *args, **kwargs):
+                return self
+
+        def filter(**kwargs):
+            if "name__in" in kwargs:
+                return Rows(name for name in kwargs["name__in"] if name == "agent-2")
+            return Rows(kwargs["id__in"])
+
+        with patch.object(Device.objects, "filter", side_effect=filter), \
+                patch.object(Device.objects, "bulk_create") as create_devices, \
+                patch("organization.models.DeviceConfiguration.objects.bulk_create") as create_configurations, \
+                patch("organization.services.device_import.bump_organization_version"):
+            created, errors = import_devices_sync(uuid.uuid4(), rows, chunk_size=2)
+
+        self.assertEqual(created, 1)
+        self.assertEqual([device.name for device in create_devices.call_args.args[0]], ["agent-1"])
+        self.assertEqual(
+            sorted(configuration.data_type for configuration in create_configurations.call_args.args[0]),
+            ["io_device_usage", "user_access"],
+        )
+        self.assertEqual([(error["row"], error["name"]) for error in errors], [
+            (2, "agent-2"), (3, "agent-1"), (4, "agent-3"), (5, None),
+        ])
+
+    def test_json_batch_is_accepted_with_invalid_rows_for_per_row_errors(self):
+        batch = DeviceImportBatchIn(devices=[{"name": "agent-1"}, {"name": "agent-2", "os_type": "Solaris"}, {}])
+        def filter(**kwargs):
+            return MagicMock(values_list=lambda *args, **kw: list(kwargs.get("id__in", [])))
+
+        with patch.object(Device.objects, "filter", side_effect=filter), \
+                patch.object(Device.objects, "bulk_create"), \
+                patch("organization.models.DeviceConfiguration.objects.bulk_create"), \
+                patch("organization.services.device_import.bump_organization_version"):
+            created, errors = import_devices_sync(uuid.uuid4(), batch.devices)
+
+        self.assertEqual(created, 1)
+        self.assertEqual([(error["row"], error["name"]) for error in errors], [(2, "agent-2"), (3, None)])
+
+    def test_csv_over_the_byte_or_row_limit_is_refused_before_importing(self):
+        csv_file = io.BytesIO(b"name\n" + b"".join(b"agent-%d\n" % i for i in range(3)))
+        self.assertEqual(read_device_csv(csv_file, size=100, max_bytes=10), (None, "The file is larger than 10 bytes."))
+        self.assertEqual(read_device_csv(csv_file, size=None, max_rows=2), (None, "The file has more than 2 rows."))
+
+        rows, error = read_device_csv(io.BytesIO(b"name\nagent-1\n"), size=14)
+        self.assertEqual((rows, error), ([{"name": "agent-1", "configurations": []}], None))
+
+
+class DeviceConfigurationBulkTest(SimpleTestCase):
+
+    def test_assignment_inserts_every_pair_ignoring_existing_ones(self):
+        device_ids = [uuid.uuid4() for _ in range(3)]
+        selected = type("QS", (), {"values_list": lambda self, *args, **kwargs: device_ids})()
+        with patch("organization.services.devices._select_devices", return_value=(selected, None)), \
+                patch("organization.services.devices.transaction.atomic"), \
+                patch("organization.services.devices.DEVICE_CONFIGURATION_BULK_CHUNK_SIZE", 2), \
+                patch("organization.models.DeviceConfiguration.objects.bulk_create") as bulk_create, \
+                patch("organization.services.devices.bump_organization_version") as bump:
+            devices, error = assign_device_configurations_sync(uuid.uuid4(), ["user_access", "io_device_usage"], select_all=True)
+
+        self.assertIsNone(error)
+        self.assertEqual(devices, 3)
+        self.assertEqual(bulk_create.call_count, 2)
+        self.assertTrue(all(call.kwargs["ignore_conflicts"] for call in bulk_create.call_args_list))
+        pairs = {(config.device_id, config.data_type) for call in bulk_create.call_args_list for config in call.args[0]}
+        self.assertEqual(len(pairs), 6)
+        bump.assert_called_once()
+
+    @staticmethod
+    def lookups(queryset):
+        return {
+            (child.lhs.target.name, child.lookup_name, tuple(child.rhs) if isinstance(child.rhs, list) else child.rhs)
+            for child in queryset.query.where.children
+        }
+
+    def test_selection_is_narrowed_to_the_given_devices_and_filters(self):
+        org_id, device_ids = uuid.uuid4(), [uuid.uuid4(), uuid.uuid4()]
+        devices, error = _select_devices(org_id, device_ids=device_ids, os_type="Windows")
+
+        self.assertIsNone(error)
+        self.assertEqual(
+            self.lookups(devices),
+            {("organization", "exact", org_id), ("id", "in", tuple(device_ids)), ("os_type", "exact", "Windows")},
+        )
+
+        devices, error = _select_devices(org_id, select_all=True)
+        self.assertEqual(self.lookups(devices), {("organization", "exact", org_id)})
+
+    async def test_changes_without_a_selector_are_refused(self):
+        with patch("organization.models.DeviceConfiguration.objects.bulk_create") as bulk_create, \
+                patch("organization.models.DeviceConfiguration.objects.filter") as filter_configurations:
+            devices, error = assign_device_configurations_sync(uuid.uuid4(), ["user_access"])
+            removed, remove_error = await remove_device_configurations(uuid.uuid4(), ["user_access"])
+
+        self.assertIsNone(devices)
+        self.assertIsNone(removed)
+        self.assertIn("all", error)
+        self.assertEqual(error, remove_error)
+        bulk_create.assert_not_called()
+        filter_configurations.assert_not_called()
+
+
+class DeleteOrganizationTest(SimpleTestCase):
+
+    @patch("portfolio_django_admin.constants.ORGANIZATION_PURGE_DELAY_SECONDS", 0)
+    async def test_members_are_notified_and_evicted_in_one_call_each(self):
+        org_id = uuid.uuid4()
+        org = MagicMock(asave=AsyncMock())
+        org.name = "Acme"
+        members = MagicMock()
+        members.__aiter__.return_value = [(1, "alice"), (2, "bob"), (3, "carol")]
+        with patch("organization.services.organization.Organization.objects") as organizations, \
+                patch("organization.services.organization.OrganizationUser.objects") as org_users, \
+                patch("organization.services.organization.bump_organization_version"), \
+                patch("organization.services.organization.publish_bulk_notification") as publish, \
+                patch("organization.services.organization.cache") as cache, \
+                patch("organization.tasks.purge_deleted_organization") as purge:
+            organizations.exclude.return_value.aget = AsyncMock(return_value=org)
+            org_users.filter.return_value.values_list.return_value = members
+            self.assertTrue(await delete_organization(org_id))
+
+        publish.delay.assert_called_once()
+        self.assertEqual(publish.delay.call_args.args[0]["user_ids"], [1, 2, 3])
+        cache.delete_many.assert_called_once_with([build_cache_key(org_id, name) for name in ("alice", "bob", "carol")])
+        cache.delete.assert_not_called()
+        purge.delay.assert_called_once_with(str(org_id))
+
+
+class OrganizationPurgeSweepTest(SimpleTestCase):
+
+    @patch("portfolio_django_admin.constants.ORGANIZATION_PURGE_DELAY_SECONDS", 3600)
+    def test_only_organizations_past_the_grace_period_are_enqueued(self):
+        org_ids = [uuid.uuid4(), uuid.uuid4()]
+        with patch("organization.tasks.purge_deleted_organizations.pending_purge_organizations") as pending, \
+                patch("organization.tasks.purge_deleted_organizations.purge_deleted_organization") as purge:
+            ordered = pending.return_value.filter.return_value.order_by.return_value
+            ordered.values_list.return_value.__getitem__.return_value = org_ids
+            purge_deleted_organizations()
+
+        cutoff = pending.return_value.filter.call_args.kwargs["updated_at__lte"]
+        self.assertAlmostEqual((datetime.now(timezone.utc) - cutoff).total_seconds(), 3600, delta=5)
+        self.assertEqual([call.args[0] for call in purge.delay.call_args_list], [str(org_id) for org_id in org_ids])
+
+
+class OrganizationPurgeTest(SimpleTestCase):
+
+    def setUp(self):
+        pending = patch("organization.services.purge.pending_purge_organizations")
+        self.pending = pending.start()
+        self.addCleanup(pending.stop)
+        self.pending.return_value.filter.return_value.aexists = AsyncMock(return_value=True)
+
+    async def test_organization_without_an_admin_is_left_unpurged(self):
+        with patch("organization.services.purge.OrganizationUser.objects") as org_users, \
+                patch("organization.services.purge.Device.objects") as devices, \
+                patch("organization.services.purge.Organization.objects") as organizations:
+            org_users.filter.return_value.order_by.return_value.values_list.return_value.afirst = AsyncMock(return_value=None)
+            counts, error = await purge_organization(uuid.uuid4())
+
+        self.assertIsNone(counts)
+        self.assertIn("no admin", error)
+        devices.filter.assert_not_called()
+        organizations.filter.assert_not_called()
+
+    async def test_index_unknown_to_the_gateway_counts_as_deprovisioned(self):
+        async def deprovision(self, organization_id):
+            request = httpx.Request("POST", f"http://gateway/organization/{organization_id}/deprovision/v1")
+            raise httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+
+        with patch("organization.services.purge.OrganizationUser.objects") as org_users, \
+                patch("organization.services.purge.create_access_token", AsyncMock(return_value="token")), \
+                patch.object(ResourceService, "deprovision_organization_index", deprovision):
+            org_users.filter.return_value.order_by.return_value.values_list.return_value.afirst = AsyncMock(return_value="alice")
+            self.assertIsNone(await _deprovision(uuid.uuid4()))
+
+    async def test_device_tokens_are_revoked_before_devices_are_deleted(self):
+        batch = MagicMock()
+        batch.__aiter__.return_value = [(uuid.uuid4(), "token-1"), (uuid.uuid4(), "token-2")]
+        with patch("organization.services.purge._deprovision", AsyncMock(return_value=None)), \
+                patch("organization.services.purge.Device.objects") as devices, \
+                patch("organization.services.purge.DeviceConfiguration.objects") as configurations, \
+                patch("organization.services.purge.revoke_device_tokens", AsyncMock(side_effect=RuntimeError)) as revoke, \
+                self.assertRaises(RuntimeError):
+            devices.filter.return_value.values_list.return_value.__getitem__.return_value = batch
+            devices.filter.return_value.adelete = AsyncMock()
+            await purge_organization(uuid.uuid4())
+
+        revoke.assert_awaited_once_with(["token-1", "token-2"])
+        configurations.filter.assert_not_called()
+        devices.filter.return_value.adelete.assert_not_awaited()
+
+
+class OrganizationUserListTest(SimpleTestCase):
+
+    def test_cursor_round_trip_keeps_microseconds_and_timezone(self):
+        created_at, org_user_id = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc), uuid.uuid4()
+        cursor = encode_organization_user_cursor(created_at, org_user_id)
+        self.assertEqual(decode_organization_user_cursor(cursor), (created_at, org_user_id))
+
+    async def test_invalid_cursor_is_rejected(self):
+        users, next_cursor, error = await list_organization_users(uuid.uuid4(), cursor="not-a-cursor")
+        self.assertEqual((users, next_cursor, error), ([], None, "Invalid cursor."))
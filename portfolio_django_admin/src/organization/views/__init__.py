@@ -6,4 +6,6 @@ from .devices import router as devices_router
 
 from .resources import router as resources_router
 
-__all__ = ["organization_router", "invitations_router", "devices_router", "resources_router"]
+from .device_events import router as device_events_router
+
+__all__ = ["organization_router", "invitations_router", "devices_router", "resources_router", "device_events_router"]
@@ -0,0 +1,49 @@
+"""
+Available Routes:
+
+# Post Methods (requires device access token)
+1. Report Device Events
+"""
+
+from ninja import Router
+from uuid import UUID
+from datetime import datetime, timezone
+
+from organization.constants import DEVICE_EVENT_FIELDS
+from organization.schemas import DeviceEventBatchIn, DeviceEventBatchOut, ErrorMessage
+from organization.services.device_auth import DeviceAuthBearer
+from organization.services.device_events import device_event_buffer
+
+router = Router(tags=["Device Events"], auth=DeviceAuthBearer())
+
+
+def _get_event_timestamp(occurred_at: datetime | None, now: datetime) -> datetime:
+    """Events without a timestamp happened now; naive ones are UTC and future ones are capped."""
+    if occurred_at is None:
+        return now
+    if occurred_at.tzinfo is None:
+        occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+    return min(occurred_at, now)
+
+
+@router.post(
+    "/",
+    response={202: DeviceEventBatchOut, 400: ErrorMessage},
+)
+async def report_device_events(request, payload: DeviceEventBatchIn):
+    """
+    Accepts a batch of heartbeat, upload and processed events of the authenticated
+    device. The events are buffered and written in the background.
+    """
+    try:
+        organization_id = str(UUID(request.auth["organization_id"]))
+    except ValueError:
+        return 400, {"message": "The device token does not belong to a valid organization."}
+
+    now = datetime.now(timezone.utc)
+    device_event_buffer.add(
+        organization_id,
+        request.auth["sub"],
+        [(DEVICE_EVENT_FIELDS[event.type.value], _get_event_timestamp(event.occurred_at, now)) for event in payload.events],
+    )
+    return 202, DeviceEventBatchOut(accepted=len(payload.events))
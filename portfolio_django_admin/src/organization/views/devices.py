@@ -3,35 +3,48 @@ Available Routes:
 
 # Post, Put, Delete Methods (requires admin role of organization)
 1. Add device
-2. Deactivate device
-3. Remove Device
-4. Add Device Configuration
-5. Remove Device Configuration
-6. Download Installation File
+2. Import devices (JSON or CSV)
+3. Deactivate device
+4. Remove Device
+5. Add Device Configuration
+6. Remove Device Configuration
+7. Assign or remove configurations of many devices
+8. Download Installation File
 
 # Get Methods
 1. List Devices
-2. Get Device Details
-3. Check Connection Status
+2. Get Fleet Summary
+3. Get Device Details
+4. Check Connection Status
 """
 
 import logging
 
-from ninja import Router
-from typing import List
+from ninja import File, Query, Router
+from ninja.files import UploadedFile
+from typing import List, Optional, Tuple
 from uuid import UUID
 from django.http import HttpResponse
 
 from organization.schemas import (
     DeviceIn,
     DeviceUpdate,
+    DeviceImportBatchIn,
+    DeviceImportOut,
     DeviceOut,
+    DeviceListFilters,
+    DevicePageOut,
     DeviceDetailOut,
     DeviceConfigurationIn,
     DeviceConfigurationOut,
+    DeviceConfigurationBulkIn,
+    DeviceConfigurationBulkOut,
     DeviceConnectionStatusOut,
+    FleetSummaryOut,
     DeviceInstallationDetailsOut,
     ErrorMessage,
+    ResourceDto,
+    serialize_device,
 )
 from organization.services import (
     add_device,
@@ -42,9 +55,14 @@ from organization.services import (
     remove_device,
     add_device_configuration,
     remove_device_configuration,
+    assign_device_configurations,
+    remove_device_configurations,
     get_device_connection_status,
+    get_installation_device,
     generate_device_access_token,
-    get_organization,
+    get_fleet_summary,
+    import_devices,
+    read_device_csv,
     ResourceService
 )
 from authentication.constants import (
@@ -52,7 +70,10 @@ from authentication.constants import (
     OrganizationRoleType,
 )
 from authentication.services import AuthBearer
-from organization.decorators import require_org_roles
+from organization.constants import OrganizationStatus, OrganizationVersionScope
+from organization.decorators import require_org_roles, etag_org_version
+import portfolio_django_admin.constants as constants
+from portfolio_django_admin.renderers import render_json
 
 router = Router(tags=["Devices"], auth=AuthBearer())
 
@@ -89,23 +110,72 @@ async def add_device_endpoint(request, org_id: UUID, payload: DeviceIn):
     if error:
         return 409, {"message": error}
 
-    return 201, DeviceOut(
-        id=device.id,
-        organization_id=org_id,
-        name=device.name,
-        description=device.description,
-        device_type=device.device_type,
-        is_active=device.is_active,
-        created_at=device.created_at,
-        updated_at=device.updated_at,
-        last_heartbeat_at=device.last_heartbeat_at,
-        last_upload_at=device.last_upload_at,
-        last_processed_at=device.last_processed_at,
-        os_type=device.os_type,
-        os_version=device.os_version,
-        script_downloaded_at=device.script_downloaded_at,
-        script_downloaded_by=device.script_downloaded_by,
+    return 201, serialize_device(device)
+
+
+@router.post(
+    "/{org_id}/import",
+    response={200: DeviceImportOut, 403: ErrorMessage},
+)
+@require_org_roles(ORG_ADMIN_ROLES)
+async def import_devices_endpoint(request, org_id: UUID, payload: DeviceImportBatchIn):
+    created, errors = await import_devices(org_id, payload.devices, updated_by=request.auth["sub"])
+    return 200, {"created": created, "errors": errors}
+
+
+@router.post(
+    "/{org_id}/import/csv",
+    response={200: DeviceImportOut, 400: ErrorMessage, 403: ErrorMessage},
+)
+@require_org_roles(ORG_ADMIN_ROLES)
+async def import_devices_csv_endpoint(request, org_id: UUID, file: File[UploadedFile]):
+    """
+    Columns: name, description, device_type, os_type, os_version and configurations
+    (data types separated by semicolons). Only name is required.
+    """
+    rows, error = read_device_csv(file.file, file.size)
+    if error:
+        return 400, {"message": error}
+    created, errors = await import_devices(org_id, rows, updated_by=request.auth["sub"])
+    return 200, {"created": created, "errors": errors}
+
+
+@router.post(
+    "/{org_id}/configurations",
+    response={200: DeviceConfigurationBulkOut, 400: ErrorMessage, 403: ErrorMessage},
+)
+@require_org_roles(ORG_ADMIN_ROLES)
+async def assign_device_configurations_endpoint(request, org_id: UUID, payload: DeviceConfigurationBulkIn):
+    devices, error = await assign_device_configurations(
+        org_id,
+        data_types=[data_type.value for data_type in payload.data_types],
+        device_ids=payload.device_ids,
+        is_active=payload.is_active,
+        os_type=payload.os_type.value if payload.os_type else None,
+        select_all=payload.all,
+    )
+    if error:
+        return 400, {"message": error}
+    return 200, {"devices": devices}
+
+
+@router.post(
+    "/{org_id}/configurations/remove",
+    response={200: DeviceConfigurationBulkOut, 400: ErrorMessage, 403: ErrorMessage},
+)
+@require_org_roles(ORG_ADMIN_ROLES)
+async def remove_device_configurations_endpoint(request, org_id: UUID, payload: DeviceConfigurationBulkIn):
+    removed, error = await remove_device_configurations(
+        org_id,
+        data_types=[data_type.value for data_type in payload.data_types],
+        device_ids=payload.device_ids,
+        is_active=payload.is_active,
+        os_type=payload.os_type.value if payload.os_type else None,
+        select_all=payload.all,
     )
+    if error:
+        return 400, {"message": error}
+    return 200, {"removed": removed}
 
 @router.put(
     "/{org_id}/{device_id}/",
@@ -124,51 +194,40 @@ async def update_device_endpoint(request, org_id: UUID, device_id: UUID, payload
 
     if error:
         return 404, {"message": error}
-    return 200, DeviceOut(
-        id=device.id,
-        organization_id=org_id,
-        name=device.name,
-        description=device.description,
-        device_type=device.device_type,
-        is_active=device.is_active,
-        created_at=device.created_at,
-        updated_at=device.updated_at,
-        last_heartbeat_at=device.last_heartbeat_at,
-        last_upload_at=device.last_upload_at,
-        last_processed_at=device.last_processed_at,
-        os_type=device.os_type,
-        os_version=device.os_version,
-        script_downloaded_at=device.script_downloaded_at,
-        script_downloaded_by=device.script_downloaded_by,
-    )
+    return 200, serialize_device(device)
 
 @router.get(
     "/{org_id}/",
-    response={200: List[DeviceOut], 403: ErrorMessage},
+    response={200: DevicePageOut, 400: ErrorMessage, 403: ErrorMessage},
 )
 @require_org_roles(list(OrganizationRoleType))
-async def list_devices_endpoint(request, org_id: UUID):
-    devices = await list_devices(org_id)
-    return 200, [
-        DeviceOut(
-            id=device.id,
-            organization_id=org_id,
-            name=device.name,
-            description=device.description,
-            device_type=device.device_type,
-            is_active=device.is_active,
-            created_at=device.created_at,
-            updated_at=device.updated_at,
-            last_heartbeat_at=device.last_heartbeat_at,
-            last_upload_at=device.last_upload_at,
-            last_processed_at=device.last_processed_at,
-            os_type=device.os_type,
-            os_version=device.os_version,
-            script_downloaded_at=device.script_downloaded_at,
-            script_downloaded_by=device.script_downloaded_by,
-        )
-        async for device in devices
-    ]
+@etag_org_version(OrganizationVersionScope.DEVICES, max_age_seconds=constants.DEVICE_STATUS_ETAG_SECONDS)
+async def list_devices_endpoint(request, org_id: UUID, filters: Query[DeviceListFilters]):
+    devices, next_cursor, error = await list_devices(
+        org_id,
+        limit=filters.limit,
+        cursor=filters.cursor,
+        is_active=filters.is_active,
+        os_type=filters.os_type.value if filters.os_type else None,
+        stale_since=filters.stale_since,
+    )
+    if error:
+        return 400, {"message": error}
+
+    # Rows are rendered as they are, without validating each one against DeviceOut.
+    return render_json({
+        "items": [serialize_device(device) for device in devices],
+        "next_cursor": next_cursor,
+    })
+
+
+@router.get(
+    "/{org_id}/summary",
+    response={200: FleetSummaryOut, 403: ErrorMessage},
+)
+@require_org_roles(list(OrganizationRoleType))
+async def get_fleet_summary_endpoint(request, org_id: UUID):
+    return 200, await get_fleet_summary(org_id)
 
 
 @router.get(
@@ -192,24 +251,7 @@ async def get_device_details_endpoint(request, org_id: UUID, device_id: UUID):
         for config in device.configurations.all() if hasattr(device, 'configurations')
     ]
 
-    return 200, DeviceDetailOut(
-        id=device.id,
-        organization_id=org_id,
-        name=device.name,
-        description=device.description,
-        device_type=device.device_type,
-        is_active=device.is_active,
-        created_at=device.created_at,
-        updated_at=device.updated_at,
-        last_heartbeat_at=device.last_heartbeat_at,
-        last_upload_at=device.last_upload_at,
-        last_processed_at=device.last_processed_at,
-        os_type=device.os_type,
-        os_version=device.os_version,
-        script_downloaded_at=device.script_downloaded_at,
-        script_downloaded_by=device.script_downloaded_by,
-        configurations=configurations,
-    )
+    return 200, {**serialize_device(device), "configurations": configurations}
 
 
 @router.post(
@@ -222,23 +264,7 @@ async def deactivate_device_endpoint(request, org_id: UUID, device_id: UUID):
     if error:
         return 404, {"message": error}
 
-    return 200, DeviceOut(
-        id=device.id,
-        organization_id=org_id,
-        name=device.name,
-        description=device.description,
-        device_type=device.device_type,
-        is_active=device.is_active,
-        created_at=device.created_at,
-        updated_at=device.updated_at,
-        last_heartbeat_at=device.last_heartbeat_at,
-        last_upload_at=device.last_upload_at,
-        last_processed_at=device.last_processed_at,
-        os_type=device.os_type,
-        os_version=device.os_version,
-        script_downloaded_at=device.script_downloaded_at,
-        script_downloaded_by=device.script_downloaded_by,
-    )
+    return 200, serialize_device(device)
 
 
 @router.delete(
@@ -299,6 +325,7 @@ async def remove_device_configuration_endpoint(request, org_id: UUID, device_id:
     response={200: DeviceConnectionStatusOut, 403: ErrorMessage, 404: ErrorMessage},
 )
 @require_org_roles(list(OrganizationRoleType))
+@etag_org_version(OrganizationVersionScope.DEVICES, max_age_seconds=constants.DEVICE_STATUS_ETAG_SECONDS)
 async def check_connection_status_endpoint(request, org_id: UUID, device_id: UUID):
     device = await get_device_connection_status(org_id, device_id)
     if not device:
@@ -317,24 +344,37 @@ async def check_connection_status_endpoint(request, org_id: UUID, device_id: UUI
 # Download installation file endpoint
 # ---------------------------------------------------------------------------
 
+async def _fetch_organization_resource(user_token: str, org_id: UUID) -> Tuple[Optional[ResourceDto], Optional[str]]:
+    try:
+        async with ResourceService(jwt_token=user_token) as resource_service:
+            return await resource_service.get_organization(str(org_id)), None
+    except Exception as e:
+        logger.error("Failed to retrieve organization resources for org %s: %s", org_id, e)
+        return None, "Failed to retrieve organization resources."
+
+
 @router.get(
     "/{org_id}/{device_id}/installation-details",
     response={400: ErrorMessage, 403: ErrorMessage, 404: ErrorMessage, 200:DeviceInstallationDetailsOut, 402: DeviceInstallationDetailsOut},
 )
 @require_org_roles(list(OrganizationRoleType))
 async def fetch_installation_details(request, org_id: UUID, device_id: UUID):
-    device = await get_device_details(org_id, device_id)
-    if not device:
-        return 404, {"message": "Device not found"}
-    
     user_token = _get_jwt_token(request)
     if not user_token or len(user_token) == 0:
         return 403, {"message": "Authorization token is missing or invalid."}
-    
-    organization = await get_organization(org_id)
-    if not organization:
+
+    # The device and its organization are checked first, so that missing devices and
+    # unpaid organizations are answered without calling the gateway.
+    device = await get_installation_device(org_id, device_id)
+    if not device:
+        return 404, {"message": "Device not found"}
+    if not device.is_active:
+        return 400, {"message": "The device is deactivated."}
+
+    organization = device.organization
+    if organization.status == OrganizationStatus.DELETED.value:
         return 404, {"message": "Organization not found"}
-    
+
     if not organization.last_paid_at:
         return 402, DeviceInstallationDetailsOut(
             api_key="N/A",
@@ -344,21 +384,14 @@ async def fetch_installation_details(request, org_id: UUID, device_id: UUID):
             message="Your current subscription does not allow downloading the installation script. Please upgrade your subscription to access this feature. Contact zuhairmhtb@gmail.com for further details."
         )
 
-    logger.info("No API key found for device %s. Generating new access token.", device_id)        
-    try:
-        async with ResourceService(jwt_token=user_token) as resource_service:
-            resource = await resource_service.get_organization(str(org_id))
-            if not resource or not resource.indices or len(resource.indices) == 0:
-                return 404, {"message": "Organization resources not found. Please make sure you provisioned the resource"}
-    except Exception as e:
-        logger.error("Failed to retrieve organization resources for org %s: %s", org_id, e)
-        return 400, {"message": "Failed to retrieve organization resources."}
-    
-
+    resource, resource_error = await _fetch_organization_resource(user_token, org_id)
+    if resource_error:
+        return 400, {"message": resource_error}
+    if not resource or not resource.indices or len(resource.indices) == 0:
+        return 404, {"message": "Organization resources not found. Please make sure you provisioned the resource"}
 
     token, error = await generate_device_access_token(
-        device_id=device.id,
-        organization_id=org_id,
+        device=device,
         resources=resource.indices
     )
     if error:
@@ -1,4 +1,4 @@
-from ninja import Router
+from ninja import Query, Router
 from typing import List
 from uuid import UUID
 from organization.schemas import (
@@ -7,6 +7,8 @@ from organization.schemas import (
     OrganizationOut,
     OrganizationUserUpdateIn,
     OrganizationUserOut,
+    OrganizationUserListFilters,
+    OrganizationUserPageOut,
     OrganizationLeaveOut,
     ErrorMessage,
 )
@@ -31,7 +33,8 @@ from authentication.constants import (
     MANAGER_ASSIGNABLE_ROLES,
 )
 from authentication.services import AuthBearer
-from organization.decorators import require_org_roles
+from organization.decorators import require_org_roles, etag_org_version
+from organization.constants import OrganizationVersionScope
 
 router = Router(tags=["Organization"], auth=AuthBearer())
 
@@ -95,6 +98,7 @@ async def select_org(request, org_id: UUID):
 
 @router.get("/{org_id}", response={200: OrganizationOut, 403: ErrorMessage, 404: ErrorMessage})
 @require_org_roles(list(OrganizationRoleType))
+@etag_org_version(OrganizationVersionScope.ORGANIZATION)
 async def get_org(request, org_id: UUID):
     org = await get_organization(org_id)
     if not org:
@@ -151,23 +155,36 @@ async def delete_org(request, org_id: UUID):
 
 @router.get(
     "/{org_id}/users",
-    response={200: List[OrganizationUserOut], 403: ErrorMessage},
+    response={200: OrganizationUserPageOut, 400: ErrorMessage, 403: ErrorMessage},
 )
 @require_org_roles(list(OrganizationRoleType))
-async def list_org_users(request, org_id: UUID):
-    users = await list_organization_users(org_id)
-    return 200, [
-        OrganizationUserOut(
-            id=user.id,
-            organization_id=org_id,
-            email=user.user.email,
-            role=user.role,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            invitation_status=user.invitation_status,
-        )
-        async for user in users
-    ]
+@etag_org_version(OrganizationVersionScope.ORGANIZATION)
+async def list_org_users(request, org_id: UUID, filters: Query[OrganizationUserListFilters]):
+    users, next_cursor, error = await list_organization_users(
+        org_id,
+        limit=filters.limit,
+        cursor=filters.cursor,
+        role=filters.role.value if filters.role else None,
+        invitation_status=filters.invitation_status.value if filters.invitation_status else None,
+    )
+    if error:
+        return 400, {"message": error}
+
+    return 200, {
+        "items": [
+            OrganizationUserOut(
+                id=user.id,
+                organization_id=org_id,
+                email=user.user.email,
+                role=user.role,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+                invitation_status=user.invitation_status,
+            )
+            for user in users
+        ],
+        "next_cursor": next_cursor,
+    }
 
 
 @router.patch(
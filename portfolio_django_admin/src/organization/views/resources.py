@@ -1,8 +1,8 @@
 from ninja import Router
 from uuid import UUID
-from organization.schemas.resources import ManageResourceDto, ResourceDto
+from organization.schemas.resources import ManageResourceDto, ResourceDto, ResourceProvisionJobOut
 from organization.schemas import ErrorMessage
-from organization.services import ResourceService
+from organization.services import ResourceService, start_resource_provision_job, get_resource_provision_job
 from authentication.constants import ORG_ADMIN_ROLES
 from authentication.services import AuthBearer
 from organization.decorators import require_org_roles
@@ -44,19 +44,31 @@ async def create_resource(request, org_id: UUID, payload: ManageResourceDto):
 
 @router.post(
     "/{org_id}/resources/provision",
-    response={200: dict, 400: ErrorMessage, 403: ErrorMessage},
+    response={202: ResourceProvisionJobOut, 403: ErrorMessage, 404: ErrorMessage, 409: ErrorMessage},
 )
 @require_org_roles(ORG_ADMIN_ROLES)
 async def provision_resource(request, org_id: UUID):
-    """Provisions organization resource."""
-    token = _get_jwt_token(request)
-    async with ResourceService(jwt_token=token) as svc:
-        try:
-            result = await svc.provision_organization_index(str(org_id))
-            return 200, result
-        except Exception as e:
-            logger.error("Failed to provision resource for org %s: %s", org_id, e)
-            return 400, {"message": "Unable to provision resource. Please try again later."}
+    """
+    Queues provisioning of the organization resource and returns the job immediately.
+    The progress can be followed with the provision job status endpoint.
+    """
+    job, error = await start_resource_provision_job(org_id, requested_by=request.auth["sub"])
+    if error:
+        return 409 if "try again" in error else 404, {"message": error}
+    return 202, job
+
+
+@router.get(
+    "/{org_id}/resources/provision/{job_id}",
+    response={200: ResourceProvisionJobOut, 403: ErrorMessage, 404: ErrorMessage},
+)
+@require_org_roles(ORG_ADMIN_ROLES)
+async def get_provision_job_status(request, org_id: UUID, job_id: UUID):
+    """Gets the status of a provisioning job."""
+    job = await get_resource_provision_job(org_id, job_id)
+    if not job:
+        return 404, {"message": "Provisioning job not found."}
+    return 200, job
 
 
 @router.get(
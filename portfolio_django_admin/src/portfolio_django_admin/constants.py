@@ -8,6 +8,36 @@ GITHUB_REPOSITORY_INFRASTRUCTURE = "ThePortfolioInfrastructure"
 GITHUB_REPOSITORY_ADMIN = "ThePortfolioAdmin"
 
 GITHUB_REPOSITORY_TOKEN = os.getenv("GITHUB_PAT", "")
+GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET", "")
 
 # Organization Service configurations
 JARVIS_GATEWAY_URL = os.getenv("JARVIS_GATEWAY_URL", "http://localhost:8001")
+JARVIS_GATEWAY_TIMEOUT_SECONDS = float(os.getenv("JARVIS_GATEWAY_TIMEOUT_SECONDS", "10"))
+JARVIS_GATEWAY_MAX_CONNECTIONS = int(os.getenv("JARVIS_GATEWAY_MAX_CONNECTIONS", "50"))
+JARVIS_GATEWAY_MAX_RETRIES = int(os.getenv("JARVIS_GATEWAY_MAX_RETRIES", "2"))
+JARVIS_GATEWAY_RETRY_BACKOFF_SECONDS = float(os.getenv("JARVIS_GATEWAY_RETRY_BACKOFF_SECONDS", "0.2"))
+JARVIS_GATEWAY_BREAKER_FAILURE_THRESHOLD = int(os.getenv("JARVIS_GATEWAY_BREAKER_FAILURE_THRESHOLD", "5"))
+JARVIS_GATEWAY_BREAKER_RESET_SECONDS = float(os.getenv("JARVIS_GATEWAY_BREAKER_RESET_SECONDS", "30"))
+JARVIS_RESOURCE_CACHE_TTL_SECONDS = float(os.getenv("JARVIS_RESOURCE_CACHE_TTL_SECONDS", "60"))
+JARVIS_PROVISION_POLL_INITIAL_SECONDS = float(os.getenv("JARVIS_PROVISION_POLL_INITIAL_SECONDS", "5"))
+JARVIS_PROVISION_POLL_MAX_SECONDS = float(os.getenv("JARVIS_PROVISION_POLL_MAX_SECONDS", "120"))
+JARVIS_PROVISION_TIMEOUT_SECONDS = float(os.getenv("JARVIS_PROVISION_TIMEOUT_SECONDS", "3600"))
+# Active jobs not updated for this long have lost their task and are failed. Must exceed the poll interval.
+JARVIS_PROVISION_STALE_SECONDS = float(os.getenv("JARVIS_PROVISION_STALE_SECONDS", "600"))
+DEVICE_REVOCATION_SYNC_SECONDS = float(os.getenv("DEVICE_REVOCATION_SYNC_SECONDS", "5"))
+DEVICE_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("DEVICE_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+DEVICE_EVENT_FLUSH_SECONDS = float(os.getenv("DEVICE_EVENT_FLUSH_SECONDS", "2"))
+DEVICE_EVENT_FLUSH_MAX_DEVICES = int(os.getenv("DEVICE_EVENT_FLUSH_MAX_DEVICES", "2000"))
+DEVICE_ONLINE_WINDOW_SECONDS = int(os.getenv("DEVICE_ONLINE_WINDOW_SECONDS", "900"))
+DEVICE_FLEET_SUMMARY_CACHE_SECONDS = float(os.getenv("DEVICE_FLEET_SUMMARY_CACHE_SECONDS", "30"))
+DEVICE_STATUS_ETAG_SECONDS = float(os.getenv("DEVICE_STATUS_ETAG_SECONDS", "30"))
+# Grace period before a deleted organization is purged. 0 purges right after deletion.
+ORGANIZATION_PURGE_DELAY_SECONDS = float(os.getenv("ORGANIZATION_PURGE_DELAY_SECONDS", "604800"))
+
+# Service catalog configurations
+SERVICE_CATALOG_CACHE_SECONDS = float(os.getenv("SERVICE_CATALOG_CACHE_SECONDS", "3600"))
+SERVICE_PAGE_CACHE_SECONDS = float(os.getenv("SERVICE_PAGE_CACHE_SECONDS", "86400"))
+SERVICE_CONTENT_RENDER_HTML = os.getenv("SERVICE_CONTENT_RENDER_HTML", "False").lower() == "true"
+SERVICE_UPLOAD_MAX_FILES = int(os.getenv("SERVICE_UPLOAD_MAX_FILES", "200"))
+SERVICE_UPLOAD_MAX_FILE_BYTES = int(os.getenv("SERVICE_UPLOAD_MAX_FILE_BYTES", "2097152"))
+SERVICE_UPLOAD_MAX_TOTAL_BYTES = int(os.getenv("SERVICE_UPLOAD_MAX_TOTAL_BYTES", "20971520"))
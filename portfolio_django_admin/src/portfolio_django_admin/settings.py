@@ -196,6 +196,12 @@ COMPRESS_CSS_FILTERS = [
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Uploads
+# Files larger than FILE_UPLOAD_MAX_MEMORY_SIZE are spooled to disk instead of memory.
+# One above the upload form's limit, so that the form reports too many files rather
+# than Django rejecting the request before the form runs.
+DATA_UPLOAD_MAX_NUMBER_FILES = constants.SERVICE_UPLOAD_MAX_FILES + 1
+
 
 # Cache
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
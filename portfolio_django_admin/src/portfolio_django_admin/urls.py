@@ -24,6 +24,7 @@ from notification.urls import router as notification_api
 from jarvis_services.urls import router as services_api
 from django.conf import settings
 from ninja import NinjaAPI, Redoc, Swagger  
+from portfolio_django_admin.renderers import ORJSONRenderer
 
 api = NinjaAPI(
     auth=[AuthBearer()], 
@@ -32,6 +33,7 @@ api = NinjaAPI(
     version="1.0.0", 
     docs=Swagger() if settings.DEBUG else Redoc(),
     urls_namespace="api",
+    renderer=ORJSONRenderer(),
 )
 
 